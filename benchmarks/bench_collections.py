@@ -0,0 +1,148 @@
+import argparse
+import json
+import time
+import tracemalloc
+from typing import Callable, Iterator
+
+import httpx
+from pydantic import TypeAdapter
+
+from framework.api.clients.json_placeholder_client import JsonPlaceholderClient
+from framework.api.models.post import Post
+from framework.api.stubs.json_placeholder_stub import JsonPlaceholderStub
+
+POSTS_ADAPTER = TypeAdapter(list[Post])
+
+
+def build_payload(size: int) -> bytes:
+    """
+    Build a posts collection of the requested size from the stub data.
+
+    Args:
+        size: Number of posts
+
+    Returns:
+        bytes: JSON array of posts
+    """
+    template = JsonPlaceholderStub().resources["posts"]
+    posts = [
+        {**template[index % len(template)], "id": index + 1} for index in range(size)
+    ]
+    return json.dumps(posts, indent=2).encode()
+
+
+class ChunkedStream(httpx.SyncByteStream):
+    """
+    Response body delivered in network-sized chunks.
+    """
+
+    def __init__(self, payload: bytes, chunk_size: int = 65536) -> None:
+        self.payload = payload
+        self.chunk_size = chunk_size
+
+    def __iter__(self) -> Iterator[bytes]:
+        for start in range(0, len(self.payload), self.chunk_size):
+            yield self.payload[start : start + self.chunk_size]
+
+
+def payload_transport(payload: bytes) -> httpx.MockTransport:
+    """
+    Create a transport that answers every request with the same payload, so
+    only the client side is measured.
+
+    Args:
+        payload: Response body
+
+    Returns:
+        httpx.MockTransport: Transport to pass to the client
+    """
+    return httpx.MockTransport(
+        lambda request: httpx.Response(
+            200,
+            stream=ChunkedStream(payload),
+            headers={"Content-Type": "application/json; charset=utf-8"},
+        )
+    )
+
+
+def buffered_dicts(client: JsonPlaceholderClient) -> int:
+    """Decode the whole body, then validate every dict."""
+    return len([Post.model_validate(item) for item in client.get("/posts").json()])
+
+
+def buffered_adapter(client: JsonPlaceholderClient) -> int:
+    """Validate the whole body at once with TypeAdapter(list[Post])."""
+    return len(POSTS_ADAPTER.validate_json(client.get("/posts").content))
+
+
+def streamed(client: JsonPlaceholderClient) -> int:
+    """Stream the body and validate the items as they arrive."""
+    return len(client.list_posts().items)
+
+
+def measure(
+    variant: Callable[[JsonPlaceholderClient], int], client, repeat: int
+) -> float:
+    """
+    Measure the best throughput of a variant.
+
+    Args:
+        variant: Function retrieving and validating the collection
+        client: Client connected to the stub
+        repeat: Number of runs
+
+    Returns:
+        float: Items validated per second in the fastest run
+    """
+    best = 0.0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        count = variant(client)
+        best = max(best, count / (time.perf_counter() - start))
+    return best
+
+
+def peak_memory(variant: Callable[[JsonPlaceholderClient], int], client) -> float:
+    """
+    Measure the peak memory allocated while running a variant once.
+
+    Args:
+        variant: Function retrieving and validating the collection
+        client: Client connected to the stub
+
+    Returns:
+        float: Peak traced memory in MiB
+    """
+    tracemalloc.start()
+    try:
+        variant(client)
+        return tracemalloc.get_traced_memory()[1] / 1024 / 1024
+    finally:
+        tracemalloc.stop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Compare collection validation throughput in items per second"
+    )
+    parser.add_argument("--size", type=int, default=100000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    payload = build_payload(args.size)
+    print(f"payload: {args.size} posts, {len(payload) / 1024 / 1024:.1f} MiB")
+    with JsonPlaceholderClient(transport=payload_transport(payload)) as client:
+        print(f"{'variant':>18} {'items/s':>12} {'peak MiB':>10}")
+        for name, variant in (
+            ("buffered dicts", buffered_dicts),
+            ("buffered adapter", buffered_adapter),
+            ("streamed", streamed),
+        ):
+            print(
+                f"{name:>18} {measure(variant, client, args.repeat):>12.0f} "
+                f"{peak_memory(variant, client):>10.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
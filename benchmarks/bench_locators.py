@@ -0,0 +1,260 @@
+import argparse
+import json
+import statistics
+import time
+import timeit
+
+from selenium.webdriver.common.by import By
+
+from framework.ui.drivers.chrome import create_chrome_driver
+from framework.ui.locators.cart_page_locators import CartPageLocators
+from framework.ui.locators.cheackout_step_two_page_locators import (
+    CheckoutStepTwoPageLocator,
+)
+from framework.ui.locators.checkout_complete_page_locators import (
+    CheckoutCompletePageLocators,
+)
+from framework.ui.locators.checkout_step_one_page_locators import (
+    CheckoutStepOnePageLocator,
+)
+from framework.ui.locators.inventory_page_locators import InventoryPageLocator
+from framework.ui.locators.login_page_locators import LoginPageLocators
+from framework.ui.locators.registry import static_locators
+from framework.ui.stubs.server import SiteServer
+
+# Pages the locators are resolved against, relative to the site URL
+PAGE_PATHS = {
+    "login": "",
+    "inventory": "inventory.html",
+    "cart": "cart.html",
+    "checkout-step-one": "checkout-step-one.html",
+    "checkout-step-two": "checkout-step-two.html",
+    "checkout-complete": "checkout-complete.html",
+}
+# Cart of the session, so the cart and overview list enough items for INDEX
+CART_ITEMS = [4, 0, 1, 5]
+
+LOCATOR_CLASSES = {
+    "login": LoginPageLocators,
+    "inventory": InventoryPageLocator,
+    "cart": CartPageLocators,
+    "checkout-step-one": CheckoutStepOnePageLocator,
+    "checkout-step-two": CheckoutStepTwoPageLocator,
+    "checkout-complete": CheckoutCompletePageLocators,
+}
+
+# Parameterised locators with the index they are benchmarked with
+INDEXED_LOCATORS = {
+    "inventory": (
+        "add_to_card_button",
+        "item_name_text",
+        "item_description_text",
+        "item_price_text",
+    ),
+    "cart": ("remove_button", "item_price_text"),
+}
+INDEX = 3
+
+# The XPath locators the classes used before, built per call
+LEGACY_FACTORIES = {
+    "inventory": {
+        "add_to_card_button": lambda index: (
+            By.XPATH,
+            f'(//button[@class="btn btn_primary btn_small btn_inventory "])[{index}]',
+        ),
+        "item_name_text": lambda index: (
+            By.XPATH,
+            f'(//div[@class="inventory_item_name"])[{index}]',
+        ),
+        "item_description_text": lambda index: (
+            By.XPATH,
+            f'(//div[@class="inventory_item_desc"])[{index}]',
+        ),
+        "item_price_text": lambda index: (
+            By.XPATH,
+            f'(//div[@class="inventory_item"])[{index}]',
+        ),
+    },
+    "cart": {
+        "remove_button": lambda index: (
+            By.XPATH,
+            f'(//button[@class="btn btn_secondary btn_small cart_button"])[{index}]',
+        ),
+        "item_price_text": lambda index: (
+            By.XPATH,
+            f'(//div[@class="inventory_item_price"])[{index}]',
+        ),
+    },
+}
+LEGACY_CONSTANTS = {
+    "login": {
+        "LOGO_TITLE": '//div[@class="login_logo"]',
+        "USERNAME_INPUT": '//*[@id="user-name"]',
+        "PASSWORD_INPUT": '//*[@id="password"]',
+        "LOGIN_BUTTON": '//*[@id="login-button"]',
+        "USERNAMES_TEXT": '//*[@id="login_credentials"]',
+        "PASSWORD_TEXT": '//*[@class="login_password"]',
+    },
+    "inventory": {
+        "LOGO_TITLE": '//*[@class="app_logo"]',
+        "CART_BUTTON": '//*[@id="shopping_cart_container"]',
+    },
+    "cart": {"CHECKOUT_BUTTON": '//*[@id="checkout"]'},
+    "checkout-step-one": {
+        "FIRSTNAME_INPUT": '//*[@id="first-name"]',
+        "LASTNAME_INPUT": '//*[@id="last-name"]',
+        "POSTAL_CODE_INPUT": '//*[@id="postal-code"]',
+        "CONTINUE_BUTTON": '//*[@id="continue"]',
+    },
+    "checkout-step-two": {
+        "ITEM_TOTAL_TEXT": '//*[@class="summary_subtotal_label"]',
+        "TAX_TEXT": '//*[@class="summary_tax_label"]',
+        "TOTAL_TEXT": '//*[@class="summary_total_label"]',
+        "FINISH_BUTTON": '//*[@id="finish"]',
+    },
+    "checkout-complete": {
+        "TITLE_TEXT": '//*[@class="title"]',
+        "COMPLETE_HEADER_TEXT": '//*[@class="complete-header"]',
+        "COMPLETE_TEXT": '//*[@class="complete-text"]',
+        "COMPLETE_IMAGE": '//*[@class="pony_express"]',
+    },
+}
+
+# Resolves a locator arguments[2] times in the page and returns the mean in µs,
+# without the WebDriver round trip
+RESOLVE_SCRIPT = """
+const [using, value, repeat] = arguments;
+const resolve = {
+    "xpath": () => document.evaluate(
+        value, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null
+    ).singleNodeValue,
+    "css selector": () => document.querySelector(value),
+    "id": () => document.getElementById(value),
+}[using];
+if (resolve() === null) return -1;
+const start = performance.now();
+for (let i = 0; i < repeat; i++) resolve();
+return (performance.now() - start) * 1000 / repeat;
+"""
+
+
+def cases() -> list[tuple[str, str, tuple[str, str], tuple[str, str]]]:
+    """
+    List every locator with its legacy XPath counterpart.
+
+    Returns:
+        list: (page, name, legacy locator, current locator) tuples
+    """
+    result = []
+    for page, locators in LOCATOR_CLASSES.items():
+        for name, locator in static_locators(locators).items():
+            legacy = (By.XPATH, LEGACY_CONSTANTS[page][name])
+            result.append((page, name, legacy, locator))
+        for name in INDEXED_LOCATORS.get(page, ()):
+            legacy = LEGACY_FACTORIES[page][name](INDEX)
+            result.append(
+                (page, f"{name}({INDEX})", legacy, getattr(locators, name)(INDEX))
+            )
+    return result
+
+
+def build_cost(number: int) -> tuple[float, float]:
+    """
+    Time building a parameterised locator per call and through the cache.
+
+    Returns:
+        tuple[float, float]: Legacy and cached cost per call in nanoseconds
+    """
+    legacy = LEGACY_FACTORIES["inventory"]["add_to_card_button"]
+    cached = InventoryPageLocator.add_to_card_button
+    legacy_s = timeit.timeit(lambda: legacy(INDEX), number=number)
+    cached_s = timeit.timeit(lambda: cached(INDEX), number=number)
+    return legacy_s / number * 1e9, cached_s / number * 1e9
+
+
+def start_session(driver, url: str) -> None:
+    """
+    Log in and fill the cart the way the site stores them, so every page can
+    be opened directly.
+
+    Args:
+        driver: WebDriver instance
+        url: Base URL of the site
+    """
+    driver.get(url)
+    driver.add_cookie({"name": "session-username", "value": "standard_user"})
+    driver.execute_script(
+        "localStorage.setItem('cart-contents', arguments[0]);", json.dumps(CART_ITEMS)
+    )
+
+
+def round_trip(driver, locator: tuple[str, str], repeat: int) -> float:
+    """
+    Time driver.find_element for a locator.
+
+    Returns:
+        float: Mean duration in milliseconds
+    """
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        driver.find_element(*locator)
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.mean(samples)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Resolution time of the legacy XPath and the current locators"
+    )
+    parser.add_argument("--repeat", type=int, default=20, help="find_element calls")
+    parser.add_argument(
+        "--resolve-repeat", type=int, default=2000, help="in-page resolutions"
+    )
+    parser.add_argument(
+        "--url", help="base URL of the site (serves the saucedemo replica if unset)"
+    )
+    args = parser.parse_args()
+
+    legacy_ns, cached_ns = build_cost(100_000)
+    print(
+        f"Building an indexed locator: {legacy_ns:.0f}ns per call, {cached_ns:.0f}ns cached"
+    )
+
+    server = None if args.url else SiteServer().start()
+    url = args.url or server.url
+    driver = create_chrome_driver()
+    try:
+        start_session(driver, url)
+        print(
+            f"{'page':<18} {'locator':<26} {'legacy µs':>10} {'current µs':>11} "
+            f"{'legacy ms':>10} {'current ms':>11}"
+        )
+        loaded = None
+        for page, name, legacy, current in cases():
+            if page != loaded:
+                driver.get(url + PAGE_PATHS[page])
+                loaded = page
+            in_page = [
+                driver.execute_script(RESOLVE_SCRIPT, *locator, args.resolve_repeat)
+                for locator in (legacy, current)
+            ]
+            if min(in_page) < 0:
+                print(f"{page:<18} {name:<26} not found")
+                continue
+            trips = [
+                round_trip(driver, locator, args.repeat)
+                for locator in (legacy, current)
+            ]
+            print(
+                f"{page:<18} {name:<26} {in_page[0]:>10.2f} {in_page[1]:>11.2f} "
+                f"{trips[0]:>10.2f} {trips[1]:>11.2f}"
+            )
+    finally:
+        driver.quit()
+        if server is not None:
+            server.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,175 @@
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable
+
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from framework.ui.drivers.chrome import (
+    configure_window,
+    create_chrome_driver,
+    profile_template,
+)
+from framework.ui.drivers.driver_pool import DriverPool
+from framework.ui.drivers.tabs import TabBrowser
+from framework.ui.pages.inventory_page import InventoryPage
+from framework.ui.pages.login_page import LoginPage
+from framework.ui.stubs.server import SiteServer
+
+PROC = Path("/proc")
+
+
+def process_tree(root: int) -> list[int]:
+    """
+    Get a process and all its descendants.
+
+    Returns:
+        list[int]: Process ids, root first
+    """
+    children: dict[int, list[int]] = {}
+    for stat in PROC.glob("[0-9]*/stat"):
+        try:
+            # The command name in parentheses may contain spaces
+            fields = stat.read_text().rsplit(")", 1)[1].split()
+        except (OSError, IndexError):
+            continue
+        children.setdefault(int(fields[1]), []).append(int(stat.parent.name))
+    pids, pending = [], [root]
+    while pending:
+        pid = pending.pop()
+        pids.append(pid)
+        pending.extend(children.get(pid, []))
+    return pids
+
+
+def memory_mb(pid: int) -> float:
+    """
+    Get the proportional set size of a process, or its resident set size if
+    the kernel does not report one.
+
+    Pages shared between processes, e.g. the Chrome binary, are split among
+    them, so the sizes of several processes add up to what they use together.
+
+    Returns:
+        float: Megabytes, 0 if the process is gone
+    """
+    for name, key in (("smaps_rollup", "Pss:"), ("status", "VmRSS:")):
+        try:
+            lines = (PROC / str(pid) / name).read_text().splitlines()
+        except OSError:
+            continue
+        for line in lines:
+            if line.startswith(key):
+                return int(line.split()[1]) / 1024
+    return 0.0
+
+
+def browsers_memory_mb(drivers: list[WebDriver]) -> float:
+    """Memory used by the chromedriver processes of drivers and their browsers."""
+    return sum(
+        memory_mb(pid)
+        for driver in drivers
+        for pid in process_tree(driver.service.process.pid)
+    )
+
+
+def run_test(driver: WebDriver, url: str) -> None:
+    """Log in through the form and read the inventory, like a typical UI test."""
+    login_page = LoginPage(driver=driver, url=url)
+    login_page.open()
+    username, password = login_page.get_credentials()
+    login_page.input_username(username=username)
+    login_page.input_password(password=password)
+    login_page.click_login_button()
+    InventoryPage(driver=driver).get_item_price_text()
+
+
+def run_concurrently(tests: int, test: Callable[[int], object]) -> list:
+    """Run tests in threads of their own and return their results."""
+    with ThreadPoolExecutor(max_workers=tests) as executor:
+        return list(executor.map(test, range(tests)))
+
+
+def browser_per_test(tests: int, url: str) -> tuple[int, float]:
+    drivers = run_concurrently(tests, lambda _: create_chrome_driver())
+    try:
+        run_concurrently(tests, lambda i: run_test(drivers[i], url))
+        return len(drivers), browsers_memory_mb(drivers)
+    finally:
+        for driver in drivers:
+            driver.quit()
+
+
+def pooled_browsers(tests: int, url: str, rounds: int) -> tuple[int, float]:
+    pool = DriverPool(factory=create_chrome_driver, max_idle=tests)
+    try:
+        for _ in range(rounds):
+            drivers = run_concurrently(tests, lambda _: pool.acquire())
+            run_concurrently(tests, lambda i: run_test(drivers[i], url))
+            memory = browsers_memory_mb(drivers)
+            for driver in drivers:
+                pool.release(driver)
+        return pool.stats.misses, memory
+    finally:
+        pool.close()
+
+
+def tabs_in_one_browser(tests: int, url: str) -> tuple[int, float]:
+    browser = TabBrowser(factory=create_chrome_driver, setup_tab=configure_window)
+
+    def test(_: int):
+        tab = browser.open_tab()
+        run_test(browser.driver, url)
+        return tab
+
+    try:
+        tabs = run_concurrently(tests, test)
+        memory = browsers_memory_mb([browser.driver])
+        for tab in tabs:
+            browser.close_tab(tab)
+        if not browser.contexts_supported:
+            print("(browser contexts unavailable, tabs share cookies and storage)")
+        return 1, memory
+    finally:
+        browser.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Memory per concurrently running UI test: a browser per test, "
+        "pooled browsers and tabs in one browser"
+    )
+    parser.add_argument("--tests", type=int, default=4, help="concurrent tests")
+    parser.add_argument(
+        "--rounds", type=int, default=3, help="tests run by every pooled browser"
+    )
+    parser.add_argument(
+        "--url", help="base URL of the site (serves the saucedemo replica if unset)"
+    )
+    args = parser.parse_args()
+
+    server = None if args.url else SiteServer().start()
+    url = args.url or server.url
+    setups = {
+        "browser per test": lambda: browser_per_test(args.tests, url),
+        f"pooled browsers, {args.rounds} rounds": lambda: pooled_browsers(
+            args.tests, url, args.rounds
+        ),
+        "tabs in one browser": lambda: tabs_in_one_browser(args.tests, url),
+    }
+    print(f"{'setup':<32} {'browsers':>8} {'tests':>6} {'total MB':>9} {'MB/test':>8}")
+    try:
+        for name, setup in setups.items():
+            browsers, memory = setup()
+            print(
+                f"{name:<32} {browsers:>8} {args.tests:>6} {memory:>9.0f} "
+                f"{memory / args.tests:>8.0f}"
+            )
+    finally:
+        profile_template.cleanup()
+        if server is not None:
+            server.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+import argparse
+import json
+import statistics
+import timeit
+
+from framework.api.models.post import Post
+from framework.api.stubs.json_placeholder_stub import JsonPlaceholderStub
+
+
+def legacy_parse(content: bytes) -> Post:
+    """
+    Parse a post the way the suite did before: the test and the Allure
+    logging each decoded the body, and the model walked the resulting dict.
+    """
+    data = json.loads(content)
+    str(json.loads(content))
+    return Post.model_validate(data)
+
+
+def parse_once(content: bytes) -> Post:
+    """Parse and validate a post straight from the raw bytes."""
+    return Post.model_validate_json(content)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Compare parse and validate cost per Post response"
+    )
+    parser.add_argument("--number", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    stub = JsonPlaceholderStub()
+    content = json.dumps(stub.resources["posts"][0], indent=2).encode()
+
+    print(f"{'variant':>12} {'mean us':>10} {'best us':>10}")
+    for name, parse in (("legacy", legacy_parse), ("parse-once", parse_once)):
+        runs = timeit.repeat(
+            lambda: parse(content), number=args.number, repeat=args.repeat
+        )
+        per_call = [run / args.number * 1_000_000 for run in runs]
+        print(f"{name:>12} {statistics.mean(per_call):>10.2f} {min(per_call):>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+import argparse
+import statistics
+import time
+from urllib.parse import quote
+
+from selenium.webdriver.common.by import By
+
+from framework.ui.drivers.chrome import create_chrome_driver
+from framework.ui.pages.base_page import BasePage
+
+TALL_PAGE = "data:text/html," + quote("""
+<html><body style="margin:0">
+<div style="height:5000px"></div>
+<button id="target" onclick="this.dataset.clicked = 'yes'">Target</button>
+<div id="overlay" style="position:fixed;inset:0;background:rgba(0,0,0,.3)"></div>
+</body></html>
+""")
+
+TARGET = (By.ID, "target")
+
+REMOVE_OVERLAY_SCRIPT = """
+setTimeout(() => document.getElementById("overlay").remove(), arguments[0]);
+"""
+
+HIDE_OVERLAY_SCRIPT = 'document.getElementById("overlay").style.display = "none";'
+
+
+def legacy_scroll(page: BasePage) -> None:
+    """Scroll the way BasePage did before: scrollIntoView and a fixed pause."""
+    element = page.find_element(TARGET)
+    page.driver.execute_script("arguments[0].scrollIntoView(true);", element)
+    time.sleep(0.5)
+
+
+def legacy_click(page: BasePage) -> None:
+    """Click the way BasePage did before: sleep polling_interval between retries."""
+    for _ in range(page.max_retry_attempts):
+        try:
+            page.wait_for_element_clickable(TARGET).click()
+            return
+        except Exception:
+            time.sleep(page.polling_interval)
+
+
+def timed(action, page: BasePage, setup) -> float:
+    """
+    Time a single action after preparing a fresh page.
+
+    Returns:
+        float: Duration in milliseconds
+    """
+    page.driver.get(TALL_PAGE)
+    setup(page)
+    start = time.perf_counter()
+    action(page)
+    return (time.perf_counter() - start) * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Latency of scroll_to_element and intercepted click retries"
+    )
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--overlay-ms", type=int, default=50)
+    args = parser.parse_args()
+
+    def hide_overlay(page):
+        page.driver.execute_script(HIDE_OVERLAY_SCRIPT)
+
+    def remove_overlay_later(page):
+        page.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+        page.driver.execute_script(REMOVE_OVERLAY_SCRIPT, args.overlay_ms)
+
+    cases = {
+        "scroll legacy": (legacy_scroll, hide_overlay),
+        "scroll settle": (lambda page: page.scroll_to_element(TARGET), hide_overlay),
+        "click legacy": (legacy_click, remove_overlay_later),
+        "click uncovered": (
+            lambda page: page.click_element(TARGET),
+            remove_overlay_later,
+        ),
+    }
+
+    driver = create_chrome_driver()
+    try:
+        page = BasePage(driver)
+        print(f"{'case':>16} {'mean ms':>10} {'min ms':>10}")
+        for name, (action, setup) in cases.items():
+            samples = [timed(action, page, setup) for _ in range(args.repeat)]
+            print(f"{name:>16} {statistics.mean(samples):>10.1f} {min(samples):>10.1f}")
+    finally:
+        driver.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,203 @@
+import argparse
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Callable
+
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+
+from framework.ui.drivers.chrome import build_chrome_options, profile_template
+from framework.ui.drivers.profile import STARTUP_FLAGS
+
+DROP_CACHES = Path("/proc/sys/vm/drop_caches")
+
+
+def launch(build: Callable[[], Options]) -> tuple[float, float, Options]:
+    """
+    Build the options, launch Chrome, open a blank page and quit.
+
+    Building counts as part of the launch, so work done for every browser,
+    e.g. copying the profile template, is not left out of the comparison.
+
+    Args:
+        build: Builds the options of the launch
+
+    Returns:
+        tuple[float, float, Options]: Seconds until the driver was ready and
+        until the first page was loaded, and the options used
+    """
+    start = time.perf_counter()
+    options = build()
+    driver = webdriver.Chrome(options=options)
+    ready = time.perf_counter() - start
+    try:
+        driver.get("about:blank")
+        first_page = time.perf_counter() - start
+    finally:
+        driver.quit()
+    return ready, first_page, options
+
+
+def remove_user_data_dir(options: Options) -> None:
+    for argument in options.arguments:
+        if argument.startswith("--user-data-dir="):
+            shutil.rmtree(argument.split("=", 1)[1], ignore_errors=True)
+
+
+def setups(per_flag: bool) -> dict[str, Callable[[], Options]]:
+    """
+    Get the launch configurations to compare.
+
+    The template setups copy the suite's profile template, warmed up with the
+    options the suite uses.
+
+    Args:
+        per_flag: Also add every startup flag on its own
+
+    Returns:
+        dict: Options builders by setup name
+    """
+
+    def baseline() -> Options:
+        return build_chrome_options(startup_flags=False)
+
+    def flags() -> Options:
+        return build_chrome_options(startup_flags=True)
+
+    def template_copy(build: Callable[[], Options]) -> Callable[[], Options]:
+        def copy() -> Options:
+            options = build()
+            options.add_argument(f"--user-data-dir={profile_template.clone()}")
+            return options
+
+        return copy
+
+    def single(flag: str) -> Callable[[], Options]:
+        def build() -> Options:
+            options = baseline()
+            options.add_argument(flag)
+            return options
+
+        return build
+
+    result = {
+        "new profile": baseline,
+        "new profile, startup flags": flags,
+        "template copy": template_copy(baseline),
+        "template copy, startup flags": template_copy(flags),
+    }
+    if per_flag:
+        result.update({f"new profile, {flag}": single(flag) for flag in STARTUP_FLAGS})
+    return result
+
+
+def drop_caches() -> None:
+    """Drop the OS page cache, so the next launch reads Chrome from disk."""
+    os.sync()
+    DROP_CACHES.write_text("3\n")
+
+
+def cold_launch(name: str, template: Path, per_flag: bool, drop: bool) -> list[float]:
+    """
+    Launch a setup once in a new Python process, without the chromedriver
+    and selenium state of earlier launches.
+
+    Args:
+        name: Setup name, a key of setups()
+        template: Prepared profile template the copies are made from
+        per_flag: Whether the setups include the single flags
+        drop: Drop the page cache before the launch
+
+    Returns:
+        list[float]: Seconds until the driver was ready and until the first
+        page was loaded
+    """
+    if drop:
+        drop_caches()
+    command = [
+        sys.executable,
+        "-m",
+        "benchmarks.bench_startup",
+        "--launch-once",
+        name,
+        "--template",
+        str(template),
+    ]
+    if per_flag:
+        command.append("--per-flag")
+    output = subprocess.run(command, check=True, capture_output=True, text=True)
+    return json.loads(output.stdout.splitlines()[-1])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Chrome launch time with startup flags and a profile template"
+    )
+    parser.add_argument("--repeat", type=int, default=5, help="warm launches per setup")
+    parser.add_argument(
+        "--per-flag", action="store_true", help="also measure every flag on its own"
+    )
+    parser.add_argument(
+        "--drop-caches",
+        action="store_true",
+        help=f"drop the page cache before every first launch (needs write access to "
+        f"{DROP_CACHES})",
+    )
+    parser.add_argument("--launch-once", help=argparse.SUPPRESS)
+    parser.add_argument("--template", type=Path, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    builds = setups(args.per_flag)
+    if args.launch_once:
+        # Child process of cold_launch(): reuse the parent's template
+        profile_template.path = args.template
+        ready, first_page, options = launch(builds[args.launch_once])
+        remove_user_data_dir(options)
+        print(json.dumps([ready, first_page]))
+        return
+    if args.drop_caches and not os.access(DROP_CACHES, os.W_OK):
+        parser.error(f"--drop-caches needs write access to {DROP_CACHES}")
+
+    start = time.perf_counter()
+    template = profile_template.prepare()
+    print(f"(template prepared in {(time.perf_counter() - start) * 1000:.0f}ms)")
+    if not args.drop_caches:
+        print("(page cache not dropped, first launches find Chrome in memory)")
+    try:
+        first = {
+            name: cold_launch(name, template, args.per_flag, args.drop_caches)
+            for name in builds
+        }
+        # Rounds go through every setup, so no setup profits from running
+        # after the others warmed up the machine
+        warm: dict[str, list[tuple[float, float]]] = {name: [] for name in builds}
+        for _ in range(args.repeat):
+            for name, build in builds.items():
+                ready, first_page, options = launch(build)
+                remove_user_data_dir(options)
+                warm[name].append((ready, first_page))
+    finally:
+        profile_template.cleanup()
+
+    print(
+        f"{'setup':<44} {'first ms':>9} {'+page ms':>9} {'warm ms':>9} {'+page ms':>9}"
+    )
+    for name in builds:
+        cold_ready, cold_page = first[name]
+        samples = warm[name] or [(cold_ready, cold_page)]
+        warm_ready = statistics.mean(ready for ready, _ in samples)
+        warm_page = statistics.mean(page for _, page in samples)
+        print(
+            f"{name:<44} {cold_ready * 1000:9.0f} {cold_page * 1000:9.0f} "
+            f"{warm_ready * 1000:9.0f} {warm_page * 1000:9.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+import argparse
+import statistics
+import time
+
+from selenium.webdriver.common.by import By
+
+from framework.ui.drivers.chrome import create_chrome_driver
+from framework.ui.pages.base_page import BasePage
+from framework.ui.waits import MUTATION, POLLING
+
+BLANK_PAGE = "data:text/html,<html><body></body></html>"
+
+SCHEDULE_ELEMENT_SCRIPT = """
+setTimeout(() => {
+    const el = document.createElement("div");
+    el.id = "late";
+    el.textContent = "ready";
+    document.body.appendChild(el);
+}, arguments[0]);
+"""
+
+LATE_ELEMENT = (By.ID, "late")
+
+
+def measure(page: BasePage, delay_ms: int) -> float:
+    """
+    Measure how long find_element takes for an element added after a delay.
+
+    Args:
+        page: Page object configured with the wait strategy to measure
+        delay_ms: Delay in milliseconds before the element is added
+
+    Returns:
+        float: Time-to-ready in milliseconds
+    """
+    page.driver.get(BLANK_PAGE)
+    page.driver.execute_script(SCHEDULE_ELEMENT_SCRIPT, delay_ms)
+    start = time.perf_counter()
+    page.find_element(LATE_ELEMENT)
+    return (time.perf_counter() - start) * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Compare time-to-ready of polling and MutationObserver waits"
+    )
+    parser.add_argument("--delays", type=int, nargs="+", default=[20, 100, 300])
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    driver = create_chrome_driver()
+    try:
+        pages = {
+            strategy: BasePage(driver, wait_strategy=strategy)
+            for strategy in (POLLING, MUTATION)
+        }
+        print(f"{'delay':>8} {'strategy':>10} {'mean ms':>10} {'p95 ms':>10}")
+        for delay_ms in args.delays:
+            for strategy, page in pages.items():
+                samples = sorted(measure(page, delay_ms) for _ in range(args.repeat))
+                p95 = samples[min(len(samples) - 1, int(len(samples) * 0.95))]
+                print(
+                    f"{delay_ms:>8} {strategy:>10} "
+                    f"{statistics.mean(samples):>10.1f} {p95:>10.1f}"
+                )
+    finally:
+        driver.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+import hashlib
+import time
+import uuid
+from pathlib import Path
+
+from allure_commons.logger import AllureFileLogger
+from allure_commons.model2 import (
+    ATTACHMENT_PATTERN,
+    Attachment,
+    Label,
+    Status,
+    StatusDetails,
+    TestResult,
+)
+from allure_commons.types import AttachmentType, LabelType
+
+
+def write_session_result(
+    report_dir: str | Path,
+    name: str,
+    description: str,
+    attachments: list[tuple[str, str, AttachmentType]],
+    violations: list[str],
+    parent_suite: str,
+    feature: str,
+) -> None:
+    """
+    Add a result for a check of the whole session to an Allure results directory.
+
+    Args:
+        report_dir: Allure results directory
+        name: Result name
+        description: Result description
+        attachments: (name, body, type) of the files to attach
+        violations: Reasons the check failed, empty if it passed
+        parent_suite: Parent suite label, e.g. "API Tests"
+        feature: Feature label
+    """
+    file_logger = AllureFileLogger(report_dir)
+    attached = []
+    for attachment_name, body, attachment_type in attachments:
+        file_name = ATTACHMENT_PATTERN.format(
+            prefix=uuid.uuid4(), ext=attachment_type.extension
+        )
+        file_logger.report_attached_data(body, file_name)
+        attached.append(
+            Attachment(
+                name=attachment_name, source=file_name, type=attachment_type.mime_type
+            )
+        )
+
+    now = int(time.time() * 1000)
+    file_logger.report_result(
+        TestResult(
+            uuid=str(uuid.uuid4()),
+            historyId=hashlib.md5(name.encode()).hexdigest(),
+            name=name,
+            fullName=name,
+            description=description,
+            status=Status.FAILED if violations else Status.PASSED,
+            statusDetails=(
+                StatusDetails(message="\n".join(violations)) if violations else None
+            ),
+            attachments=attached,
+            labels=[
+                Label(name=LabelType.PARENT_SUITE, value=parent_suite),
+                Label(name=LabelType.SUITE, value="Performance"),
+                Label(name=LabelType.FEATURE, value=feature),
+            ],
+            start=now,
+            stop=now,
+        )
+    )
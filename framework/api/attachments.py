@@ -0,0 +1,249 @@
+import json
+import threading
+from collections import deque
+from typing import Any, NamedTuple, Union
+
+import allure
+import httpx
+from allure_commons.types import AttachmentType
+
+from framework import config
+
+# Key in response.extensions holding the model parsed from the body
+MODEL_EXTENSION = "model"
+
+OFF = "off"
+ON_FAILURE = "on-failure"
+ALWAYS = "always"
+ATTACHMENT_LEVELS = (OFF, ON_FAILURE, ALWAYS)
+
+# Exchanges kept per test; the oldest are dropped first since the last calls
+# before a failure are the interesting ones
+MAX_EXCHANGES = 50
+
+
+class Exchange(NamedTuple):
+    """
+    A request and its response, kept as-is until the attachments are needed.
+    """
+
+    method: str
+    url: Union[str, httpx.URL]
+    params: Any
+    json: Any
+    headers: Any
+    response: httpx.Response
+
+
+def truncate(text: str, max_bytes: int) -> tuple[str, bool]:
+    """
+    Cut text down to a size limit.
+
+    Args:
+        text: Text to cut
+        max_bytes: Maximum size in UTF-8 bytes (no limit if 0)
+
+    Returns:
+        tuple[str, bool]: The text, possibly cut, and whether it was cut
+    """
+    encoded = text.encode()
+    if not max_bytes or len(encoded) <= max_bytes:
+        return text, False
+    omitted = len(encoded) - max_bytes
+    head = encoded[:max_bytes].decode(errors="ignore")
+    return f"{head}\n... truncated {omitted} bytes", True
+
+
+class AttachmentRecorder:
+    """
+    Collects HTTP exchanges during a test and turns them into Allure
+    attachments once the outcome of the test is known.
+
+    Recording only keeps references to the request arguments and the response,
+    so nothing is parsed, serialised or written while the test runs.
+    """
+
+    def __init__(
+        self,
+        level: str = ON_FAILURE,
+        max_body_bytes: int = 16384,
+        sample_rate: float = 1.0,
+        max_exchanges: int = MAX_EXCHANGES,
+    ) -> None:
+        """
+        Initialize the recorder.
+
+        Args:
+            level: "off", "on-failure" or "always"
+            max_body_bytes: Size limit for attached bodies (no limit if 0)
+            sample_rate: Share of successful exchanges to keep, from 0 to 1.
+                Error responses are always kept.
+            max_exchanges: Maximum number of exchanges kept per test
+
+        Raises:
+            ValueError: If the level is unknown or sample_rate is out of range
+        """
+        if level not in ATTACHMENT_LEVELS:
+            raise ValueError(
+                f"Unknown attachment level {level!r}, expected one of {ATTACHMENT_LEVELS}"
+            )
+        if not 0.0 <= sample_rate <= 1.0:
+            raise ValueError("sample_rate must be between 0 and 1")
+        self.level = level
+        self.max_body_bytes = max_body_bytes
+        self.sample_rate = sample_rate
+        self.exchanges: deque[Exchange] = deque(maxlen=max_exchanges)
+        self.seen = 0
+        self.dropped = 0
+        self._sampled = 0.0
+        self._lock = threading.Lock()
+
+    def record(
+        self,
+        method: str,
+        url: Union[str, httpx.URL],
+        response: httpx.Response,
+        **kwargs,
+    ) -> None:
+        """
+        Keep an exchange for the current test.
+
+        Args:
+            method: HTTP method
+            url: Requested URL
+            response: Received response
+            **kwargs: Arguments passed to the request
+        """
+        if self.level == OFF:
+            return
+        with self._lock:
+            self.seen += 1
+            if not response.is_error and not self._sample():
+                return
+            if len(self.exchanges) == self.exchanges.maxlen:
+                self.dropped += 1
+            self.exchanges.append(
+                Exchange(
+                    method,
+                    url,
+                    kwargs.get("params"),
+                    kwargs.get("json"),
+                    kwargs.get("headers"),
+                    response,
+                )
+            )
+
+    def _sample(self) -> bool:
+        # Spread the kept exchanges evenly instead of picking them at random,
+        # so reruns attach the same calls
+        self._sampled += self.sample_rate
+        if self._sampled >= 1.0:
+            self._sampled -= 1.0
+            return True
+        return False
+
+    def flush(self, failed: bool) -> int:
+        """
+        Attach the recorded exchanges to the Allure report and start over.
+
+        Args:
+            failed: Whether the test failed
+
+        Returns:
+            int: Number of exchanges attached
+        """
+        with self._lock:
+            exchanges = list(self.exchanges)
+            seen, dropped = self.seen, self.dropped
+            self.clear()
+
+        if self.level == OFF or (self.level == ON_FAILURE and not failed):
+            return 0
+        for number, exchange in enumerate(exchanges, start=1):
+            self._attach(f"#{number} {exchange.method} {exchange.url}", exchange)
+        if len(exchanges) < seen:
+            allure.attach(
+                f"HTTP calls: {seen}\n"
+                f"Attached: {len(exchanges)}\n"
+                f"Skipped by sampling: {seen - len(exchanges) - dropped}\n"
+                f"Dropped (over {self.exchanges.maxlen} per test): {dropped}",
+                name="HTTP calls summary",
+                attachment_type=allure.attachment_type.TEXT,
+            )
+        return len(exchanges)
+
+    def clear(self) -> None:
+        """
+        Forget the recorded exchanges.
+        """
+        self.exchanges.clear()
+        self.seen = 0
+        self.dropped = 0
+        self._sampled = 0.0
+
+    def _attach(self, title: str, exchange: Exchange) -> None:
+        response = exchange.response
+        request_json = (
+            "" if exchange.json is None else json.dumps(exchange.json, default=str)
+        )
+        request_json, _ = truncate(request_json, self.max_body_bytes)
+        allure.attach(
+            f"URL: {exchange.url}\n"
+            f"Method: {exchange.method}\n"
+            f"Params: {exchange.params}\n"
+            f"JSON: {request_json or None}\n"
+            f"Headers: {exchange.headers}",
+            name=f"{title} Request",
+            attachment_type=allure.attachment_type.TEXT,
+        )
+        allure.attach(
+            f"Status Code: {response.status_code}\n"
+            f"Response Time: {response.elapsed.total_seconds()}s",
+            name=f"{title} Response Info",
+            attachment_type=allure.attachment_type.TEXT,
+        )
+
+        body, name, attachment_type = self.body_attachment(response)
+        allure.attach(body, name=f"{title} {name}", attachment_type=attachment_type)
+
+    def body_attachment(
+        self, response: httpx.Response
+    ) -> tuple[str, str, AttachmentType]:
+        """
+        Build the body attachment of a response.
+
+        Args:
+            response: Received response
+
+        Returns:
+            tuple[str, str, AttachmentType]: Body text, attachment name and type
+        """
+        model = response.extensions.get(MODEL_EXTENSION)
+        if model is not None:
+            # The body was parsed already; dump the model instead of decoding it again
+            body, truncated = truncate(
+                model.model_dump_json(indent=2), self.max_body_bytes
+            )
+            name = f"Validated {type(model).__name__}"
+            is_json = True
+        else:
+            try:
+                text = response.text
+                is_json = "json" in response.headers.get("Content-Type", "")
+            except httpx.ResponseNotRead:
+                # Streamed bodies are consumed item by item and not kept; the
+                # placeholder is not JSON whatever the Content-Type says
+                text = "<streamed body, not kept>"
+                is_json = False
+            body, truncated = truncate(text, self.max_body_bytes)
+            name = "Response Body"
+        if is_json and not truncated:
+            return body, f"{name} (JSON)", AttachmentType.JSON
+        return body, f"{name} (Text)", AttachmentType.TEXT
+
+
+attachment_recorder = AttachmentRecorder(
+    level=config.API_ATTACHMENTS,
+    max_body_bytes=config.API_ATTACHMENT_MAX_BYTES,
+    sample_rate=config.API_ATTACHMENT_SAMPLE_RATE,
+)
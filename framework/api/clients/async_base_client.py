@@ -0,0 +1,191 @@
+import asyncio
+import logging
+from contextvars import ContextVar
+from typing import Awaitable, Callable, Iterable, TypeVar, Union
+
+import allure
+import httpx
+
+from framework.api.attachments import attachment_recorder
+from framework.api.clients.resilience import (
+    RETRYABLE_ERRORS,
+    CircuitBreaker,
+    CircuitOpenError,
+    RetryPolicy,
+    retry_stats,
+)
+from framework.api.metrics import api_metrics
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Set in the coroutines run by gather_bounded(). Allure keeps one step stack
+# per thread, so steps opened by interleaved coroutines would nest in each
+# other; their requests are only recorded as attachments.
+_fan_out: ContextVar[bool] = ContextVar("fan_out", default=False)
+
+
+async def gather_bounded(
+    factories: Iterable[Callable[[], Awaitable[T]]], max_concurrency: int
+) -> list[T]:
+    """
+    Run coroutines concurrently with a limit on how many are in flight.
+
+    Args:
+        factories: Callables that create the coroutines to run
+        max_concurrency: Maximum number of coroutines running at the same time
+
+    Returns:
+        list[T]: Results in the order of the factories
+
+    Raises:
+        ValueError: If max_concurrency is less than 1
+    """
+    if max_concurrency < 1:
+        raise ValueError("max_concurrency must be at least 1")
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def run(factory: Callable[[], Awaitable[T]]) -> T:
+        # Every coroutine runs in a task with a copy of the context
+        _fan_out.set(True)
+        async with semaphore:
+            return await factory()
+
+    return await asyncio.gather(*(run(factory) for factory in factories))
+
+
+class AsyncBaseClient(httpx.AsyncClient):
+    """
+    Asynchronous counterpart of BaseClient with the same Allure request and response logging.
+    """
+
+    def __init__(
+        self,
+        *args,
+        log_requests: bool = True,
+        retry_policy: RetryPolicy | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        **kwargs,
+    ):
+        """
+        Initialize the client.
+
+        Args:
+            *args: Positional arguments for httpx.AsyncClient
+            log_requests: Report every request as an Allure step with attachments
+                and record its latency in api_metrics. Disabled for load
+                generation, where it would flood the report.
+            retry_policy: When to retry failed requests (no retries if None)
+            circuit_breaker: Breaker that fails fast while a host keeps failing
+                (always sends if None)
+            **kwargs: Additional arguments for httpx.AsyncClient
+        """
+        super().__init__(*args, **kwargs)
+        self.log_requests = log_requests
+        self.retry_policy = retry_policy
+        self.circuit_breaker = circuit_breaker
+
+    async def request(
+        self, method: str, url: Union[str, httpx.URL], **kwargs
+    ) -> httpx.Response:
+        """
+        Overridden request method with Allure logging capabilities.
+
+        Requests sent by coroutines of gather_bounded() get no step of their
+        own, only their attachments.
+
+        Args:
+            method: HTTP method to use
+            url: URL to request
+            **kwargs: Additional arguments to pass to the request
+
+        Returns:
+            httpx.Response object
+        """
+        if not self.log_requests:
+            # Load generation measures its own latencies, its traffic would
+            # skew the percentiles the API SLA is checked against
+            return await super().request(method, url, **kwargs)
+        if _fan_out.get():
+            response = await super().request(method, url, **kwargs)
+            api_metrics.record(method, url, response.elapsed.total_seconds())
+            attachment_recorder.record(method, url, response, **kwargs)
+            return response
+        with allure.step(f"{method} {url}"):
+            response = await super().request(method, url, **kwargs)
+            api_metrics.record(method, url, response.elapsed.total_seconds())
+            attachment_recorder.record(method, url, response, **kwargs)
+            return response
+
+    async def send(self, request: httpx.Request, **kwargs) -> httpx.Response:
+        """
+        Send a request, retrying it according to the retry policy.
+
+        Args:
+            request: Request to send
+            **kwargs: Additional arguments for httpx.AsyncClient.send
+
+        Returns:
+            httpx.Response: Response of the last attempt
+
+        Raises:
+            CircuitOpenError: If the circuit of the host is open
+            httpx.TransportError: If the last attempt failed without a response
+        """
+        policy = self.retry_policy or RetryPolicy(max_retries=0)
+        attempt = 0
+        while True:
+            response, error = None, None
+            try:
+                response = await self._send_attempt(request, **kwargs)
+            except RETRYABLE_ERRORS as e:
+                error = e
+            except CircuitOpenError:
+                retry_stats.record(attempt, failed=True)
+                raise
+            if not policy.should_retry(request.method, attempt, response, error):
+                break
+            attempt += 1
+            delay = policy.delay(attempt, response)
+            reason = repr(error) if response is None else str(response.status_code)
+            if response is not None:
+                await response.aclose()
+            logger.info(
+                f"Retrying {request.method} {request.url} after {reason} in {delay:.3f}s"
+            )
+            if self.log_requests and not _fan_out.get():
+                with allure.step(
+                    f"Retry {attempt}/{policy.max_retries} after {reason}, "
+                    f"back-off {delay * 1000:.0f}ms"
+                ):
+                    await asyncio.sleep(delay)
+            else:
+                await asyncio.sleep(delay)
+
+        failed = response is None or response.status_code in policy.statuses
+        retry_stats.record(attempt, failed)
+        if error is not None:
+            raise error
+        return response
+
+    async def _send_attempt(self, request: httpx.Request, **kwargs) -> httpx.Response:
+        breaker = self.circuit_breaker
+        if breaker is None:
+            return await super().send(request, **kwargs)
+        try:
+            breaker.before_request(request)
+        except CircuitOpenError:
+            retry_stats.record_rejected()
+            raise
+        try:
+            response = await super().send(request, **kwargs)
+        except httpx.TransportError:
+            breaker.record(request, failed=True)
+            raise
+        except BaseException:
+            # Not the host's fault, but a trial must not stay in flight forever
+            breaker.abandon(request)
+            raise
+        breaker.record(request, failed=response.is_server_error)
+        return response
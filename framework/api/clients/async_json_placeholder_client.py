@@ -0,0 +1,95 @@
+from typing import Iterable
+
+import allure
+import httpx
+
+from framework import config
+from framework.api.clients.connection import client_options
+from framework.api.clients.async_base_client import AsyncBaseClient, gather_bounded
+from framework.api.clients.base_client import parse_model
+from framework.api.clients.resilience import resilience_options
+from framework.api.models.post import Post
+
+DEFAULT_MAX_CONCURRENCY = 10
+
+
+class AsyncJsonPlaceholderClient(AsyncBaseClient):
+    """
+    Asynchronous client for interacting with JSONPlaceholder API.
+    """
+
+    def __init__(self, base_url: str | None = None, **kwargs):
+        """
+        Initialize the client.
+
+        Args:
+            base_url: Service URL (uses JSON_PLACEHOLDER_URL setting if None)
+            **kwargs: Additional arguments for AsyncBaseClient, e.g. a transport
+                or a retry policy. They override the connection settings from
+                client_options() and the retry settings from resilience_options().
+        """
+        kwargs = {**client_options(asynchronous=True), **resilience_options(), **kwargs}
+        super().__init__(base_url=base_url or config.JSON_PLACEHOLDER_URL, **kwargs)
+
+    async def get_post(
+        self, post_id: int, timeout: float | httpx.Timeout | None = None
+    ) -> httpx.Response:
+        """
+        Retrieve a post by its ID.
+
+        Args:
+            post_id: The ID of the post to retrieve
+            timeout: Timeout for this request (uses the client timeout if None)
+
+        Returns:
+            httpx.Response: The HTTP response containing the post data
+        """
+        if timeout is None:
+            return await self.get(f"/posts/{post_id}")
+        return await self.get(f"/posts/{post_id}", timeout=timeout)
+
+    async def get_post_model(
+        self, post_id: int, timeout: float | httpx.Timeout | None = None
+    ) -> Post:
+        """
+        Retrieve a post by its ID and validate it.
+
+        Args:
+            post_id: The ID of the post to retrieve
+            timeout: Timeout for this request (uses the client timeout if None)
+
+        Returns:
+            Post: The validated post
+
+        Raises:
+            httpx.HTTPStatusError: If the post could not be retrieved
+            pydantic.ValidationError: If the response does not match the Post model
+        """
+        return parse_model(await self.get_post(post_id, timeout), Post)
+
+    async def get_posts(
+        self,
+        post_ids: Iterable[int],
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> list[httpx.Response]:
+        """
+        Retrieve many posts concurrently.
+
+        Args:
+            post_ids: IDs of the posts to retrieve
+            max_concurrency: Maximum number of requests in flight
+
+        Returns:
+            list[httpx.Response]: Responses in the order of post_ids
+        """
+        post_ids = list(post_ids)
+        fan_out = gather_bounded(
+            (lambda post_id=post_id: self.get_post(post_id) for post_id in post_ids),
+            max_concurrency,
+        )
+        if not self.log_requests:
+            return await fan_out
+        with allure.step(
+            f"GET {len(post_ids)} posts, at most {max_concurrency} in flight"
+        ):
+            return await fan_out
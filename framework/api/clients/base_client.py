@@ -1,6 +1,60 @@
+import logging
+import time
+from http import HTTPStatus
+
 import httpx
 import allure
-from typing import Union
+from typing import Any, Iterator, TypeVar, Union
+
+from pydantic import BaseModel
+
+from framework.api.attachments import MODEL_EXTENSION, attachment_recorder
+from framework.api.clients.response_cache import (
+    CACHE_EXTENSION,
+    HIT,
+    MISS,
+    REVALIDATED,
+    ResponseCache,
+)
+from framework.api.clients.resilience import (
+    RETRYABLE_ERRORS,
+    CircuitBreaker,
+    CircuitOpenError,
+    RetryPolicy,
+    retry_stats,
+)
+from framework.api.metrics import api_metrics
+from framework.api.streaming import ItemError, ValidatedItems, validate_items
+
+logger = logging.getLogger(__name__)
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+STREAM_CHUNK_SIZE = 65536
+
+
+def parse_model(response: httpx.Response, model: type[ModelT]) -> ModelT:
+    """
+    Validate a response body against a model straight from the raw bytes.
+
+    The parsed model is kept on the response, so the body is parsed only once
+    for the test and the attachment recorder.
+
+    Args:
+        response: Received response
+        model: Pydantic model to validate against
+
+    Returns:
+        ModelT: Validated model instance
+
+    Raises:
+        httpx.HTTPStatusError: If the response has an error status code
+        pydantic.ValidationError: If the body does not match the model
+    """
+    response.raise_for_status()
+    parsed = model.model_validate_json(response.content)
+    response.extensions[MODEL_EXTENSION] = parsed
+    return parsed
 
 
 class BaseClient(httpx.Client):
@@ -8,12 +62,39 @@ class BaseClient(httpx.Client):
     Enhanced version of httpx.Client with Allure integration for request and response logging.
     """
 
+    def __init__(
+        self,
+        *args,
+        cache: ResponseCache | None = None,
+        retry_policy: RetryPolicy | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        **kwargs,
+    ):
+        """
+        Initialize the client.
+
+        Args:
+            *args: Positional arguments for httpx.Client
+            cache: Response cache for GET requests (no caching if None)
+            retry_policy: When to retry failed requests (no retries if None)
+            circuit_breaker: Breaker that fails fast while a host keeps failing
+                (always sends if None)
+            **kwargs: Additional arguments for httpx.Client
+        """
+        super().__init__(*args, **kwargs)
+        self.cache = cache
+        self.retry_policy = retry_policy
+        self.circuit_breaker = circuit_breaker
+
     def request(
         self, method: str, url: Union[str, httpx.URL], **kwargs
     ) -> httpx.Response:
         """
         Overridden request method with Allure logging capabilities.
 
+        The exchange is handed to the attachment recorder, which attaches it
+        to the report after the test according to API_ATTACHMENTS.
+
         Args:
             method: HTTP method to use
             url: URL to request
@@ -23,37 +104,173 @@ class BaseClient(httpx.Client):
             httpx.Response object
         """
         with allure.step(f"{method} {url}"):
-            allure.attach(
-                f"URL: {url}\n"
-                f"Method: {method}\n"
-                f"Params: {kwargs.get('params')}\n"
-                f"JSON: {kwargs.get('json')}\n"
-                f"Headers: {kwargs.get('headers')}",
-                name="Request",
-                attachment_type=allure.attachment_type.TEXT,
-            )
+            if self.cache is not None and self.cache.accepts(method, **kwargs):
+                response = self._cached_request(method, url, **kwargs)
+            else:
+                response = super().request(method, url, **kwargs)
+            if response.extensions.get(CACHE_EXTENSION) not in (HIT, REVALIDATED):
+                api_metrics.record(method, url, response.elapsed.total_seconds())
+            attachment_recorder.record(method, url, response, **kwargs)
+            return response
 
-            response = super().request(method, url, **kwargs)
+    def send(self, request: httpx.Request, **kwargs) -> httpx.Response:
+        """
+        Send a request, retrying it according to the retry policy.
 
-            allure.attach(
-                f"Status Code: {response.status_code}\n"
-                f"Response Time: {response.elapsed.total_seconds()}s",
-                name="Response Info",
-                attachment_type=allure.attachment_type.TEXT,
-            )
+        Every retry is shown as an Allure step with its reason and back-off,
+        and counted in retry_stats.
 
+        Args:
+            request: Request to send
+            **kwargs: Additional arguments for httpx.Client.send
+
+        Returns:
+            httpx.Response: Response of the last attempt
+
+        Raises:
+            CircuitOpenError: If the circuit of the host is open
+            httpx.TransportError: If the last attempt failed without a response
+        """
+        policy = self.retry_policy or RetryPolicy(max_retries=0)
+        attempt = 0
+        while True:
+            response, error = None, None
             try:
-                response_json = response.json()
-                allure.attach(
-                    str(response_json),
-                    name="Response Body (JSON)",
-                    attachment_type=allure.attachment_type.JSON,
-                )
-            except Exception:
-                allure.attach(
-                    response.text,
-                    name="Response Body (Text)",
-                    attachment_type=allure.attachment_type.TEXT,
-                )
+                response = self._send_attempt(request, **kwargs)
+            except RETRYABLE_ERRORS as e:
+                error = e
+            except CircuitOpenError:
+                retry_stats.record(attempt, failed=True)
+                raise
+            if not policy.should_retry(request.method, attempt, response, error):
+                break
+            attempt += 1
+            delay = policy.delay(attempt, response)
+            reason = repr(error) if response is None else str(response.status_code)
+            if response is not None:
+                response.close()
+            logger.info(
+                f"Retrying {request.method} {request.url} after {reason} in {delay:.3f}s"
+            )
+            with allure.step(
+                f"Retry {attempt}/{policy.max_retries} after {reason}, "
+                f"back-off {delay * 1000:.0f}ms"
+            ):
+                time.sleep(delay)
 
-            return response
+        failed = response is None or response.status_code in policy.statuses
+        retry_stats.record(attempt, failed)
+        if error is not None:
+            raise error
+        return response
+
+    def _send_attempt(self, request: httpx.Request, **kwargs) -> httpx.Response:
+        breaker = self.circuit_breaker
+        if breaker is None:
+            return super().send(request, **kwargs)
+        try:
+            breaker.before_request(request)
+        except CircuitOpenError:
+            retry_stats.record_rejected()
+            raise
+        try:
+            response = super().send(request, **kwargs)
+        except httpx.TransportError:
+            breaker.record(request, failed=True)
+            raise
+        except BaseException:
+            # Not the host's fault, but a trial must not stay in flight forever
+            breaker.abandon(request)
+            raise
+        breaker.record(request, failed=response.is_server_error)
+        return response
+
+    def _cached_request(
+        self, method: str, url: Union[str, httpx.URL], **kwargs
+    ) -> httpx.Response:
+        cache = self.cache
+        request = self.build_request(
+            method, url, params=kwargs.get("params"), headers=kwargs.get("headers")
+        )
+        entry = cache.get(request)
+        if entry is not None and entry.is_fresh():
+            cache.count(HIT)
+            return entry.to_response(request, HIT)
+
+        if entry is not None and entry.etag:
+            kwargs["headers"] = {
+                **dict(kwargs.get("headers") or {}),
+                "If-None-Match": entry.etag,
+            }
+        response = super().request(method, url, **kwargs)
+        if entry is not None and response.status_code == HTTPStatus.NOT_MODIFIED:
+            cache.count(REVALIDATED)
+            cache.refresh(request, entry, response)
+            return entry.to_response(request, REVALIDATED)
+
+        cache.count(MISS)
+        response.extensions[CACHE_EXTENSION] = MISS
+        cache.store(request, response)
+        return response
+
+    def stream_items(
+        self,
+        url: Union[str, httpx.URL],
+        model: type[ModelT],
+        params: dict[str, Any] | None = None,
+    ) -> Iterator[ModelT | ItemError]:
+        """
+        Stream a JSON array response and validate its items as they arrive.
+
+        Only the item being read is kept in memory, so large collections can
+        be checked without buffering the whole payload.
+
+        Args:
+            url: URL of the collection
+            model: Pydantic model every item should match
+            params: Query parameters
+
+        Yields:
+            ModelT | ItemError: Validated item, or the error for an invalid one
+
+        Raises:
+            httpx.HTTPStatusError: If the response has an error status code
+            ValueError: If the body is not a complete JSON array
+        """
+        with allure.step(f"GET {url} (streamed)"):
+            with self.stream("GET", url, params=params) as response:
+                attachment_recorder.record("GET", url, response, params=params)
+                if response.is_error:
+                    response.read()
+                    response.raise_for_status()
+                yield from validate_items(response.iter_bytes(STREAM_CHUNK_SIZE), model)
+            api_metrics.record("GET", url, response.elapsed.total_seconds())
+
+    def list_items(
+        self,
+        url: Union[str, httpx.URL],
+        model: type[ModelT],
+        params: dict[str, Any] | None = None,
+    ) -> ValidatedItems[ModelT]:
+        """
+        Retrieve a collection and validate every item.
+
+        Args:
+            url: URL of the collection
+            model: Pydantic model every item should match
+            params: Query parameters
+
+        Returns:
+            ValidatedItems[ModelT]: Valid items and the errors for invalid ones
+
+        Raises:
+            httpx.HTTPStatusError: If the response has an error status code
+            ValueError: If the body is not a complete JSON array
+        """
+        result = ValidatedItems()
+        for item in self.stream_items(url, model, params):
+            if isinstance(item, ItemError):
+                result.errors.append(item)
+            else:
+                result.items.append(item)
+        return result
@@ -0,0 +1,212 @@
+import importlib.util
+import logging
+import threading
+from dataclasses import dataclass, field
+from typing import Any
+
+import httpx
+
+from framework import config
+
+logger = logging.getLogger(__name__)
+
+# httpcore trace events that mark a new connection
+TCP_CONNECT = "connection.connect_tcp.complete"
+TLS_HANDSHAKE = "connection.start_tls.complete"
+HTTP2_INIT = "http2.send_connection_init.complete"
+
+
+@dataclass
+class ConnectionMetrics:
+    """
+    Counts requests and the connections opened to serve them.
+
+    Attributes:
+        requests: Requests sent
+        traced_requests: Requests that reported connection events; transports
+            without a connection pool, like httpx.MockTransport, report none
+        tcp_connects: TCP connections opened
+        tls_handshakes: TLS handshakes performed
+        http2_connections: Connections that negotiated HTTP/2
+    """
+
+    requests: int = 0
+    traced_requests: int = 0
+    tcp_connects: int = 0
+    tls_handshakes: int = 0
+    http2_connections: int = 0
+    _lock: threading.Lock = field(
+        default_factory=threading.Lock, repr=False, compare=False
+    )
+
+    @property
+    def reused(self) -> int | None:
+        """
+        Requests served over an already open connection, or None if no
+        request reported connection events.
+        """
+        if not self.traced_requests:
+            return None
+        return max(0, self.traced_requests - self.tcp_connects)
+
+    def counts(self) -> dict[str, int]:
+        """
+        Get the counters without the lock, e.g. to send them between processes.
+
+        Returns:
+            dict[str, int]: Counter values by name
+        """
+        return {
+            "requests": self.requests,
+            "traced_requests": self.traced_requests,
+            "tcp_connects": self.tcp_connects,
+            "tls_handshakes": self.tls_handshakes,
+            "http2_connections": self.http2_connections,
+        }
+
+    def merge(self, counts: dict[str, int]) -> None:
+        """
+        Add counters collected elsewhere, e.g. by an xdist worker.
+
+        Args:
+            counts: Counter values by name, as returned by counts()
+        """
+        with self._lock:
+            for name, value in counts.items():
+                setattr(self, name, getattr(self, name) + value)
+
+    def on_request(self, request: httpx.Request) -> None:
+        """
+        Request event hook that subscribes to the connection events of a request.
+
+        Args:
+            request: Request about to be sent
+        """
+        with self._lock:
+            self.requests += 1
+        previous = request.extensions.get("trace")
+        first = True
+
+        def trace(event: str, info: dict[str, Any]) -> None:
+            nonlocal first
+            if first:
+                first = False
+                self._count("traced_requests")
+            self.trace(event, info)
+            if previous is not None:
+                previous(event, info)
+
+        request.extensions["trace"] = trace
+
+    async def on_async_request(self, request: httpx.Request) -> None:
+        """
+        Request event hook for asynchronous clients.
+
+        Args:
+            request: Request about to be sent
+        """
+        with self._lock:
+            self.requests += 1
+        previous = request.extensions.get("trace")
+        first = True
+
+        async def trace(event: str, info: dict[str, Any]) -> None:
+            nonlocal first
+            if first:
+                first = False
+                self._count("traced_requests")
+            self.trace(event, info)
+            if previous is not None:
+                await previous(event, info)
+
+        request.extensions["trace"] = trace
+
+    def _count(self, counter: str) -> None:
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def trace(self, event: str, info: dict[str, Any]) -> None:
+        """
+        Count an httpcore trace event.
+
+        Args:
+            event: Event name, e.g. "connection.connect_tcp.complete"
+            info: Event details
+        """
+        counter = {
+            TCP_CONNECT: "tcp_connects",
+            TLS_HANDSHAKE: "tls_handshakes",
+            HTTP2_INIT: "http2_connections",
+        }.get(event)
+        if counter is not None:
+            self._count(counter)
+
+    def summary(self) -> str:
+        """
+        Build a human readable summary of the metrics.
+
+        Returns:
+            str: One-line summary
+        """
+        reused = self.reused
+        if reused is None:
+            reused_text = "n/a (no connection events)"
+        else:
+            reused_text = f"{reused} ({reused / self.traced_requests:.0%})"
+        return (
+            f"requests: {self.requests}, TCP connects: {self.tcp_connects}, "
+            f"TLS handshakes: {self.tls_handshakes}, "
+            f"HTTP/2 connections: {self.http2_connections}, "
+            f"reused: {reused_text}"
+        )
+
+
+def http2_available() -> bool:
+    """
+    Check whether the h2 package needed for HTTP/2 is installed.
+
+    Returns:
+        bool: True if HTTP/2 can be enabled
+    """
+    return importlib.util.find_spec("h2") is not None
+
+
+def client_options(
+    asynchronous: bool = False,
+    metrics: "ConnectionMetrics | None" = None,
+    **overrides,
+) -> dict[str, Any]:
+    """
+    Build httpx client arguments from the connection settings.
+
+    Args:
+        asynchronous: Whether the options are for an httpx.AsyncClient
+        metrics: Connection metrics to report to (uses the shared metrics if None)
+        **overrides: Arguments that replace the configured ones
+
+    Returns:
+        dict[str, Any]: Keyword arguments for the client constructor
+    """
+    metrics = metrics or connection_metrics
+    http2 = config.API_HTTP2
+    if http2 and not http2_available():
+        logger.warning("API_HTTP2 is enabled but h2 is not installed, using HTTP/1.1")
+        http2 = False
+    hook = metrics.on_async_request if asynchronous else metrics.on_request
+    options = {
+        "limits": httpx.Limits(
+            max_connections=config.API_MAX_CONNECTIONS,
+            max_keepalive_connections=config.API_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=config.API_KEEPALIVE_EXPIRY,
+        ),
+        "timeout": httpx.Timeout(
+            config.API_TIMEOUT, connect=config.API_CONNECT_TIMEOUT
+        ),
+        "http2": http2,
+        "event_hooks": {"request": [hook]},
+    }
+    options.update(overrides)
+    return options
+
+
+connection_metrics = ConnectionMetrics()
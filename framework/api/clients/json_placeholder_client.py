@@ -1,6 +1,14 @@
 import httpx
 
-from framework.api.clients.base_client import BaseClient
+from framework import config
+from framework.api.clients.connection import client_options
+from framework.api.clients.base_client import BaseClient, parse_model
+from framework.api.clients.resilience import resilience_options
+from framework.api.models.comment import Comment
+from framework.api.models.post import Post
+from framework.api.models.todo import Todo
+from framework.api.models.user import User
+from framework.api.streaming import ValidatedItems
 
 
 class JsonPlaceholderClient(BaseClient):
@@ -8,19 +16,107 @@ class JsonPlaceholderClient(BaseClient):
     Client for interacting with JSONPlaceholder API.
     """
 
-    def __init__(self, **kwargs):
-        super().__init__(
-            base_url="https://jsonplaceholder.typicode.com", timeout=5.0, **kwargs
-        )
+    def __init__(self, base_url: str | None = None, **kwargs):
+        """
+        Initialize the client.
+
+        Args:
+            base_url: Service URL (uses JSON_PLACEHOLDER_URL setting if None)
+            **kwargs: Additional arguments for BaseClient, e.g. a transport or
+                a retry policy. They override the connection settings from
+                client_options() and the retry settings from resilience_options().
+        """
+        kwargs = {**client_options(), **resilience_options(), **kwargs}
+        super().__init__(base_url=base_url or config.JSON_PLACEHOLDER_URL, **kwargs)
 
-    def get_post(self, post_id: int) -> httpx.Response:
+    def get_post(
+        self, post_id: int, timeout: float | httpx.Timeout | None = None
+    ) -> httpx.Response:
         """
         Retrieve a post by its ID.
 
         Args:
             post_id: The ID of the post to retrieve
+            timeout: Timeout for this request (uses the client timeout if None)
 
         Returns:
             httpx.Response: The HTTP response containing the post data
         """
-        return self.get(f"/posts/{post_id}")
+        if timeout is None:
+            return self.get(f"/posts/{post_id}")
+        return self.get(f"/posts/{post_id}", timeout=timeout)
+
+    def get_post_model(
+        self, post_id: int, timeout: float | httpx.Timeout | None = None
+    ) -> Post:
+        """
+        Retrieve a post by its ID and validate it.
+
+        Args:
+            post_id: The ID of the post to retrieve
+            timeout: Timeout for this request (uses the client timeout if None)
+
+        Returns:
+            Post: The validated post
+
+        Raises:
+            httpx.HTTPStatusError: If the post could not be retrieved
+            pydantic.ValidationError: If the response does not match the Post model
+        """
+        return parse_model(self.get_post(post_id, timeout), Post)
+
+    def list_posts(self) -> ValidatedItems[Post]:
+        """
+        Retrieve and validate all posts.
+
+        Returns:
+            ValidatedItems[Post]: Valid posts and the errors for invalid ones
+        """
+        return self.list_items("/posts", Post)
+
+    def list_posts_by_user(self, user_id: int) -> ValidatedItems[Post]:
+        """
+        Retrieve and validate the posts of a user.
+
+        Args:
+            user_id: The ID of the user
+
+        Returns:
+            ValidatedItems[Post]: Valid posts and the errors for invalid ones
+        """
+        return self.list_items("/posts", Post, params={"userId": user_id})
+
+    def list_comments(self, post_id: int | None = None) -> ValidatedItems[Comment]:
+        """
+        Retrieve and validate comments.
+
+        Args:
+            post_id: Only return the comments of this post (all comments if None)
+
+        Returns:
+            ValidatedItems[Comment]: Valid comments and the errors for invalid ones
+        """
+        params = None if post_id is None else {"postId": post_id}
+        return self.list_items("/comments", Comment, params=params)
+
+    def list_users(self) -> ValidatedItems[User]:
+        """
+        Retrieve and validate all users.
+
+        Returns:
+            ValidatedItems[User]: Valid users and the errors for invalid ones
+        """
+        return self.list_items("/users", User)
+
+    def list_todos(self, user_id: int | None = None) -> ValidatedItems[Todo]:
+        """
+        Retrieve and validate todos.
+
+        Args:
+            user_id: Only return the todos of this user (all todos if None)
+
+        Returns:
+            ValidatedItems[Todo]: Valid todos and the errors for invalid ones
+        """
+        params = None if user_id is None else {"userId": user_id}
+        return self.list_items("/todos", Todo, params=params)
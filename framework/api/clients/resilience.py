@@ -0,0 +1,342 @@
+import logging
+import random
+import threading
+import time
+from dataclasses import dataclass, field
+from http import HTTPStatus
+from typing import Any
+
+import httpx
+
+from framework import config
+
+logger = logging.getLogger(__name__)
+
+IDEMPOTENT_METHODS = ("GET", "HEAD", "OPTIONS", "PUT", "DELETE", "TRACE")
+RETRY_STATUSES = (
+    HTTPStatus.TOO_MANY_REQUESTS,
+    HTTPStatus.BAD_GATEWAY,
+    HTTPStatus.SERVICE_UNAVAILABLE,
+    HTTPStatus.GATEWAY_TIMEOUT,
+)
+# Errors after which the request may be sent again
+RETRYABLE_ERRORS = (
+    httpx.TimeoutException,
+    httpx.NetworkError,
+    httpx.RemoteProtocolError,
+)
+# Errors raised before anything was sent, safe to retry for any method
+NOT_SENT_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+
+
+class CircuitOpenError(httpx.TransportError):
+    """Raised instead of sending a request to a host whose circuit is open."""
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """
+    When and how long to wait before sending a failed request again.
+
+    Attributes:
+        max_retries: Retries after the first attempt (0 disables retries)
+        backoff: Upper bound of the first delay in seconds, doubled for every retry
+        max_backoff: Upper bound of any delay in seconds, also caps Retry-After
+        methods: Methods that are retried after a response or a read error
+        statuses: Status codes that are retried
+    """
+
+    max_retries: int = 2
+    backoff: float = 0.1
+    max_backoff: float = 2.0
+    methods: tuple[str, ...] = IDEMPOTENT_METHODS
+    statuses: tuple[int, ...] = RETRY_STATUSES
+
+    @classmethod
+    def from_config(cls) -> "RetryPolicy":
+        return cls(
+            max_retries=config.API_RETRIES,
+            backoff=config.API_RETRY_BACKOFF,
+            max_backoff=config.API_RETRY_MAX_BACKOFF,
+        )
+
+    def should_retry(
+        self,
+        method: str,
+        attempt: int,
+        response: httpx.Response | None = None,
+        error: Exception | None = None,
+    ) -> bool:
+        """
+        Decide whether to send a request again.
+
+        Args:
+            method: HTTP method of the request
+            attempt: Retries made so far
+            response: Response of the last attempt, if one was received
+            error: Error of the last attempt, if it failed
+
+        Returns:
+            bool: True if another attempt should be made
+        """
+        if attempt >= self.max_retries:
+            return False
+        if error is not None:
+            if isinstance(error, NOT_SENT_ERRORS):
+                return True
+            return isinstance(error, RETRYABLE_ERRORS) and method in self.methods
+        return response.status_code in self.statuses and method in self.methods
+
+    def delay(self, attempt: int, response: httpx.Response | None = None) -> float:
+        """
+        Get the time to wait before a retry.
+
+        Uses "full jitter": a random delay up to the exponential back-off, so
+        clients that failed together do not retry together. A numeric
+        Retry-After header of the response takes precedence.
+
+        Args:
+            attempt: Number of the retry, starting at 1
+            response: Response of the failed attempt, if one was received
+
+        Returns:
+            float: Delay in seconds
+        """
+        retry_after = response.headers.get("Retry-After") if response else None
+        if retry_after is not None and retry_after.isdigit():
+            return min(self.max_backoff, float(retry_after))
+        return random.uniform(
+            0, min(self.max_backoff, self.backoff * 2 ** (attempt - 1))
+        )
+
+
+@dataclass
+class Circuit:
+    """
+    State of the circuit of one host.
+
+    Attributes:
+        failures: Consecutive failed requests
+        opened_at: Time the circuit was opened (None while it is closed)
+        trial_in_flight: Whether a trial request of a half-open circuit is running
+    """
+
+    failures: int = 0
+    opened_at: float | None = None
+    trial_in_flight: bool = False
+
+
+class CircuitBreaker:
+    """
+    Per-host circuit breaker.
+
+    After failure_threshold consecutive failures (transport errors or 5xx
+    responses) the circuit of the host opens and requests fail fast with
+    CircuitOpenError. Once reset_timeout has passed a single trial request is
+    let through: the circuit closes if it succeeds and opens again if not.
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0) -> None:
+        """
+        Initialize the breaker.
+
+        Args:
+            failure_threshold: Consecutive failures that open the circuit of a host
+            reset_timeout: Seconds an open circuit rejects requests
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.circuits: dict[str, Circuit] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def host(request: httpx.Request) -> str:
+        return request.url.netloc.decode()
+
+    def before_request(self, request: httpx.Request) -> None:
+        """
+        Check that a request may be sent.
+
+        Args:
+            request: Request about to be sent
+
+        Raises:
+            CircuitOpenError: If the circuit of the host is open
+        """
+        host = self.host(request)
+        with self._lock:
+            circuit = self.circuits.setdefault(host, Circuit())
+            if circuit.opened_at is None:
+                return
+            remaining = circuit.opened_at + self.reset_timeout - time.monotonic()
+            if remaining <= 0 and not circuit.trial_in_flight:
+                circuit.trial_in_flight = True
+                return
+        raise CircuitOpenError(
+            f"Circuit for {host} is open after {circuit.failures} consecutive "
+            f"failures, retrying in {max(0.0, remaining):.1f}s",
+            request=request,
+        )
+
+    def record(self, request: httpx.Request, failed: bool) -> None:
+        """
+        Record the outcome of a request.
+
+        Args:
+            request: Sent request
+            failed: Whether it failed with a transport error or a 5xx response
+        """
+        host = self.host(request)
+        with self._lock:
+            circuit = self.circuits.setdefault(host, Circuit())
+            if not failed:
+                if circuit.opened_at is not None:
+                    logger.info(f"Circuit for {host} closed")
+                self.circuits[host] = Circuit()
+                return
+            circuit.failures += 1
+            if circuit.trial_in_flight or (
+                circuit.opened_at is None and circuit.failures >= self.failure_threshold
+            ):
+                logger.warning(
+                    f"Circuit for {host} opened after {circuit.failures} consecutive failures"
+                )
+                circuit.opened_at = time.monotonic()
+                circuit.trial_in_flight = False
+
+    def abandon(self, request: httpx.Request) -> None:
+        """
+        Forget a request whose outcome is unknown, e.g. because it was
+        cancelled. If it was the trial of a half-open circuit, the next
+        request becomes the trial instead.
+
+        Args:
+            request: Request that raised something other than a transport error
+        """
+        with self._lock:
+            circuit = self.circuits.get(self.host(request))
+            if circuit is not None:
+                circuit.trial_in_flight = False
+
+    def is_open(self, host: str) -> bool:
+        circuit = self.circuits.get(host)
+        return circuit is not None and circuit.opened_at is not None
+
+    def reset(self) -> None:
+        """
+        Close all circuits.
+        """
+        with self._lock:
+            self.circuits.clear()
+
+
+@dataclass
+class RetryStats:
+    """
+    Counts how often requests needed to be retried.
+
+    Attributes:
+        retried: Requests sent more than once
+        retries: Additional attempts made
+        recovered: Retried requests that finally succeeded
+        exhausted: Retried requests that still failed after the last attempt
+        rejected: Requests rejected by an open circuit
+    """
+
+    retried: int = 0
+    retries: int = 0
+    recovered: int = 0
+    exhausted: int = 0
+    rejected: int = 0
+    _lock: threading.Lock = field(
+        default_factory=threading.Lock, repr=False, compare=False
+    )
+
+    def record(self, retries: int, failed: bool) -> None:
+        """
+        Record the outcome of a request.
+
+        Args:
+            retries: Retries made for the request
+            failed: Whether the last attempt failed
+        """
+        if not retries:
+            return
+        with self._lock:
+            self.retried += 1
+            self.retries += retries
+            if failed:
+                self.exhausted += 1
+            else:
+                self.recovered += 1
+
+    def record_rejected(self) -> None:
+        with self._lock:
+            self.rejected += 1
+
+    def counts(self) -> dict[str, int]:
+        """
+        Get the counters without the lock, e.g. to send them between processes.
+
+        Returns:
+            dict[str, int]: Counter values by name
+        """
+        return {
+            "retried": self.retried,
+            "retries": self.retries,
+            "recovered": self.recovered,
+            "exhausted": self.exhausted,
+            "rejected": self.rejected,
+        }
+
+    def merge(self, counts: dict[str, int]) -> None:
+        """
+        Add counters collected elsewhere, e.g. by an xdist worker.
+
+        Args:
+            counts: Counter values by name, as returned by counts()
+        """
+        with self._lock:
+            for name, value in counts.items():
+                setattr(self, name, getattr(self, name) + value)
+
+    def __sub__(self, other: "RetryStats") -> "RetryStats":
+        return RetryStats(
+            **{
+                name: value - getattr(other, name)
+                for name, value in self.counts().items()
+            }
+        )
+
+    def summary(self) -> str:
+        """
+        Build a human readable summary of the statistics.
+
+        Returns:
+            str: One-line summary
+        """
+        return (
+            f"retried requests: {self.retried}, retries: {self.retries}, "
+            f"recovered: {self.recovered}, exhausted: {self.exhausted}, "
+            f"rejected by open circuit: {self.rejected}"
+        )
+
+
+def resilience_options() -> dict[str, Any]:
+    """
+    Build the retry and circuit breaker arguments of BaseClient from the settings.
+
+    Returns:
+        dict[str, Any]: Keyword arguments for the client constructor
+    """
+    breaker = None
+    if config.API_CIRCUIT_BREAKER_THRESHOLD > 0:
+        breaker = circuit_breaker
+    return {"retry_policy": RetryPolicy.from_config(), "circuit_breaker": breaker}
+
+
+circuit_breaker = CircuitBreaker(
+    failure_threshold=config.API_CIRCUIT_BREAKER_THRESHOLD,
+    reset_timeout=config.API_CIRCUIT_BREAKER_RESET,
+)
+retry_stats = RetryStats()
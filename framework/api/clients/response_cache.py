@@ -0,0 +1,378 @@
+import base64
+import hashlib
+import json
+import logging
+import os
+import re
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass, field
+from datetime import timedelta
+from http import HTTPStatus
+from pathlib import Path
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+CACHEABLE_METHODS = ("GET", "HEAD")
+# Request arguments that make a request unsuitable for caching
+UNCACHEABLE_ARGUMENTS = ("content", "data", "files", "json")
+# Request headers that may change the response; requests that differ in them
+# get entries of their own
+VARYING_HEADERS = ("accept", "accept-language", "authorization", "cookie")
+
+MAX_AGE = re.compile(r"(?:^|,)\s*(?:s-)?max-age\s*=\s*\"?(\d+)")
+
+# Value of response.extensions[CACHE_EXTENSION]: where the response came from
+CACHE_EXTENSION = "http_cache"
+HIT = "hit"
+REVALIDATED = "revalidated"
+MISS = "miss"
+
+
+@dataclass
+class CacheStats:
+    """
+    Statistics of a response cache.
+
+    Attributes:
+        hits: Responses served from the cache without a request
+        revalidated: Responses confirmed by the server with 304 Not Modified
+        misses: Lookups that needed a full response from the server
+        stores: Responses added to the cache
+    """
+
+    hits: int = 0
+    revalidated: int = 0
+    misses: int = 0
+    stores: int = 0
+
+    @property
+    def lookups(self) -> int:
+        return self.hits + self.revalidated + self.misses
+
+    def __sub__(self, other: "CacheStats") -> "CacheStats":
+        return CacheStats(
+            hits=self.hits - other.hits,
+            revalidated=self.revalidated - other.revalidated,
+            misses=self.misses - other.misses,
+            stores=self.stores - other.stores,
+        )
+
+    def summary(self) -> str:
+        """
+        Build a human readable summary of the statistics.
+
+        Returns:
+            str: Multi-line summary
+        """
+        served = self.hits + self.revalidated
+        ratio = served / self.lookups if self.lookups else 0.0
+        return (
+            f"Lookups: {self.lookups}\n"
+            f"Hits: {self.hits}\n"
+            f"Revalidated (304): {self.revalidated}\n"
+            f"Misses: {self.misses}\n"
+            f"Stored: {self.stores}\n"
+            f"Served from cache: {ratio:.0%}"
+        )
+
+
+@dataclass
+class CacheEntry:
+    """
+    A cached response.
+
+    Attributes:
+        status_code: Status code of the response
+        headers: Response headers
+        content: Response body
+        stored_at: Time the response was stored or last revalidated
+        max_age: Seconds the response stays fresh (always revalidated if None)
+        etag: Validator sent back in If-None-Match
+    """
+
+    status_code: int
+    headers: list[tuple[str, str]]
+    content: bytes
+    stored_at: float = field(default_factory=time.time)
+    max_age: float | None = None
+    etag: str | None = None
+
+    def is_fresh(self) -> bool:
+        """
+        Check whether the entry can be served without asking the server.
+
+        Returns:
+            bool: True while the entry is younger than its max-age
+        """
+        return self.max_age is not None and time.time() - self.stored_at < self.max_age
+
+    def to_response(self, request: httpx.Request, source: str) -> httpx.Response:
+        """
+        Build a response from the entry.
+
+        Args:
+            request: Request the response answers
+            source: How the entry was used, HIT or REVALIDATED
+
+        Returns:
+            httpx.Response: Response with the cached status, headers and body
+        """
+        response = httpx.Response(
+            self.status_code,
+            headers=self.headers,
+            content=self.content,
+            request=request,
+            extensions={CACHE_EXTENSION: source},
+        )
+        response.elapsed = timedelta(0)
+        return response
+
+    def to_json(self, key: str) -> str:
+        data = asdict(self)
+        data["content"] = base64.b64encode(self.content).decode()
+        data["key"] = key
+        return json.dumps(data)
+
+    @classmethod
+    def from_json(cls, text: str) -> tuple[str, "CacheEntry"]:
+        data = json.loads(text)
+        key = data.pop("key")
+        data["content"] = base64.b64decode(data["content"])
+        data["headers"] = [tuple(header) for header in data["headers"]]
+        return key, cls(**data)
+
+
+def freshness(response: httpx.Response) -> tuple[bool, float | None]:
+    """
+    Read the caching rules of a response from its Cache-Control header.
+
+    Args:
+        response: Received response
+
+    Returns:
+        tuple[bool, float | None]: Whether the response may be stored, and
+            how many seconds it stays fresh (None if it must be revalidated)
+    """
+    cache_control = response.headers.get("Cache-Control", "").lower()
+    if "no-store" in cache_control or "private" in cache_control:
+        return False, None
+    if "no-cache" in cache_control:
+        return True, None
+    match = MAX_AGE.search(cache_control)
+    return True, float(match[1]) if match else None
+
+
+class ResponseCache:
+    """
+    LRU cache of GET responses with an optional on-disk store.
+
+    Entries are keyed by method, URL (including the query parameters) and the
+    VARYING_HEADERS of the request, and follow the Cache-Control and ETag
+    headers of the server: fresh entries are served without a request, stale
+    ones are revalidated with If-None-Match. The cache can be shared by
+    clients used from several threads.
+    """
+
+    def __init__(
+        self, max_entries: int = 256, directory: str | Path | None = None
+    ) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of entries kept in memory
+            directory: Directory for the on-disk store (memory only if None)
+        """
+        self.max_entries = max_entries
+        self.directory = Path(directory) if directory else None
+        self.entries: OrderedDict[str, CacheEntry] = OrderedDict()
+        self.stats = CacheStats()
+        self._lock = threading.RLock()
+        if self.directory:
+            self.directory.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def accepts(method: str, **kwargs) -> bool:
+        """
+        Check whether a request can be served from the cache.
+
+        Args:
+            method: HTTP method
+            **kwargs: Arguments passed to the request
+
+        Returns:
+            bool: True for GET and HEAD requests without a body
+        """
+        return method.upper() in CACHEABLE_METHODS and not any(
+            kwargs.get(name) is not None for name in UNCACHEABLE_ARGUMENTS
+        )
+
+    @staticmethod
+    def key(request: httpx.Request) -> str:
+        varying = [
+            f"{name}: {request.headers[name]}"
+            for name in VARYING_HEADERS
+            if name in request.headers
+        ]
+        key = f"{request.method} {request.url}"
+        if not varying:
+            return key
+        # Hashed, so credentials do not end up in the on-disk store
+        digest = hashlib.sha256("\n".join(varying).encode()).hexdigest()[:16]
+        return f"{key} {digest}"
+
+    def count(self, source: str) -> None:
+        """
+        Count a lookup in the statistics.
+
+        Args:
+            source: Where the response came from, HIT, REVALIDATED or MISS
+        """
+        with self._lock:
+            if source == HIT:
+                self.stats.hits += 1
+            elif source == REVALIDATED:
+                self.stats.revalidated += 1
+            else:
+                self.stats.misses += 1
+
+    def get(self, request: httpx.Request) -> CacheEntry | None:
+        """
+        Look up the entry for a request.
+
+        Args:
+            request: Request to look up
+
+        Returns:
+            CacheEntry | None: Cached entry, or None if there is none
+        """
+        key = self.key(request)
+        with self._lock:
+            entry = self.entries.get(key)
+            if entry is not None:
+                self.entries.move_to_end(key)
+                return entry
+        entry = self._load(key)
+        if entry is not None:
+            with self._lock:
+                self._remember(key, entry)
+        return entry
+
+    def store(self, request: httpx.Request, response: httpx.Response) -> None:
+        """
+        Add a response to the cache if the server allows it.
+
+        Args:
+            request: Request the response answers
+            response: Received response
+        """
+        storable, max_age = freshness(response)
+        etag = response.headers.get("ETag")
+        if response.status_code != HTTPStatus.OK or not storable:
+            return
+        if max_age is None and etag is None:
+            return
+        entry = CacheEntry(
+            status_code=response.status_code,
+            headers=[
+                (name, value)
+                for name, value in response.headers.items()
+                if name.lower() not in ("content-encoding", "content-length")
+            ],
+            content=response.content,
+            max_age=max_age,
+            etag=etag,
+        )
+        key = self.key(request)
+        with self._lock:
+            self._remember(key, entry)
+            self.stats.stores += 1
+        self._save(key, entry)
+
+    def refresh(
+        self, request: httpx.Request, entry: CacheEntry, response: httpx.Response
+    ) -> None:
+        """
+        Renew an entry after the server answered 304 Not Modified.
+
+        Args:
+            request: Revalidation request
+            entry: Entry that was revalidated
+            response: 304 response of the server
+        """
+        with self._lock:
+            _, entry.max_age = freshness(response)
+            entry.stored_at = time.time()
+        self._save(self.key(request), entry)
+
+    def invalidate(self, url_prefix: str = "") -> int:
+        """
+        Remove entries from memory and from disk.
+
+        Args:
+            url_prefix: Only remove entries whose URL or path starts with this
+                prefix (everything if empty)
+
+        Returns:
+            int: Number of entries removed
+        """
+        with self._lock:
+            keys = {key for key in self.entries if self._matches(key, url_prefix)}
+        if self.directory:
+            for path in self.directory.glob("*.json"):
+                try:
+                    key, _ = CacheEntry.from_json(path.read_text())
+                except (OSError, ValueError, KeyError, TypeError):
+                    continue
+                if self._matches(key, url_prefix):
+                    keys.add(key)
+        for key in keys:
+            with self._lock:
+                self.entries.pop(key, None)
+            self._delete(key)
+        return len(keys)
+
+    @staticmethod
+    def _matches(key: str, url_prefix: str) -> bool:
+        url = key.split(" ")[1]
+        return url.startswith(url_prefix) or httpx.URL(url).path.startswith(url_prefix)
+
+    def _remember(self, key: str, entry: CacheEntry) -> None:
+        self.entries[key] = entry
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{hashlib.sha256(key.encode()).hexdigest()}.json"
+
+    def _load(self, key: str) -> CacheEntry | None:
+        if not self.directory:
+            return None
+        try:
+            _, entry = CacheEntry.from_json(self._path(key).read_text())
+            return entry
+        except FileNotFoundError:
+            return None
+        except (ValueError, KeyError, TypeError) as e:
+            logger.warning(f"Ignoring unreadable cache entry for {key}: {e}")
+            return None
+
+    def _save(self, key: str, entry: CacheEntry) -> None:
+        if not self.directory:
+            return
+        # Written to a temporary file first, so parallel workers never read
+        # a partial entry
+        handle, temp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        with os.fdopen(handle, "w") as file:
+            file.write(entry.to_json(key))
+        os.replace(temp_path, self._path(key))
+
+    def _delete(self, key: str) -> None:
+        if self.directory:
+            self._path(key).unlink(missing_ok=True)
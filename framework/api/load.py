@@ -0,0 +1,279 @@
+import argparse
+import asyncio
+import json
+import logging
+import random
+import time
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable
+
+import httpx
+from pydantic import ValidationError
+
+from framework.api.clients.async_json_placeholder_client import (
+    AsyncJsonPlaceholderClient,
+)
+from framework.api.stubs.json_placeholder_stub import JsonPlaceholderStub
+from framework.api.stubs.server import StubServer
+from framework.samples import percentile
+
+logger = logging.getLogger(__name__)
+
+Scenario = Callable[[AsyncJsonPlaceholderClient], Awaitable[object]]
+
+PERCENTILES = (50, 90, 95, 99)
+
+
+async def get_post(client: AsyncJsonPlaceholderClient) -> object:
+    """Retrieve a random existing post and validate it against the Post model."""
+    return await client.get_post_model(random.randint(1, 100))
+
+
+SCENARIOS: dict[str, Scenario] = {
+    "get_post": get_post,
+}
+
+
+@dataclass
+class LoadReport:
+    """
+    Outcome of a load run.
+
+    Attributes:
+        duration: Wall-clock duration of the run in seconds
+        latencies: Latency of every completed call in seconds
+        errors: Calls that failed with an HTTP or transport error
+        validation_failures: Calls whose response did not match the model
+    """
+
+    duration: float = 0.0
+    latencies: list[float] = field(default_factory=list)
+    errors: int = 0
+    validation_failures: int = 0
+
+    @property
+    def requests(self) -> int:
+        return len(self.latencies)
+
+    @property
+    def throughput(self) -> float:
+        return self.requests / self.duration if self.duration else 0.0
+
+    @property
+    def error_rate(self) -> float:
+        return self.errors / self.requests if self.requests else 0.0
+
+    @property
+    def validation_failure_rate(self) -> float:
+        return self.validation_failures / self.requests if self.requests else 0.0
+
+    def percentile(self, pct: float) -> float:
+        """
+        Get a latency percentile.
+
+        Args:
+            pct: Percentile between 0 and 100
+
+        Returns:
+            float: Latency in seconds (0 if nothing was measured)
+        """
+        return percentile(self.latencies, pct) or 0.0
+
+    def to_dict(self) -> dict:
+        """
+        Summarise the run for machine-readable output.
+
+        Returns:
+            dict: Counters, rates and latency percentiles in milliseconds
+        """
+        return {
+            "duration_s": round(self.duration, 3),
+            "requests": self.requests,
+            "throughput_rps": round(self.throughput, 1),
+            "error_rate": round(self.error_rate, 4),
+            "validation_failure_rate": round(self.validation_failure_rate, 4),
+            **{
+                f"p{pct}_ms": round(self.percentile(pct) * 1000, 2)
+                for pct in PERCENTILES
+            },
+        }
+
+    def summary(self) -> str:
+        """
+        Build a human readable summary of the run.
+
+        Returns:
+            str: Multi-line summary
+        """
+        latencies = " ".join(
+            f"p{pct}={self.percentile(pct) * 1000:.1f}ms" for pct in PERCENTILES
+        )
+        return (
+            f"Requests: {self.requests} in {self.duration:.1f}s "
+            f"({self.throughput:.1f} req/s)\n"
+            f"Latency: {latencies}\n"
+            f"Errors: {self.errors} ({self.error_rate:.2%})\n"
+            f"Validation failures: {self.validation_failures} "
+            f"({self.validation_failure_rate:.2%})"
+        )
+
+
+class LoadRunner:
+    """
+    Drives a scenario with the API client for a fixed duration, either with a
+    fixed number of concurrent users or at a target request rate.
+    """
+
+    def __init__(
+        self,
+        client: AsyncJsonPlaceholderClient,
+        scenario: Scenario,
+        duration: float,
+        concurrency: int = 10,
+        rate: float | None = None,
+    ) -> None:
+        """
+        Initialize the runner.
+
+        Args:
+            client: Client the scenario is run with
+            scenario: Coroutine function making one call and validating it
+            duration: Seconds to generate load for
+            concurrency: Number of concurrent users, or the maximum number of
+                calls in flight when a rate is set
+            rate: Target calls per second (closed loop with concurrency users if None)
+
+        Raises:
+            ValueError: If concurrency or rate is not positive
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        if rate is not None and rate <= 0:
+            raise ValueError("rate must be positive")
+        self.client = client
+        self.scenario = scenario
+        self.duration = duration
+        self.concurrency = concurrency
+        self.rate = rate
+        self.report = LoadReport()
+
+    async def run(self) -> LoadReport:
+        """
+        Generate the load.
+
+        Returns:
+            LoadReport: Latencies, throughput, errors and validation failures
+        """
+        start = time.perf_counter()
+        deadline = start + self.duration
+        if self.rate is None:
+            await asyncio.gather(
+                *(self._user(deadline) for _ in range(self.concurrency))
+            )
+        else:
+            await self._open_loop(start, deadline)
+        self.report.duration = time.perf_counter() - start
+        return self.report
+
+    async def _user(self, deadline: float) -> None:
+        while time.perf_counter() < deadline:
+            await self._call(time.perf_counter())
+
+    async def _open_loop(self, start: float, deadline: float) -> None:
+        semaphore = asyncio.Semaphore(self.concurrency)
+        tasks = set()
+        interval = 1 / self.rate
+        scheduled = start
+        while scheduled < deadline:
+            await asyncio.sleep(max(0.0, scheduled - time.perf_counter()))
+            await semaphore.acquire()
+            task = asyncio.create_task(self._call(scheduled))
+            task.add_done_callback(lambda _: semaphore.release())
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+            scheduled += interval
+        await asyncio.gather(*tasks)
+
+    async def _call(self, started: float) -> None:
+        # Latency counts from the scheduled start, so a slow service that
+        # delays later calls is not hidden (coordinated omission)
+        try:
+            await self.scenario(self.client)
+        except ValidationError:
+            self.report.validation_failures += 1
+        except httpx.HTTPError as e:
+            logger.debug(f"Load call failed: {e!r}")
+            self.report.errors += 1
+        self.report.latencies.append(time.perf_counter() - started)
+
+
+async def run_load(
+    base_url: str,
+    scenario: str = "get_post",
+    duration: float = 10.0,
+    concurrency: int = 10,
+    rate: float | None = None,
+) -> LoadReport:
+    """
+    Run a named scenario against a service.
+
+    Args:
+        base_url: URL of the service under load
+        scenario: Name of a scenario in SCENARIOS
+        duration: Seconds to generate load for
+        concurrency: Concurrent users, or maximum calls in flight with a rate
+        rate: Target calls per second (closed loop if None)
+
+    Returns:
+        LoadReport: Outcome of the run
+    """
+    limits = httpx.Limits(
+        max_connections=concurrency, max_keepalive_connections=concurrency
+    )
+    # No retries or circuit breaking, they would hide the errors being measured
+    async with AsyncJsonPlaceholderClient(
+        base_url,
+        limits=limits,
+        log_requests=False,
+        retry_policy=None,
+        circuit_breaker=None,
+    ) as client:
+        runner = LoadRunner(client, SCENARIOS[scenario], duration, concurrency, rate)
+        return await runner.run()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Generate load with the API client and report latency and errors"
+    )
+    parser.add_argument(
+        "--url", help="Service URL (a local stand-in server is started if omitted)"
+    )
+    parser.add_argument("--scenario", choices=sorted(SCENARIOS), default="get_post")
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--rate", type=float, help="Target requests per second")
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    args = parser.parse_args()
+
+    server = None
+    if args.url is None:
+        server = StubServer(JsonPlaceholderStub()).start()
+    try:
+        report = asyncio.run(
+            run_load(
+                args.url or server.url,
+                args.scenario,
+                args.duration,
+                args.concurrency,
+                args.rate,
+            )
+        )
+    finally:
+        if server is not None:
+            server.stop()
+    print(json.dumps(report.to_dict(), indent=2) if args.json else report.summary())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,404 @@
+import json
+import math
+import re
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+
+import httpx
+from allure_commons.types import AttachmentType
+
+from framework.allure_results import write_session_result
+
+# Values are kept with 2^SUB_BUCKET_BITS buckets per power of two, which keeps
+# every recorded latency within 0.8% of its true value
+SUB_BUCKET_BITS = 8
+
+# Path segments replaced by a placeholder, so /posts/1 and /posts/2 share a histogram
+ID_SEGMENT = re.compile(
+    r"^(\d+|[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12})$", re.I
+)
+
+SLA_RULE = re.compile(
+    r"^(?P<method>[A-Z]+)\s+(?P<path>\S+)\s+p(?P<percentile>\d+(?:\.\d+)?)\s*"
+    r"(?P<operator><=|<)\s*(?P<value>\d+(?:\.\d+)?)\s*(?P<unit>ms|s)$"
+)
+
+PERCENTILES = (50, 90, 95, 99)
+# Upper bounds of the exported Prometheus buckets, in seconds
+PROMETHEUS_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+PROMETHEUS_METRIC = "api_request_duration_seconds"
+
+
+def endpoint_key(method: str, url: str | httpx.URL) -> str:
+    """
+    Get the name under which a request's latency is aggregated.
+
+    Args:
+        method: HTTP method
+        url: Requested URL
+
+    Returns:
+        str: Method and path with IDs replaced, e.g. "GET /posts/{id}"
+    """
+    segments = [
+        "{id}" if ID_SEGMENT.match(segment) else segment
+        for segment in httpx.URL(url).path.split("/")
+    ]
+    return f"{method.upper()} {'/'.join(segments) or '/'}"
+
+
+class LatencyHistogram:
+    """
+    HDR-style latency histogram: log-linear buckets with bounded relative
+    error, cheap to record into and to merge across processes.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initialize an empty histogram.
+        """
+        self.counts: dict[int, int] = {}
+        self.count = 0
+        self.total_us = 0
+        self.min_us = 0
+        self.max_us = 0
+
+    @staticmethod
+    def _index(value_us: int) -> int:
+        shift = max(0, value_us.bit_length() - SUB_BUCKET_BITS)
+        return (shift << SUB_BUCKET_BITS) + (value_us >> shift)
+
+    @staticmethod
+    def _highest_value(index: int) -> int:
+        shift, sub_bucket = divmod(index, 1 << SUB_BUCKET_BITS)
+        return ((sub_bucket + 1) << shift) - 1
+
+    def record(self, seconds: float) -> None:
+        """
+        Add a latency.
+
+        Args:
+            seconds: Latency in seconds
+        """
+        value_us = max(0, round(seconds * 1_000_000))
+        index = self._index(value_us)
+        self.counts[index] = self.counts.get(index, 0) + 1
+        self.min_us = value_us if not self.count else min(self.min_us, value_us)
+        self.max_us = max(self.max_us, value_us)
+        self.count += 1
+        self.total_us += value_us
+
+    def percentile(self, pct: float) -> float:
+        """
+        Get a latency percentile.
+
+        Args:
+            pct: Percentile between 0 and 100
+
+        Returns:
+            float: Latency in seconds, rounded up to its bucket (0 if empty)
+        """
+        if not self.count:
+            return 0.0
+        target = max(1, math.ceil(self.count * pct / 100))
+        seen = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if seen >= target:
+                return min(self._highest_value(index), self.max_us) / 1_000_000
+        return self.max_us / 1_000_000
+
+    @property
+    def mean(self) -> float:
+        return self.total_us / self.count / 1_000_000 if self.count else 0.0
+
+    def count_at_most(self, seconds: float) -> int:
+        """
+        Count the latencies that are not above a bound.
+
+        Args:
+            seconds: Upper bound in seconds
+
+        Returns:
+            int: Number of recorded latencies whose bucket lies below the bound
+        """
+        bound_us = seconds * 1_000_000
+        return sum(
+            count
+            for index, count in self.counts.items()
+            if self._highest_value(index) <= bound_us
+        )
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        """
+        Add the latencies of another histogram.
+
+        Args:
+            other: Histogram to add
+        """
+        if not other.count:
+            return
+        for index, count in other.counts.items():
+            self.counts[index] = self.counts.get(index, 0) + count
+        self.min_us = other.min_us if not self.count else min(self.min_us, other.min_us)
+        self.max_us = max(self.max_us, other.max_us)
+        self.count += other.count
+        self.total_us += other.total_us
+
+    def to_dict(self) -> dict:
+        return {
+            "count": self.count,
+            "total_us": self.total_us,
+            "min_us": self.min_us,
+            "max_us": self.max_us,
+            "counts": {str(index): count for index, count in self.counts.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "LatencyHistogram":
+        histogram = cls()
+        histogram.count = data["count"]
+        histogram.total_us = data["total_us"]
+        histogram.min_us = data["min_us"]
+        histogram.max_us = data["max_us"]
+        histogram.counts = {
+            int(index): count for index, count in data["counts"].items()
+        }
+        return histogram
+
+
+@dataclass(frozen=True)
+class SlaRule:
+    """
+    Latency objective of an endpoint, e.g. "GET /posts/{id} p95 < 200ms".
+
+    Attributes:
+        endpoint: Endpoint key as produced by endpoint_key()
+        percentile: Percentile the objective applies to
+        limit: Latency limit in seconds
+        inclusive: Whether the limit itself is allowed ("<=")
+    """
+
+    endpoint: str
+    percentile: float
+    limit: float
+    inclusive: bool = False
+
+    @classmethod
+    def parse(cls, line: str) -> "SlaRule":
+        """
+        Parse a rule written as "<METHOD> <path> p<N> < <value>ms|s".
+
+        Args:
+            line: Rule text
+
+        Returns:
+            SlaRule: Parsed rule
+
+        Raises:
+            ValueError: If the text is not a valid rule
+        """
+        match = SLA_RULE.match(line.strip())
+        if match is None:
+            raise ValueError(
+                f"Invalid SLA rule {line!r}, expected e.g. 'GET /posts/{{id}} p95 < 200ms'"
+            )
+        value = float(match["value"])
+        return cls(
+            endpoint=f"{match['method']} {match['path']}",
+            percentile=float(match["percentile"]),
+            limit=value / 1000 if match["unit"] == "ms" else value,
+            inclusive=match["operator"] == "<=",
+        )
+
+    def __str__(self) -> str:
+        operator = "<=" if self.inclusive else "<"
+        return (
+            f"{self.endpoint} p{self.percentile:g} {operator} {self.limit * 1000:g}ms"
+        )
+
+    def violation(self, histogram: LatencyHistogram) -> str | None:
+        """
+        Check the rule against the latencies of its endpoint.
+
+        Args:
+            histogram: Latencies of the endpoint
+
+        Returns:
+            str | None: Description of the violation, or None if the rule holds
+        """
+        actual = histogram.percentile(self.percentile)
+        ok = actual <= self.limit if self.inclusive else actual < self.limit
+        if ok:
+            return None
+        return f"{self}: measured {actual * 1000:.1f}ms over {histogram.count} requests"
+
+
+class ApiMetrics:
+    """
+    Per-endpoint latency histograms of every API call made in the session.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initialize empty metrics.
+        """
+        self.histograms: dict[str, LatencyHistogram] = {}
+        self._lock = threading.Lock()
+
+    def record(self, method: str, url: str | httpx.URL, seconds: float) -> None:
+        """
+        Add the latency of a call.
+
+        Args:
+            method: HTTP method
+            url: Requested URL
+            seconds: Latency in seconds
+        """
+        key = endpoint_key(method, url)
+        with self._lock:
+            histogram = self.histograms.get(key)
+            if histogram is None:
+                histogram = self.histograms[key] = LatencyHistogram()
+            histogram.record(seconds)
+
+    def merge(self, data: dict) -> None:
+        """
+        Add metrics collected elsewhere, e.g. by an xdist worker.
+
+        Args:
+            data: Metrics as returned by to_dict()
+        """
+        with self._lock:
+            for key, histogram in data.items():
+                self.histograms.setdefault(key, LatencyHistogram()).merge(
+                    LatencyHistogram.from_dict(histogram)
+                )
+
+    def to_dict(self) -> dict:
+        return {key: histogram.to_dict() for key, histogram in self.histograms.items()}
+
+    def check(self, rules: list[SlaRule]) -> list[str]:
+        """
+        Check SLA rules against the recorded latencies. Rules for endpoints
+        that were not called are skipped.
+
+        Args:
+            rules: Rules to check
+
+        Returns:
+            list[str]: Descriptions of the violated rules
+        """
+        violations = []
+        for rule in rules:
+            histogram = self.histograms.get(rule.endpoint)
+            if histogram is not None and (violation := rule.violation(histogram)):
+                violations.append(violation)
+        return violations
+
+    def summary(self) -> str:
+        """
+        Build a table of the latency percentiles per endpoint.
+
+        Returns:
+            str: Multi-line table, latencies in milliseconds
+        """
+        header = f"{'endpoint':<40} {'count':>7} " + " ".join(
+            f"{f'p{pct}':>8}" for pct in PERCENTILES
+        )
+        lines = [header + f" {'max':>8}"]
+        for key in sorted(self.histograms):
+            histogram = self.histograms[key]
+            percentiles = " ".join(
+                f"{histogram.percentile(pct) * 1000:>8.1f}" for pct in PERCENTILES
+            )
+            lines.append(
+                f"{key:<40} {histogram.count:>7} {percentiles} "
+                f"{histogram.max_us / 1000:>8.1f}"
+            )
+        return "\n".join(lines)
+
+    def export_json(self) -> str:
+        """
+        Export the percentiles and raw histograms as JSON.
+
+        Returns:
+            str: JSON document keyed by endpoint
+        """
+        return json.dumps(
+            {
+                key: {
+                    "count": histogram.count,
+                    "mean_ms": round(histogram.mean * 1000, 3),
+                    "max_ms": histogram.max_us / 1000,
+                    **{
+                        f"p{pct}_ms": round(histogram.percentile(pct) * 1000, 3)
+                        for pct in PERCENTILES
+                    },
+                    "histogram": histogram.to_dict(),
+                }
+                for key, histogram in sorted(self.histograms.items())
+            },
+            indent=2,
+        )
+
+    def export_prometheus(self) -> str:
+        """
+        Export the latencies in the Prometheus text exposition format.
+
+        Returns:
+            str: One histogram series per endpoint
+        """
+        lines = [
+            f"# HELP {PROMETHEUS_METRIC} Latency of API requests made by the test suite.",
+            f"# TYPE {PROMETHEUS_METRIC} histogram",
+        ]
+        for key in sorted(self.histograms):
+            histogram = self.histograms[key]
+            method, path = key.split(" ", 1)
+            labels = f'method="{method}",endpoint="{path}"'
+            for bound in PROMETHEUS_BUCKETS:
+                lines.append(
+                    f'{PROMETHEUS_METRIC}_bucket{{{labels},le="{bound:g}"}} '
+                    f"{histogram.count_at_most(bound)}"
+                )
+            lines.append(
+                f'{PROMETHEUS_METRIC}_bucket{{{labels},le="+Inf"}} {histogram.count}'
+            )
+            lines.append(
+                f"{PROMETHEUS_METRIC}_sum{{{labels}}} {histogram.total_us / 1_000_000:g}"
+            )
+            lines.append(f"{PROMETHEUS_METRIC}_count{{{labels}}} {histogram.count}")
+        return "\n".join(lines) + "\n"
+
+    def write_allure_result(
+        self, report_dir: str | Path, rules: list[SlaRule], violations: list[str]
+    ) -> None:
+        """
+        Add a result named "API latency SLA" to an Allure results directory,
+        failed if any rule was violated, with the latency table and exports
+        attached.
+
+        Args:
+            report_dir: Allure results directory
+            rules: Checked SLA rules
+            violations: Violated rules as returned by check()
+        """
+        checked = "\n".join(str(rule) for rule in rules) or "No SLA rules configured"
+        write_session_result(
+            report_dir,
+            name="API latency SLA",
+            description=f"Checked rules:\n{checked}",
+            attachments=[
+                ("Latency percentiles (ms)", self.summary(), AttachmentType.TEXT),
+                ("Latency histograms", self.export_json(), AttachmentType.JSON),
+                ("Prometheus metrics", self.export_prometheus(), AttachmentType.TEXT),
+            ],
+            violations=violations,
+            parent_suite="API Tests",
+            feature="Latency SLA",
+        )
+
+
+api_metrics = ApiMetrics()
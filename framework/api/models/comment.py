@@ -0,0 +1,28 @@
+from pydantic import BaseModel, Field, ConfigDict
+
+
+class Comment(BaseModel):
+    """
+    Model representing a comment from JSONPlaceholder API.
+
+    Attributes:
+        post_id: The ID of the post the comment belongs to
+        id: The ID of the comment
+        name: The title of the comment
+        email: The email of the comment author
+        body: The content of the comment
+    """
+
+    model_config = ConfigDict(
+        populate_by_name=True,
+        extra="forbid",
+        strict=True,
+    )
+
+    post_id: int = Field(
+        alias="postId", description="ID of the post the comment belongs to"
+    )
+    id: int = Field(description="Unique identifier for the comment")
+    name: str = Field(description="Title of the comment")
+    email: str = Field(description="Email of the comment author")
+    body: str = Field(description="Content of the comment")
@@ -0,0 +1,24 @@
+from pydantic import BaseModel, Field, ConfigDict
+
+
+class Todo(BaseModel):
+    """
+    Model representing a todo from JSONPlaceholder API.
+
+    Attributes:
+        user_id: The ID of the user who owns the todo
+        id: The ID of the todo
+        title: The title of the todo
+        completed: Whether the todo is done
+    """
+
+    model_config = ConfigDict(
+        populate_by_name=True,
+        extra="forbid",
+        strict=True,
+    )
+
+    user_id: int = Field(alias="userId", description="ID of the user who owns the todo")
+    id: int = Field(description="Unique identifier for the todo")
+    title: str = Field(description="Title of the todo")
+    completed: bool = Field(description="Whether the todo is done")
@@ -0,0 +1,87 @@
+from pydantic import BaseModel, Field, ConfigDict
+
+MODEL_CONFIG = ConfigDict(
+    populate_by_name=True,
+    extra="forbid",
+    strict=True,
+)
+
+
+class Geo(BaseModel):
+    """
+    Model representing the coordinates of an address.
+
+    Attributes:
+        lat: Latitude
+        lng: Longitude
+    """
+
+    model_config = MODEL_CONFIG
+
+    lat: str = Field(description="Latitude")
+    lng: str = Field(description="Longitude")
+
+
+class Address(BaseModel):
+    """
+    Model representing the address of a user.
+
+    Attributes:
+        street: Street name
+        suite: Apartment or suite
+        city: City name
+        zipcode: Postal code
+        geo: Coordinates of the address
+    """
+
+    model_config = MODEL_CONFIG
+
+    street: str = Field(description="Street name")
+    suite: str = Field(description="Apartment or suite")
+    city: str = Field(description="City name")
+    zipcode: str = Field(description="Postal code")
+    geo: Geo = Field(description="Coordinates of the address")
+
+
+class Company(BaseModel):
+    """
+    Model representing the company of a user.
+
+    Attributes:
+        name: Company name
+        catch_phrase: Company slogan
+        bs: Company business description
+    """
+
+    model_config = MODEL_CONFIG
+
+    name: str = Field(description="Company name")
+    catch_phrase: str = Field(alias="catchPhrase", description="Company slogan")
+    bs: str = Field(description="Company business description")
+
+
+class User(BaseModel):
+    """
+    Model representing a user from JSONPlaceholder API.
+
+    Attributes:
+        id: The ID of the user
+        name: Full name
+        username: Login name
+        email: Email address
+        address: Postal address
+        phone: Phone number
+        website: Personal website
+        company: Employer
+    """
+
+    model_config = MODEL_CONFIG
+
+    id: int = Field(description="Unique identifier for the user")
+    name: str = Field(description="Full name of the user")
+    username: str = Field(description="Login name of the user")
+    email: str = Field(description="Email address of the user")
+    address: Address = Field(description="Postal address of the user")
+    phone: str = Field(description="Phone number of the user")
+    website: str = Field(description="Personal website of the user")
+    company: Company = Field(description="Employer of the user")
@@ -0,0 +1,218 @@
+import re
+from dataclasses import dataclass, field
+from typing import Generic, Iterable, Iterator, TypeVar
+
+from pydantic import BaseModel, TypeAdapter, ValidationError
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+STRING = rb'"[^"\\]*+(?:\\.[^"\\]*+)*+"'
+# An item without nested objects or arrays, followed by its separator. Flat
+# items are matched in one regex call, nested ones are scanned token by token
+FLAT_ITEM = re.compile(
+    rb"\s*+("
+    rb"\{(?:[^{}\[\]\"]++|" + STRING + rb")*+\}"
+    rb"|\[(?:[^{}\[\]\"]++|" + STRING + rb")*+\]"
+    rb"|" + STRING + rb"|[^\s,\[\]{}\"]++"
+    rb")\s*+([,\]])"
+)
+# A bare quote only matches a string that is not terminated yet
+TOKEN = re.compile(STRING + rb'|[\[{]|[\]}]|"')
+SEPARATOR = re.compile(rb"\s*+([,\]])")
+ARRAY_START = re.compile(rb"\s*+\[")
+ARRAY_END = re.compile(rb"\s*+\]")
+
+
+@dataclass
+class ItemError:
+    """
+    An array item that failed validation.
+
+    Attributes:
+        index: Position of the item in the array
+        raw: Raw JSON of the item
+        error: Validation error raised for the item
+    """
+
+    index: int
+    raw: bytes
+    error: ValidationError
+
+
+@dataclass
+class ValidatedItems(Generic[ModelT]):
+    """
+    Result of validating the items of a JSON array.
+
+    Attributes:
+        items: Items that passed validation
+        errors: Items that failed validation
+    """
+
+    items: list[ModelT] = field(default_factory=list)
+    errors: list[ItemError] = field(default_factory=list)
+
+
+class JsonArraySplitter:
+    """
+    Splits a top-level JSON array into the raw bytes of its items as the
+    document arrives in chunks, keeping only the unfinished item in memory.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initialize the splitter.
+        """
+        self.buffer = b""
+        self.started = False
+        self.closed = False
+        self._first = True
+
+    def feed(self, chunk: bytes) -> list[bytes]:
+        """
+        Consume the next chunk of the document.
+
+        Args:
+            chunk: Next bytes of the document
+
+        Returns:
+            list[bytes]: Items completed by this chunk
+
+        Raises:
+            ValueError: If the document is not a JSON array
+        """
+        buffer = self.buffer + chunk
+        if self.closed:
+            self._check_trailing(buffer)
+            return []
+
+        pos = 0
+        if not self.started:
+            if not buffer.strip():
+                self.buffer = b""
+                return []
+            match = ARRAY_START.match(buffer)
+            if match is None:
+                raise ValueError("Expected a JSON array")
+            self.started = True
+            pos = match.end()
+
+        items = []
+        while True:
+            if self._first and (match := ARRAY_END.match(buffer, pos)):
+                self._close(buffer, match.end())
+                return items
+            if match := FLAT_ITEM.match(buffer, pos):
+                item, separator, end = match[1], match[2], match.end()
+            elif found := self._scan_nested(buffer, pos):
+                item, separator, end = found
+            else:
+                break
+            items.append(item)
+            self._first = False
+            if separator == b"]":
+                self._close(buffer, end)
+                return items
+            pos = end
+
+        self.buffer = buffer[pos:]
+        return items
+
+    @staticmethod
+    def _scan_nested(buffer: bytes, pos: int) -> tuple[bytes, bytes, int] | None:
+        start = len(buffer) - len(buffer[pos:].lstrip())
+        if start == len(buffer) or buffer[start] not in b"[{":
+            return None
+        depth = 0
+        for match in TOKEN.finditer(buffer, start):
+            token = match[0]
+            if token in (b"[", b"{"):
+                depth += 1
+            elif token in (b"]", b"}"):
+                depth -= 1
+                if depth == 0:
+                    separator = SEPARATOR.match(buffer, match.end())
+                    if separator is None:
+                        return None
+                    return buffer[start : match.end()], separator[1], separator.end()
+            elif token == b'"':
+                return None
+        return None
+
+    def _close(self, buffer: bytes, end: int) -> None:
+        self.closed = True
+        self.buffer = b""
+        self._check_trailing(buffer[end:])
+
+    @staticmethod
+    def _check_trailing(data: bytes) -> None:
+        if data.strip():
+            raise ValueError("Unexpected data after the end of the JSON array")
+
+    def close(self) -> None:
+        """
+        Check that the whole array has been consumed.
+
+        Raises:
+            ValueError: If the document ended before the array was closed
+        """
+        if not self.closed:
+            raise ValueError("JSON array ended unexpectedly")
+
+
+def iter_json_array(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    """
+    Yield the raw bytes of each item of a JSON array delivered in chunks.
+
+    Args:
+        chunks: Chunks of the document, e.g. response.iter_bytes()
+
+    Yields:
+        bytes: Raw JSON of each item
+
+    Raises:
+        ValueError: If the document is not a complete JSON array
+    """
+    splitter = JsonArraySplitter()
+    for chunk in chunks:
+        yield from splitter.feed(chunk)
+    splitter.close()
+
+
+def validate_items(
+    chunks: Iterable[bytes], model: type[ModelT]
+) -> Iterator[ModelT | ItemError]:
+    """
+    Validate the items of a JSON array as the chunks arrive.
+
+    The items completed by each chunk are validated together as a list; only
+    a batch that fails is validated again item by item to find the bad ones.
+
+    Args:
+        chunks: Chunks of the document
+        model: Pydantic model every item should match
+
+    Yields:
+        ModelT | ItemError: Validated item, or the error for an invalid one
+
+    Raises:
+        ValueError: If the document is not a complete JSON array
+    """
+    item_adapter = TypeAdapter(model)
+    batch_adapter = TypeAdapter(list[model])
+    splitter = JsonArraySplitter()
+    index = 0
+    for chunk in chunks:
+        batch = splitter.feed(chunk)
+        if not batch:
+            continue
+        try:
+            yield from batch_adapter.validate_json(b"[" + b",".join(batch) + b"]")
+        except ValidationError:
+            for offset, raw in enumerate(batch):
+                try:
+                    yield item_adapter.validate_json(raw)
+                except ValidationError as e:
+                    yield ItemError(index + offset, raw, e)
+        index += len(batch)
+    splitter.close()
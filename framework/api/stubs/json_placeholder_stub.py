@@ -0,0 +1,235 @@
+import hashlib
+import json
+import random
+import re
+from collections import deque
+from http import HTTPStatus
+
+import httpx
+from faker import Faker
+
+USERS_COUNT = 10
+POSTS_PER_USER = 10
+COMMENTS_PER_POST = 5
+TODOS_PER_USER = 20
+
+# Caching headers of the real service
+CACHE_CONTROL = "max-age=43200"
+
+# Status codes of randomly injected faults
+FAULT_STATUSES = (
+    HTTPStatus.BAD_GATEWAY,
+    HTTPStatus.SERVICE_UNAVAILABLE,
+    HTTPStatus.GATEWAY_TIMEOUT,
+)
+
+Fault = HTTPStatus | type[httpx.TransportError]
+
+ITEM_PATH = re.compile(r"^/(?P<resource>\w+)/(?P<item_id>\d+)/?$")
+COLLECTION_PATH = re.compile(r"^/(?P<resource>\w+)/?$")
+
+
+class JsonPlaceholderStub:
+    """
+    In-process stand-in for the JSONPlaceholder API.
+
+    Serves the same resources, status codes and response shapes as the real
+    service from deterministic fake data, so the API suite can run offline
+    through ``httpx.MockTransport``.
+
+    Faults can be injected to exercise retries and circuit breaking: queued
+    ones with inject_faults(), and random ones with fault_rate.
+    """
+
+    def __init__(self, seed: int = 0, fault_rate: float = 0.0) -> None:
+        """
+        Initialize the stub and generate its data.
+
+        Args:
+            seed: Seed for the fake data generator and the random faults
+            fault_rate: Share of requests answered with a 502, 503 or 504
+        """
+        self.fault_rate = fault_rate
+        self.faults: deque[Fault] = deque()
+        self._fault_random = random.Random(seed)
+        self.fake = Faker("en_US")
+        self.fake.seed_instance(seed)
+        self.resources: dict[str, list[dict]] = {
+            "posts": self._generate_posts(),
+        }
+        self.resources["comments"] = self._generate_comments()
+        self.resources["users"] = self._generate_users()
+        self.resources["todos"] = self._generate_todos()
+
+    def _generate_posts(self) -> list[dict]:
+        return [
+            {
+                "userId": user_id,
+                "id": (user_id - 1) * POSTS_PER_USER + index,
+                "title": self.fake.sentence(nb_words=6).rstrip(".").lower(),
+                "body": "\n".join(
+                    self.fake.sentence(nb_words=10).rstrip(".").lower()
+                    for _ in range(4)
+                ),
+            }
+            for user_id in range(1, USERS_COUNT + 1)
+            for index in range(1, POSTS_PER_USER + 1)
+        ]
+
+    def _generate_comments(self) -> list[dict]:
+        return [
+            {
+                "postId": post["id"],
+                "id": (post["id"] - 1) * COMMENTS_PER_POST + index,
+                "name": self.fake.sentence(nb_words=5).rstrip(".").lower(),
+                "email": self.fake.email(),
+                "body": "\n".join(
+                    self.fake.sentence(nb_words=8).rstrip(".").lower() for _ in range(3)
+                ),
+            }
+            for post in self.resources["posts"]
+            for index in range(1, COMMENTS_PER_POST + 1)
+        ]
+
+    def _generate_users(self) -> list[dict]:
+        return [
+            {
+                "id": user_id,
+                "name": self.fake.name(),
+                "username": self.fake.user_name(),
+                "email": self.fake.email(),
+                "address": {
+                    "street": self.fake.street_name(),
+                    "suite": self.fake.secondary_address(),
+                    "city": self.fake.city(),
+                    "zipcode": self.fake.zipcode(),
+                    "geo": {
+                        "lat": str(self.fake.latitude()),
+                        "lng": str(self.fake.longitude()),
+                    },
+                },
+                "phone": self.fake.phone_number(),
+                "website": self.fake.domain_name(),
+                "company": {
+                    "name": self.fake.company(),
+                    "catchPhrase": self.fake.catch_phrase(),
+                    "bs": self.fake.bs(),
+                },
+            }
+            for user_id in range(1, USERS_COUNT + 1)
+        ]
+
+    def _generate_todos(self) -> list[dict]:
+        return [
+            {
+                "userId": user_id,
+                "id": (user_id - 1) * TODOS_PER_USER + index,
+                "title": self.fake.sentence(nb_words=4).rstrip(".").lower(),
+                "completed": self.fake.boolean(),
+            }
+            for user_id in range(1, USERS_COUNT + 1)
+            for index in range(1, TODOS_PER_USER + 1)
+        ]
+
+    def transport(self) -> httpx.MockTransport:
+        """
+        Create a transport that routes client requests to the stub.
+
+        Returns:
+            httpx.MockTransport: Transport to pass to an httpx client
+        """
+        return httpx.MockTransport(self.handle)
+
+    def inject_faults(self, *faults: Fault) -> None:
+        """
+        Queue faults for the next requests, one per request.
+
+        Args:
+            *faults: Status code to answer with, or transport error to raise,
+                e.g. HTTPStatus.SERVICE_UNAVAILABLE or httpx.ReadTimeout
+        """
+        self.faults.extend(faults)
+
+    def _next_fault(self) -> Fault | None:
+        try:
+            return self.faults.popleft()
+        except IndexError:
+            pass
+        if self.fault_rate and self._fault_random.random() < self.fault_rate:
+            return self._fault_random.choice(FAULT_STATUSES)
+        return None
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        """
+        Handle a single request.
+
+        Args:
+            request: Incoming request
+
+        Returns:
+            httpx.Response: Response mirroring the real service
+
+        Raises:
+            httpx.TransportError: If a transport error was injected for the request
+        """
+        fault = self._next_fault()
+        if isinstance(fault, type):
+            raise fault("Injected fault", request=request)
+        if fault is not None:
+            return self._json_response(fault, {})
+
+        if request.method != "GET":
+            return self._json_response(HTTPStatus.METHOD_NOT_ALLOWED, {})
+
+        path = request.url.path
+        if match := ITEM_PATH.match(path):
+            response = self._get_item(match["resource"], int(match["item_id"]))
+        elif match := COLLECTION_PATH.match(path):
+            response = self._list_items(match["resource"], request.url.params)
+        else:
+            response = self._json_response(HTTPStatus.NOT_FOUND, {})
+        return self._conditional(request, response)
+
+    @staticmethod
+    def _conditional(
+        request: httpx.Request, response: httpx.Response
+    ) -> httpx.Response:
+        # Answers revalidation requests like the real service does
+        etag = response.headers.get("ETag")
+        if etag is None or request.headers.get("If-None-Match") != etag:
+            return response
+        return httpx.Response(
+            HTTPStatus.NOT_MODIFIED,
+            stream=httpx.ByteStream(b""),
+            headers={"ETag": etag, "Cache-Control": CACHE_CONTROL},
+        )
+
+    def _get_item(self, resource: str, item_id: int) -> httpx.Response:
+        for item in self.resources.get(resource, []):
+            if item["id"] == item_id:
+                return self._json_response(HTTPStatus.OK, item)
+        return self._json_response(HTTPStatus.NOT_FOUND, {})
+
+    def _list_items(self, resource: str, params: httpx.QueryParams) -> httpx.Response:
+        if resource not in self.resources:
+            return self._json_response(HTTPStatus.NOT_FOUND, {})
+        items = [
+            item
+            for item in self.resources[resource]
+            if all(str(item.get(field)) == value for field, value in params.items())
+        ]
+        return self._json_response(HTTPStatus.OK, items)
+
+    @staticmethod
+    def _json_response(status: HTTPStatus, data: dict | list) -> httpx.Response:
+        content = json.dumps(data, indent=2).encode()
+        headers = {
+            "Content-Type": "application/json; charset=utf-8",
+            "Content-Length": str(len(content)),
+        }
+        if status == HTTPStatus.OK:
+            headers["Cache-Control"] = CACHE_CONTROL
+            headers["ETag"] = f'W/"{hashlib.sha1(content).hexdigest()}"'
+        # Served as a stream so httpx reads and closes it like a network
+        # response, which is what sets response.elapsed
+        return httpx.Response(status, stream=httpx.ByteStream(content), headers=headers)
@@ -0,0 +1,127 @@
+import argparse
+import logging
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+
+from framework.api.stubs.json_placeholder_stub import JsonPlaceholderStub
+
+logger = logging.getLogger(__name__)
+
+
+class StubServer:
+    """
+    Serves a stub over real HTTP on a local port, for clients that need a
+    network server instead of an in-process transport, e.g. load tests.
+    """
+
+    def __init__(
+        self, stub: JsonPlaceholderStub, host: str = "127.0.0.1", port: int = 0
+    ) -> None:
+        """
+        Initialize the server.
+
+        Args:
+            stub: Stub that answers the requests
+            host: Interface to listen on
+            port: Port to listen on (a free port is picked if 0)
+        """
+        self.stub = stub
+        self.httpd = ThreadingHTTPServer((host, port), self._handler_class())
+        self.httpd.daemon_threads = True
+        self._thread: threading.Thread | None = None
+
+    @property
+    def url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def _handler_class(self) -> type[BaseHTTPRequestHandler]:
+        stub = self.stub
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            # Headers and body go out in separate writes; without TCP_NODELAY
+            # delayed ACKs add ~40ms to every response
+            disable_nagle_algorithm = True
+
+            def respond(self) -> None:
+                length = int(self.headers.get("Content-Length") or 0)
+                request = httpx.Request(
+                    self.command,
+                    f"http://{self.headers.get('Host', 'localhost')}{self.path}",
+                    headers=list(self.headers.items()),
+                    content=self.rfile.read(length) if length else b"",
+                )
+                try:
+                    response = stub.handle(request)
+                except httpx.TransportError:
+                    # Injected transport faults drop the connection
+                    self.close_connection = True
+                    return
+                body = response.read()
+                self.send_response(response.status_code)
+                for name, value in response.headers.items():
+                    if name.lower() != "content-length":
+                        self.send_header(name, value)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                if self.command != "HEAD":
+                    self.wfile.write(body)
+
+            do_GET = do_HEAD = do_POST = do_PUT = do_PATCH = do_DELETE = respond
+
+            def log_message(self, format: str, *args) -> None:
+                logger.debug(format % args)
+
+        return Handler
+
+    def start(self) -> "StubServer":
+        """
+        Start serving in a background thread.
+
+        Returns:
+            StubServer: The started server
+        """
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self._thread.start()
+        logger.info(f"Stub server listening on {self.url}")
+        return self
+
+    def stop(self) -> None:
+        """
+        Stop serving and release the port.
+        """
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self) -> "StubServer":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Serve the JSONPlaceholder stand-in over HTTP"
+    )
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    args = parser.parse_args()
+
+    server = StubServer(JsonPlaceholderStub(), args.host, args.port)
+    print(f"Serving the JSONPlaceholder stand-in on {server.url}")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.httpd.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+import os
+
+
+def env_bool(name: str, default: bool) -> bool:
+    """
+    Read a boolean flag from the environment.
+
+    Args:
+        name: Environment variable name
+        default: Value to use when the variable is not set
+
+    Returns:
+        bool: True for "1", "true", "yes" or "on" (case-insensitive)
+    """
+    value = os.getenv(name)
+    if value is None:
+        return default
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
+HEADLESS = env_bool("HEADLESS", True)
+# Launch Chrome with the flags that skip first-run, update and background work.
+# Off until benchmarks.bench_startup shows they shorten the launch
+CHROME_STARTUP_FLAGS = env_bool("CHROME_STARTUP_FLAGS", False)
+# Give every browser a copy of a profile prepared once per session. Off until
+# benchmarks.bench_startup shows the warm-up launch and the copies pay off
+CHROME_PROFILE_TEMPLATE = env_bool("CHROME_PROFILE_TEMPLATE", False)
+
+DRIVER_POOL_ENABLED = env_bool("DRIVER_POOL_ENABLED", True)
+DRIVER_POOL_SIZE = int(os.getenv("DRIVER_POOL_SIZE", "1"))
+# Run the UI tests of a session (or xdist worker) in tabs of one browser, each
+# in a browser context of its own, instead of a browser per test. Saves memory
+# only for tests running in threads, every xdist worker keeps its own browser
+BROWSER_TABS = env_bool("BROWSER_TABS", False)
+
+FAST_LOGIN = env_bool("FAST_LOGIN", True)
+
+# Trace page object actions: per-test time breakdown and slowest locators
+TRACE_ACTIONS = env_bool("TRACE_ACTIONS", True)
+
+# WebDriver commands a UI test may send before it fails (0 disables the
+# budget), and the JSON file the command counts are exported to
+COMMAND_BUDGET = int(os.getenv("COMMAND_BUDGET", "0"))
+COMMAND_LOG_FILE = os.getenv("COMMAND_LOG_FILE", "")
+
+# Collect navigation, paint, resource and long task timing of page objects. Off by
+# default: it adds a script call before every page object action
+PAGE_TIMING = env_bool("PAGE_TIMING", False)
+# JSON file that keeps the page timing summaries of past runs (not written if empty)
+PAGE_TIMING_TREND_FILE = os.getenv("PAGE_TIMING_TREND_FILE", "")
+
+# Requests the browser does not send: comma separated URL patterns with "*"
+# wildcards, resource types (image, font, media, stylesheet) and analytics
+BLOCKED_URLS = os.getenv("BLOCKED_URLS", "")
+BLOCKED_RESOURCE_TYPES = os.getenv("BLOCKED_RESOURCE_TYPES", "image,font,media")
+STUB_ANALYTICS = env_bool("STUB_ANALYTICS", True)
+# Report requests and bytes per test from the Chrome performance log
+NETWORK_STATS = env_bool("NETWORK_STATS", True)
+# JSON file that keeps resource sizes between runs, to estimate the bytes
+# blocked requests saved (memory only if empty)
+RESOURCE_SIZES_FILE = os.getenv("RESOURCE_SIZES_FILE", "")
+
+# Base URL of the site under UI test, e.g. https://www.saucedemo.com/ (the
+# bundled replica is served locally if empty)
+SAUCEDEMO_URL = os.getenv("SAUCEDEMO_URL", "")
+
+# "polling" (WebDriverWait) or "mutation" (MutationObserver based waits)
+WAIT_STRATEGY = os.getenv("WAIT_STRATEGY", "polling")
+
+# Poll with exponential back-off tuned by per-locator wait statistics
+ADAPTIVE_WAITS = env_bool("ADAPTIVE_WAITS", False)
+# JSON file that keeps wait statistics between runs (not persisted if empty)
+WAIT_STATS_FILE = os.getenv("WAIT_STATS_FILE", "")
+
+# "stub" serves the API suite from the bundled in-process stand-in, "live" uses
+# the real service
+API_TARGET = os.getenv("API_TARGET", "stub")
+JSON_PLACEHOLDER_URL = os.getenv(
+    "JSON_PLACEHOLDER_URL", "https://jsonplaceholder.typicode.com"
+)
+
+# Connection settings of the API clients, timeouts in seconds
+API_TIMEOUT = float(os.getenv("API_TIMEOUT", "5.0"))
+API_CONNECT_TIMEOUT = float(os.getenv("API_CONNECT_TIMEOUT", "5.0"))
+API_MAX_CONNECTIONS = int(os.getenv("API_MAX_CONNECTIONS", "100"))
+API_MAX_KEEPALIVE_CONNECTIONS = int(os.getenv("API_MAX_KEEPALIVE_CONNECTIONS", "20"))
+# Idle connections are kept open this long, long enough to span a test session
+API_KEEPALIVE_EXPIRY = float(os.getenv("API_KEEPALIVE_EXPIRY", "30.0"))
+# Multiplex requests over HTTP/2 connections (needs the h2 package)
+API_HTTP2 = env_bool("API_HTTP2", False)
+
+# Load test mode: seconds to run, concurrent users and target requests per
+# second (closed loop with LOAD_CONCURRENCY users if empty)
+LOAD_DURATION = float(os.getenv("LOAD_DURATION", "10"))
+LOAD_CONCURRENCY = int(os.getenv("LOAD_CONCURRENCY", "10"))
+LOAD_RATE = float(os.getenv("LOAD_RATE")) if os.getenv("LOAD_RATE") else None
+
+# Allure attachments for API calls: "off", "on-failure" or "always"
+API_ATTACHMENTS = os.getenv("API_ATTACHMENTS", "on-failure")
+# Size limit for attached bodies in bytes (0 disables truncation)
+API_ATTACHMENT_MAX_BYTES = int(os.getenv("API_ATTACHMENT_MAX_BYTES", "16384"))
+# Share of successful calls attached, error responses are always attached
+API_ATTACHMENT_SAMPLE_RATE = float(os.getenv("API_ATTACHMENT_SAMPLE_RATE", "1.0"))
+
+# Cache GET responses following Cache-Control and ETag headers
+API_CACHE = env_bool("API_CACHE", False)
+API_CACHE_SIZE = int(os.getenv("API_CACHE_SIZE", "256"))
+# Directory that keeps cached responses between runs (memory only if empty)
+API_CACHE_DIR = os.getenv("API_CACHE_DIR", "")
+
+# Files the per-endpoint API latency histograms are exported to after a run
+# (not exported if empty)
+API_METRICS_JSON = os.getenv("API_METRICS_JSON", "")
+API_METRICS_PROMETHEUS = os.getenv("API_METRICS_PROMETHEUS", "")
+
+# Retries of idempotent API requests after a transport error or a 502/503/504
+# (or 429), with jittered exponential back-off in seconds
+API_RETRIES = int(os.getenv("API_RETRIES", "2"))
+API_RETRY_BACKOFF = float(os.getenv("API_RETRY_BACKOFF", "0.1"))
+API_RETRY_MAX_BACKOFF = float(os.getenv("API_RETRY_MAX_BACKOFF", "2.0"))
+# Consecutive failures after which requests to a host fail fast (0 disables),
+# and seconds before a trial request is let through again
+API_CIRCUIT_BREAKER_THRESHOLD = int(os.getenv("API_CIRCUIT_BREAKER_THRESHOLD", "5"))
+API_CIRCUIT_BREAKER_RESET = float(os.getenv("API_CIRCUIT_BREAKER_RESET", "30.0"))
+# Share of requests the bundled stand-in answers with a 502/503/504
+API_STUB_FAULT_RATE = float(os.getenv("API_STUB_FAULT_RATE", "0.0"))
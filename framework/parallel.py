@@ -0,0 +1,158 @@
+import json
+import logging
+import os
+import shutil
+from pathlib import Path
+
+import pytest
+
+logger = logging.getLogger(__name__)
+
+CONTROLLER_ID = "master"
+
+DURATIONS_FILE = Path(".test_durations.json")
+
+# Expected duration in seconds of a test that has no recorded history yet
+DEFAULT_WEIGHTS = {
+    "ui": 30.0,
+    "api": 1.0,
+}
+FALLBACK_WEIGHT = 5.0
+
+
+def get_worker_id() -> str:
+    """
+    Get the id of the current pytest-xdist worker.
+
+    Returns:
+        str: Worker id (e.g. "gw0") or "master" when not running under xdist
+    """
+    return os.getenv("PYTEST_XDIST_WORKER", CONTROLLER_ID)
+
+
+def is_xdist_worker(config: pytest.Config) -> bool:
+    """Check whether the config belongs to a pytest-xdist worker process."""
+    return hasattr(config, "workerinput")
+
+
+def worker_results_dir(base_dir: str | Path, worker_id: str) -> Path:
+    """
+    Get the Allure results directory reserved for a worker.
+
+    Args:
+        base_dir: Allure results directory passed with --alluredir
+        worker_id: Worker id
+
+    Returns:
+        Path: Directory that only this worker writes to
+    """
+    return Path(base_dir) / f"worker-{worker_id}"
+
+
+def merge_worker_results(base_dir: str | Path) -> int:
+    """
+    Move the results of all workers into the main Allure results directory.
+
+    Args:
+        base_dir: Allure results directory passed with --alluredir
+
+    Returns:
+        int: Number of files moved
+    """
+    base_dir = Path(base_dir)
+    moved = 0
+    for worker_dir in base_dir.glob("worker-*"):
+        if not worker_dir.is_dir():
+            continue
+        for result_file in worker_dir.iterdir():
+            shutil.move(str(result_file), base_dir / result_file.name)
+            moved += 1
+        worker_dir.rmdir()
+    logger.info(f"Merged {moved} worker result files into {base_dir}")
+    return moved
+
+
+def load_durations(path: Path = DURATIONS_FILE) -> dict[str, float]:
+    """
+    Load test durations recorded by previous runs.
+
+    Args:
+        path: Durations file
+
+    Returns:
+        dict[str, float]: Mapping of test node id to duration in seconds
+    """
+    try:
+        return json.loads(path.read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+def save_durations(durations: dict[str, float], path: Path = DURATIONS_FILE) -> None:
+    """
+    Merge new test durations into the durations file.
+
+    Args:
+        durations: Mapping of test node id to duration in seconds
+        path: Durations file
+    """
+    merged = load_durations(path)
+    merged.update(durations)
+    path.write_text(json.dumps(merged, indent=2, sort_keys=True))
+
+
+def estimate_weight(item: pytest.Item, durations: dict[str, float]) -> float:
+    """
+    Estimate how long a test will take.
+
+    Args:
+        item: Collected test item
+        durations: Durations recorded by previous runs
+
+    Returns:
+        float: Recorded duration, or a default based on the test markers
+    """
+    if item.nodeid in durations:
+        return durations[item.nodeid]
+    for marker, weight in DEFAULT_WEIGHTS.items():
+        if item.get_closest_marker(marker):
+            return weight
+    return FALLBACK_WEIGHT
+
+
+def order_by_weight(
+    items: list[pytest.Item], durations: dict[str, float]
+) -> list[pytest.Item]:
+    """
+    Order tests longest first.
+
+    With ``--dist load`` xdist hands tests out in collection order, so sending
+    the heaviest tests first approximates longest-processing-time-first
+    scheduling and keeps a long UI test from starting last.
+
+    Args:
+        items: Collected test items
+        durations: Durations recorded by previous runs
+
+    Returns:
+        list[pytest.Item]: Items sorted by descending weight (stable)
+    """
+    return sorted(
+        items, key=lambda item: estimate_weight(item, durations), reverse=True
+    )
+
+
+class DurationRecorder:
+    """
+    Pytest plugin that adds up setup, call and teardown durations per test.
+
+    On the xdist controller it receives the reports of all workers.
+    """
+
+    def __init__(self) -> None:
+        self.durations: dict[str, float] = {}
+
+    def pytest_runtest_logreport(self, report: pytest.TestReport) -> None:
+        self.durations[report.nodeid] = (
+            self.durations.get(report.nodeid, 0.0) + report.duration
+        )
@@ -0,0 +1,106 @@
+import threading
+from typing import Generic, Hashable, Iterable, Sequence, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+
+# A value is flagged as slower when its p95 grows by this factor compared to
+# earlier runs
+SLOWDOWN_FACTOR = 1.5
+
+
+def percentile(samples: Sequence[float], percent: float) -> float | None:
+    """
+    Get a percentile of samples, rounded to the nearest sample.
+
+    Args:
+        samples: Measured values in any order
+        percent: Percentile between 0 and 100
+
+    Returns:
+        float | None: Value of the sample at the percentile, or None without samples
+    """
+    if not samples:
+        return None
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(percent / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def slowed_down(before: float | None, current: float | None) -> bool:
+    """
+    Check whether a p95 grew by more than SLOWDOWN_FACTOR.
+
+    Args:
+        before: Value of earlier runs (never flagged if None or 0)
+        current: Value of this run
+
+    Returns:
+        bool: Whether the value got slower
+    """
+    return bool(before) and current is not None and current > before * SLOWDOWN_FACTOR
+
+
+class SampleStore(Generic[K]):
+    """
+    Most recent samples per key, safe to record from several threads.
+    """
+
+    def __init__(self, max_samples: int) -> None:
+        """
+        Initialize the store.
+
+        Args:
+            max_samples: Samples kept per key; the oldest are dropped first
+        """
+        self.max_samples = max_samples
+        self.samples: dict[K, list[float]] = {}
+        self._lock = threading.Lock()
+
+    def add(self, key: K, value: float) -> None:
+        """
+        Record a sample.
+
+        Args:
+            key: Key the sample belongs to
+            value: Measured value
+        """
+        self.extend(key, (value,))
+
+    def extend(self, key: K, values: Iterable[float]) -> None:
+        """
+        Record several samples of a key.
+
+        Args:
+            key: Key the samples belong to
+            values: Measured values, oldest first
+        """
+        with self._lock:
+            samples = self.samples.setdefault(key, [])
+            samples.extend(values)
+            del samples[: -self.max_samples]
+
+    def merge(self, samples: dict[K, list[float]]) -> None:
+        """
+        Add samples recorded elsewhere, e.g. by an xdist worker.
+
+        Args:
+            samples: Samples by key, oldest first
+        """
+        for key, values in samples.items():
+            self.extend(key, values)
+
+    def percentile(self, key: K, percent: float) -> float | None:
+        """
+        Get a percentile of the samples of a key.
+
+        Args:
+            key: Key of the samples
+            percent: Percentile between 0 and 100
+
+        Returns:
+            float | None: Value, or None without samples
+        """
+        return percentile(self.samples.get(key, ()), percent)
+
+    def __bool__(self) -> bool:
+        return bool(self.samples)
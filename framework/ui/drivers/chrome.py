@@ -0,0 +1,123 @@
+import shutil
+import weakref
+from pathlib import Path
+
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from framework import config
+from framework.ui.drivers.commands import instrument
+from framework.ui.drivers.network import ResourcePolicy
+from framework.ui.drivers.profile import STARTUP_FLAGS, ProfileTemplate
+from framework.ui.page_timing import install_observers
+
+
+def build_chrome_options(
+    headless: bool | None = None, startup_flags: bool | None = None
+) -> Options:
+    """
+    Build the Chrome options used by the test suite.
+
+    Args:
+        headless: Run without a visible window (uses HEADLESS setting if None)
+        startup_flags: Add STARTUP_FLAGS (uses CHROME_STARTUP_FLAGS setting if None)
+
+    Returns:
+        Options: Configured Chrome options
+    """
+    headless = headless if headless is not None else config.HEADLESS
+    startup_flags = (
+        startup_flags if startup_flags is not None else config.CHROME_STARTUP_FLAGS
+    )
+
+    chrome_options = Options()
+    chrome_options.add_argument("--start-maximized")
+    if headless:
+        chrome_options.add_argument("--headless")
+    chrome_options.add_experimental_option(
+        "prefs",
+        {
+            "profile.password_manager_leak_detection": False,
+            "profile.password_manager_enabled": False,
+        },
+    )
+    chrome_options.add_argument("--no-sandbox")
+    chrome_options.add_argument("--disable-dev-shm-usage")
+    if startup_flags:
+        for flag in STARTUP_FLAGS:
+            chrome_options.add_argument(flag)
+    if config.NETWORK_STATS:
+        # Network events of the DevTools Protocol, read by read_traffic()
+        chrome_options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+        chrome_options.add_experimental_option(
+            "perfLoggingPrefs", {"enableNetwork": True, "enablePage": False}
+        )
+    return chrome_options
+
+
+def _warm_up_profile(user_data_dir: Path) -> None:
+    """Launch and quit Chrome once, so it initialises the profile template."""
+    options = build_chrome_options()
+    options.add_argument(f"--user-data-dir={user_data_dir}")
+    webdriver.Chrome(options=options).quit()
+
+
+profile_template = ProfileTemplate(warm_up=_warm_up_profile)
+
+
+def configure_window(driver: WebDriver, policy: ResourcePolicy | None = None) -> None:
+    """
+    Apply the resource policy and the page timing observers to the focused
+    window. DevTools settings belong to the window, so tabs opened later in
+    the same browser need them again.
+
+    Args:
+        driver: Chrome WebDriver instance
+        policy: Requests to block (uses the BLOCKED_* settings if None)
+    """
+    (policy or ResourcePolicy.from_config()).apply(driver)
+    if config.PAGE_TIMING:
+        install_observers(driver)
+
+
+def create_chrome_driver(
+    options: Options | None = None,
+    policy: ResourcePolicy | None = None,
+    profile: ProfileTemplate | None = None,
+) -> WebDriver:
+    """
+    Launch a new Chrome browser.
+
+    Unless the options name a user data directory, the browser gets a copy of
+    the session's profile template, removed again once the driver is gone.
+
+    Args:
+        options: Chrome options (uses build_chrome_options() if None)
+        policy: Requests to block (uses the BLOCKED_* settings if None)
+        profile: Template to copy (uses the session-wide template if None, and
+            none if the CHROME_PROFILE_TEMPLATE setting is off)
+
+    Returns:
+        WebDriver: Chrome browser instance
+    """
+    options = options or build_chrome_options()
+    profile = profile or (profile_template if config.CHROME_PROFILE_TEMPLATE else None)
+    user_data_dir = None
+    if profile is not None and not any(
+        argument.startswith("--user-data-dir") for argument in options.arguments
+    ):
+        user_data_dir = profile.clone()
+        options.add_argument(f"--user-data-dir={user_data_dir}")
+
+    try:
+        driver = webdriver.Chrome(options=options)
+    except Exception:
+        if user_data_dir is not None:
+            shutil.rmtree(user_data_dir, ignore_errors=True)
+        raise
+    if user_data_dir is not None:
+        weakref.finalize(driver, shutil.rmtree, user_data_dir, ignore_errors=True)
+    instrument(driver)
+    configure_window(driver, policy)
+    return driver
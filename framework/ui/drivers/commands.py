@@ -0,0 +1,310 @@
+import argparse
+import json
+import logging
+import threading
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Callable
+
+from selenium.webdriver.remote.webdriver import WebDriver
+
+logger = logging.getLogger(__name__)
+
+# Commands without side effects; the same one sent twice in a row returns the
+# same result, so the second round trip is wasted
+READ_COMMANDS = frozenset(
+    (
+        "findElement",
+        "findElements",
+        "findChildElement",
+        "findChildElements",
+        "getElementText",
+        "getElementAttribute",
+        "getElementProperty",
+        "getElementTagName",
+        "getElementRect",
+        "isElementDisplayed",
+        "isElementEnabled",
+        "isElementSelected",
+        "getTitle",
+        "getCurrentUrl",
+        "getWindowHandles",
+        "getCookies",
+    )
+)
+# A repeated read counts as redundant if it follows the previous one this
+# quickly; polling waits sleep between their reads
+REDUNDANT_GAP = 0.003
+
+
+@dataclass
+class CommandStats:
+    """
+    WebDriver commands sent to the browser, by command name.
+
+    Attributes:
+        counts: Commands sent
+        times: Seconds spent in their round trips
+        redundant: Repeated reads, by command and target
+    """
+
+    counts: dict[str, int] = field(default_factory=dict)
+    times: dict[str, float] = field(default_factory=dict)
+    redundant: dict[str, int] = field(default_factory=dict)
+
+    @property
+    def total(self) -> int:
+        return sum(self.counts.values())
+
+    @property
+    def total_time(self) -> float:
+        return sum(self.times.values())
+
+    def add(self, command: str, seconds: float) -> None:
+        self.counts[command] = self.counts.get(command, 0) + 1
+        self.times[command] = self.times.get(command, 0.0) + seconds
+
+    def merge(self, other: "CommandStats") -> None:
+        """
+        Add the commands of other statistics, e.g. of an xdist worker.
+
+        Args:
+            other: Statistics to add
+        """
+        for command, count in other.counts.items():
+            self.counts[command] = self.counts.get(command, 0) + count
+        for command, seconds in other.times.items():
+            self.times[command] = self.times.get(command, 0.0) + seconds
+        for pattern, count in other.redundant.items():
+            self.redundant[pattern] = self.redundant.get(pattern, 0) + count
+
+    def summary(self, limit: int = 10) -> str:
+        """
+        Render the most frequent commands and the redundant reads.
+
+        Args:
+            limit: Maximum number of commands and patterns listed
+
+        Returns:
+            str: Multi-line summary
+        """
+        lines = [f"Commands: {self.total}, round trips {self.total_time * 1000:.1f}ms"]
+        for command, count in sorted(self.counts.items(), key=lambda i: -i[1])[:limit]:
+            seconds = self.times[command]
+            lines.append(
+                f"{count:7d}x {seconds * 1000:9.1f}ms "
+                f"{seconds / count * 1000:7.2f}ms/cmd  {command}"
+            )
+        redundant = sorted(self.redundant.items(), key=lambda i: -i[1])[:limit]
+        for pattern, count in redundant:
+            lines.append(f"REDUNDANT {count}x {pattern}")
+        return "\n".join(lines)
+
+
+class _TestState(threading.local):
+    """Test being counted and last command sent, per thread."""
+
+    def __init__(self) -> None:
+        self.current: CommandStats | None = None
+        self.last: tuple[str, str, float] | None = None
+
+
+class CommandLog:
+    """
+    Counts and times the WebDriver commands of instrumented browsers, for the
+    whole session and per test, and spots reads repeated back to back.
+
+    The current test and the last command are kept per thread, so tests
+    running in threads, e.g. in tabs of one browser, are counted separately.
+    """
+
+    def __init__(self) -> None:
+        self.session = CommandStats()
+        self.tests: dict[str, CommandStats] = {}
+        self.listeners: list[Callable[[str, float], None]] = []
+        self._state = _TestState()
+        self._lock = threading.Lock()
+
+    @property
+    def current(self) -> CommandStats | None:
+        """Commands of the test the calling thread runs, None outside a test."""
+        return self._state.current
+
+    def record(
+        self, command: str, params: dict | None, start: float, end: float
+    ) -> None:
+        """
+        Record a command sent to the browser.
+
+        Args:
+            command: WebDriver command name, e.g. "findElements"
+            params: Command parameters
+            start: perf_counter() before the round trip
+            end: perf_counter() after it
+        """
+        seconds = end - start
+        target = describe(params)
+        state = self._state
+        with self._lock:
+            self.session.add(command, seconds)
+            if state.current is not None:
+                state.current.add(command, seconds)
+            if command in READ_COMMANDS and state.last is not None:
+                last_command, last_target, last_end = state.last
+                if (
+                    command == last_command
+                    and target == last_target
+                    and start - last_end < REDUNDANT_GAP
+                ):
+                    pattern = f"{command} {target}".strip()
+                    for stats in filter(None, (self.session, state.current)):
+                        stats.redundant[pattern] = stats.redundant.get(pattern, 0) + 1
+            state.last = (command, target, end)
+        for listener in self.listeners:
+            listener(command, seconds)
+
+    def start_test(self, name: str) -> None:
+        """
+        Count the following commands of the calling thread for a test as well.
+
+        Args:
+            name: Test node id
+        """
+        with self._lock:
+            self._state.current = self.tests[name] = CommandStats()
+        self._state.last = None
+
+    def finish_test(self) -> CommandStats:
+        """
+        Stop counting for the test of the calling thread.
+
+        Returns:
+            CommandStats: Commands of the test
+        """
+        state = self._state
+        stats, state.current = state.current or CommandStats(), None
+        return stats
+
+    def export(self) -> dict[str, Any]:
+        """
+        Get the statistics as JSON-compatible data.
+
+        Returns:
+            dict: "session" statistics and statistics by test
+        """
+        return {
+            "session": asdict(self.session),
+            "tests": {name: asdict(stats) for name, stats in self.tests.items()},
+        }
+
+    def merge(self, data: dict[str, Any]) -> None:
+        """
+        Add exported statistics, e.g. of an xdist worker.
+
+        Args:
+            data: Statistics as returned by export()
+        """
+        with self._lock:
+            self.session.merge(CommandStats(**data["session"]))
+            for name, stats in data["tests"].items():
+                self.tests[name] = CommandStats(**stats)
+
+    def save(self, path: Path) -> None:
+        """Write the statistics as JSON, e.g. to compare runs with compare()."""
+        path.write_text(json.dumps(self.export(), indent=2, sort_keys=True))
+
+
+def describe(params: dict | None) -> str:
+    """Describe what a command works on: its locator or element."""
+    if not params:
+        return ""
+    if "using" in params:
+        return f"{params['using']}={params.get('value')}"
+    if "id" in params:
+        return f"element {params['id']}"
+    return ""
+
+
+class CountingExecutor:
+    """
+    Command executor that reports every WebDriver command to a CommandLog and
+    passes everything else through to the wrapped executor.
+    """
+
+    def __init__(self, executor, log: CommandLog) -> None:
+        """
+        Initialize the wrapper.
+
+        Args:
+            executor: RemoteConnection of the driver
+            log: Log the commands are recorded in
+        """
+        self._executor = executor
+        self._log = log
+
+    def execute(self, command: str, params: dict | None) -> Any:
+        start = time.perf_counter()
+        try:
+            return self._executor.execute(command, params)
+        finally:
+            self._log.record(command, params, start, time.perf_counter())
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._executor, name)
+
+
+def instrument(driver: WebDriver, log: CommandLog | None = None) -> None:
+    """
+    Route the commands of a browser through a CountingExecutor.
+
+    Args:
+        driver: WebDriver instance
+        log: Log to record in (uses the session-wide log if None)
+    """
+    if isinstance(driver.command_executor, CountingExecutor):
+        return
+    driver.command_executor = CountingExecutor(
+        driver.command_executor, log or command_log
+    )
+
+
+def compare(before: dict[str, Any], after: dict[str, Any]) -> str:
+    """
+    Compare the session command counts of two exported runs.
+
+    Args:
+        before: Export of the baseline run
+        after: Export of the run with the change
+
+    Returns:
+        str: Per-command counts and differences
+    """
+    counts_before = before["session"]["counts"]
+    counts_after = after["session"]["counts"]
+    lines = [f"{'command':<28} {'before':>8} {'after':>8} {'change':>8}"]
+    for command in sorted(set(counts_before) | set(counts_after)):
+        old, new = counts_before.get(command, 0), counts_after.get(command, 0)
+        lines.append(f"{command:<28} {old:>8} {new:>8} {new - old:>+8}")
+    old, new = sum(counts_before.values()), sum(counts_after.values())
+    lines.append(f"{'total':<28} {old:>8} {new:>8} {new - old:>+8}")
+    return "\n".join(lines)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Compare the WebDriver command counts of two exported runs"
+    )
+    parser.add_argument("before", type=Path)
+    parser.add_argument("after", type=Path)
+    args = parser.parse_args()
+    print(
+        compare(json.loads(args.before.read_text()), json.loads(args.after.read_text()))
+    )
+
+
+command_log = CommandLog()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,211 @@
+import logging
+import statistics
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Callable
+
+from selenium.common.exceptions import NoSuchWindowException, WebDriverException
+from selenium.webdriver.remote.webdriver import WebDriver
+
+logger = logging.getLogger(__name__)
+
+BLANK_PAGE = "about:blank"
+
+CLEAR_STORAGE_SCRIPT = """
+try { window.localStorage.clear(); } catch (e) {}
+try { window.sessionStorage.clear(); } catch (e) {}
+"""
+
+
+@dataclass
+class PoolStats:
+    """
+    Counters collected by a DriverPool.
+
+    Attributes:
+        hits: Number of acquisitions served by an already running browser
+        misses: Number of acquisitions that had to launch a new browser
+        discarded: Number of browsers thrown away because they ended unhealthy
+        launch_times: Seconds spent launching each new browser
+        reset_times: Seconds spent resetting each browser returned to the pool
+    """
+
+    hits: int = 0
+    misses: int = 0
+    discarded: int = 0
+    launch_times: list[float] = field(default_factory=list)
+    reset_times: list[float] = field(default_factory=list)
+
+    @property
+    def estimated_time_saved(self) -> float:
+        """Launch time avoided by hits, minus the time spent on resets."""
+        if not self.launch_times:
+            return 0.0
+        return self.hits * statistics.mean(self.launch_times) - sum(self.reset_times)
+
+    def merge(self, other: "PoolStats") -> None:
+        """
+        Add the counters of another pool, e.g. from an xdist worker.
+
+        Args:
+            other: Statistics to add
+        """
+        self.hits += other.hits
+        self.misses += other.misses
+        self.discarded += other.discarded
+        self.launch_times.extend(other.launch_times)
+        self.reset_times.extend(other.reset_times)
+
+    def summary(self) -> str:
+        """
+        Render the counters as a human readable report.
+
+        Returns:
+            str: Multi-line summary
+        """
+        lines = [
+            f"Hits: {self.hits}",
+            f"Misses: {self.misses}",
+            f"Discarded: {self.discarded}",
+        ]
+        if self.launch_times:
+            lines.append(
+                f"Launch time: mean {statistics.mean(self.launch_times):.3f}s, "
+                f"total {sum(self.launch_times):.3f}s"
+            )
+        if self.reset_times:
+            lines.append(
+                f"Reset time: mean {statistics.mean(self.reset_times) * 1000:.1f}ms, "
+                f"max {max(self.reset_times) * 1000:.1f}ms"
+            )
+        lines.append(f"Estimated time saved: {self.estimated_time_saved:.3f}s")
+        return "\n".join(lines)
+
+
+class DriverPool:
+    """
+    Pool of warm browsers that are reset and reused between tests.
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[], WebDriver],
+        max_idle: int = 1,
+        reuse: bool = True,
+    ) -> None:
+        """
+        Initialize the pool.
+
+        Args:
+            factory: Callable that launches a new browser
+            max_idle: Maximum number of idle browsers kept alive
+            reuse: Whether returned browsers are kept; if False every
+                acquisition launches a new browser (launch-per-test behaviour)
+        """
+        self.factory = factory
+        self.max_idle = max_idle
+        self.reuse = reuse
+        self.stats = PoolStats()
+        self._idle: list[WebDriver] = []
+        self._lock = threading.Lock()
+
+    def acquire(self) -> WebDriver:
+        """
+        Get a browser from the pool, launching one if none is idle.
+
+        Returns:
+            WebDriver: Browser ready for a test
+        """
+        with self._lock:
+            driver = self._idle.pop() if self._idle else None
+            if driver is not None:
+                self.stats.hits += 1
+                return driver
+            self.stats.misses += 1
+
+        start = time.perf_counter()
+        driver = self.factory()
+        self.stats.launch_times.append(time.perf_counter() - start)
+        return driver
+
+    def release(self, driver: WebDriver) -> float | None:
+        """
+        Return a browser to the pool after resetting its state.
+
+        A browser that fails to reset is considered unhealthy and is quit.
+
+        Args:
+            driver: Browser previously returned by acquire()
+
+        Returns:
+            float | None: Seconds spent on the reset, or None if the browser
+            was not kept
+        """
+        if not self.reuse:
+            self._quit(driver)
+            return None
+
+        start = time.perf_counter()
+        try:
+            self.reset(driver)
+        except WebDriverException as e:
+            logger.warning(f"Discarding unhealthy browser: {e.__class__.__name__}")
+            self.stats.discarded += 1
+            self._quit(driver)
+            return None
+        elapsed = time.perf_counter() - start
+        self.stats.reset_times.append(elapsed)
+
+        with self._lock:
+            if len(self._idle) < self.max_idle:
+                self._idle.append(driver)
+                return elapsed
+        self._quit(driver)
+        return elapsed
+
+    @staticmethod
+    def reset(driver: WebDriver) -> None:
+        """
+        Bring a browser back to a clean state.
+
+        Closes extra windows, clears cookies, localStorage and sessionStorage
+        of the current origin and navigates to a blank page.
+
+        Args:
+            driver: Browser to reset
+
+        Raises:
+            WebDriverException: If the browser does not respond or has no
+                windows left
+        """
+        handles = driver.window_handles
+        if not handles:
+            # The test closed every window; the session cannot be reused
+            raise NoSuchWindowException("Browser has no open windows")
+        for handle in handles[1:]:
+            driver.switch_to.window(handle)
+            driver.close()
+        driver.switch_to.window(handles[0])
+
+        driver.execute_script(CLEAR_STORAGE_SCRIPT)
+        if hasattr(driver, "execute_cdp_cmd"):
+            driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+        else:
+            driver.delete_all_cookies()
+
+        driver.get(BLANK_PAGE)
+
+    def close(self) -> None:
+        """Quit all idle browsers."""
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for driver in idle:
+            self._quit(driver)
+
+    @staticmethod
+    def _quit(driver: WebDriver) -> None:
+        try:
+            driver.quit()
+        except WebDriverException as e:
+            logger.error(f"Failed to quit browser: {str(e)}")
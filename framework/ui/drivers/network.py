@@ -0,0 +1,308 @@
+import json
+import logging
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from framework import config
+
+logger = logging.getLogger(__name__)
+
+# Network.setBlockedURLs only matches URLs, so resource types are blocked by
+# the file extensions they are served with
+RESOURCE_TYPE_PATTERNS = {
+    "image": ("*.png*", "*.jpg*", "*.jpeg*", "*.gif*", "*.webp*", "*.svg*", "*.ico*"),
+    "font": ("*.woff*", "*.woff2*", "*.ttf*", "*.otf*", "*.eot*"),
+    "media": ("*.mp4*", "*.webm*", "*.ogg*", "*.mp3*", "*.wav*"),
+    "stylesheet": ("*.css*",),
+}
+
+# Analytics, tag managers and error reporting the tested pages send data to
+ANALYTICS_URL_PATTERNS = (
+    "*google-analytics.com*",
+    "*googletagmanager.com*",
+    "*doubleclick.net*",
+    "*backtrace.io*",
+    "*segment.io*",
+    "*hotjar.com*",
+    "*mixpanel.com*",
+)
+
+# Defines the globals of the blocked analytics scripts as no-ops, so page code
+# calling them keeps working
+ANALYTICS_STUB_SCRIPT = """
+window.dataLayer = window.dataLayer || [];
+window.gtag = window.gtag || function () { window.dataLayer.push(arguments); };
+window.ga = window.ga || function () {};
+window.analytics = window.analytics || {
+    track() {}, page() {}, identify() {}, reset() {},
+};
+"""
+
+# Reason Chrome gives for requests blocked by Network.setBlockedURLs
+BLOCKED_BY_POLICY = "inspector"
+
+
+def split_list(value: str) -> tuple[str, ...]:
+    """Split a comma separated setting, dropping empty entries."""
+    return tuple(item.strip() for item in value.split(",") if item.strip())
+
+
+@dataclass(frozen=True)
+class ResourcePolicy:
+    """
+    Requests a browser does not send, because no test looks at their result.
+
+    Attributes:
+        blocked_urls: URL patterns with "*" wildcards
+        blocked_types: Resource types (keys of RESOURCE_TYPE_PATTERNS)
+        stub_analytics: Block analytics requests and stub their globals
+    """
+
+    blocked_urls: tuple[str, ...] = ()
+    blocked_types: tuple[str, ...] = ()
+    stub_analytics: bool = False
+
+    def __post_init__(self) -> None:
+        unknown = set(self.blocked_types) - set(RESOURCE_TYPE_PATTERNS)
+        if unknown:
+            raise ValueError(
+                f"Unknown resource types {sorted(unknown)}, "
+                f"expected some of {sorted(RESOURCE_TYPE_PATTERNS)}"
+            )
+
+    @classmethod
+    def from_config(cls) -> "ResourcePolicy":
+        return cls(
+            blocked_urls=split_list(config.BLOCKED_URLS),
+            blocked_types=split_list(config.BLOCKED_RESOURCE_TYPES),
+            stub_analytics=config.STUB_ANALYTICS,
+        )
+
+    def url_patterns(self) -> list[str]:
+        """
+        Get all URL patterns the policy blocks.
+
+        Returns:
+            list[str]: Patterns for Network.setBlockedURLs
+        """
+        patterns = list(self.blocked_urls)
+        for resource_type in self.blocked_types:
+            patterns.extend(RESOURCE_TYPE_PATTERNS[resource_type])
+        if self.stub_analytics:
+            patterns.extend(ANALYTICS_URL_PATTERNS)
+        return patterns
+
+    def apply(self, driver: WebDriver) -> None:
+        """
+        Install the policy in a browser through the Chrome DevTools Protocol.
+
+        The policy stays active for the lifetime of the browser, including
+        resets by the driver pool.
+
+        Args:
+            driver: Chrome WebDriver instance
+        """
+        patterns = self.url_patterns()
+        if not patterns:
+            return
+        if not hasattr(driver, "execute_cdp_cmd"):
+            logger.warning("Resource policy needs Chrome DevTools, not applied")
+            return
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": patterns})
+        if self.stub_analytics:
+            driver.execute_cdp_cmd(
+                "Page.addScriptToEvaluateOnNewDocument",
+                {"source": ANALYTICS_STUB_SCRIPT},
+            )
+        logger.debug(f"Blocking {len(patterns)} URL patterns")
+
+
+class ResourceSizes:
+    """
+    Transfer sizes of resources seen loading, optionally persisted between runs.
+
+    Blocked requests are never answered, so the bytes they save are estimated
+    from the size the same URL had when it was loaded, e.g. in a run with the
+    policy disabled.
+    """
+
+    def __init__(self, path: Path | None = None) -> None:
+        """
+        Initialize the catalogue.
+
+        Args:
+            path: JSON file with sizes of earlier runs (not persisted if None)
+        """
+        self.path = path
+        self.sizes: dict[str, int] = {}
+        self.learned: dict[str, int] = {}
+        self._lock = threading.Lock()
+        if path is not None:
+            self.load()
+
+    def get(self, url: str) -> int | None:
+        return self.sizes.get(url)
+
+    def learn(self, url: str, size: int) -> None:
+        """
+        Record the transfer size of a loaded resource.
+
+        Args:
+            url: Resource URL
+            size: Encoded bytes received, headers included
+        """
+        if url.startswith("data:") or size <= 0:
+            return
+        with self._lock:
+            self.sizes[url] = size
+            self.learned[url] = size
+
+    def merge(self, sizes: dict[str, int]) -> None:
+        """
+        Add sizes learned elsewhere, e.g. by an xdist worker.
+
+        Args:
+            sizes: Mapping of URL to transfer size in bytes
+        """
+        for url, size in sizes.items():
+            self.learn(url, size)
+
+    def load(self) -> None:
+        """Load the sizes recorded by previous runs."""
+        try:
+            self.sizes = json.loads(self.path.read_text())
+        except (OSError, ValueError):
+            return
+
+    def save(self) -> None:
+        """Write the known sizes, including the ones learned in this run."""
+        if self.path is None or not self.learned:
+            return
+        self.path.write_text(json.dumps(self.sizes, indent=2, sort_keys=True))
+
+
+@dataclass
+class TrafficStats:
+    """
+    Network traffic of a browser, with what the resource policy saved.
+
+    Attributes:
+        requests: Requests that completed
+        bytes: Encoded bytes received by them
+        blocked: Requests blocked by the resource policy
+        blocked_by_type: Blocked requests by resource type
+        bytes_saved: Known size of the blocked resources
+        unknown_size: Blocked requests whose size is not known
+    """
+
+    requests: int = 0
+    bytes: int = 0
+    blocked: int = 0
+    blocked_by_type: dict[str, int] = field(default_factory=dict)
+    bytes_saved: int = 0
+    unknown_size: int = 0
+
+    def merge(self, other: "TrafficStats") -> None:
+        """
+        Add the counters of another report, e.g. of a test or an xdist worker.
+
+        Args:
+            other: Statistics to add
+        """
+        self.requests += other.requests
+        self.bytes += other.bytes
+        self.blocked += other.blocked
+        for resource_type, count in other.blocked_by_type.items():
+            self.blocked_by_type[resource_type] = (
+                self.blocked_by_type.get(resource_type, 0) + count
+            )
+        self.bytes_saved += other.bytes_saved
+        self.unknown_size += other.unknown_size
+
+    def summary(self) -> str:
+        """
+        Render the counters as a human readable report.
+
+        Returns:
+            str: Multi-line summary
+        """
+        by_type = ", ".join(
+            f"{resource_type} {count}"
+            for resource_type, count in sorted(self.blocked_by_type.items())
+        )
+        lines = [
+            f"Requests: {self.requests} ({self.bytes / 1024:.1f} KB)",
+            f"Blocked: {self.blocked}" + (f" ({by_type})" if by_type else ""),
+            f"Saved: {self.bytes_saved / 1024:.1f} KB",
+        ]
+        if self.unknown_size:
+            lines[-1] += f" (size unknown for {self.unknown_size} blocked requests)"
+        return "\n".join(lines)
+
+
+def read_traffic(driver: WebDriver, sizes: ResourceSizes | None = None) -> TrafficStats:
+    """
+    Collect the network traffic since the previous call from the performance log.
+
+    Reading the log drains it, so call this once before a test to discard
+    earlier traffic and once after it.
+
+    Args:
+        driver: Chrome WebDriver with performance logging enabled
+        sizes: Catalogue to estimate and learn resource sizes with
+
+    Returns:
+        TrafficStats: Traffic of the drained log entries
+    """
+    sizes = sizes if sizes is not None else resource_sizes
+    stats = TrafficStats()
+    try:
+        entries = driver.get_log("performance")
+    except (WebDriverException, ValueError) as e:
+        logger.debug(f"Performance log unavailable: {e.__class__.__name__}")
+        return stats
+
+    requests: dict[str, tuple[str, str]] = {}
+    for entry in entries:
+        message = json.loads(entry["message"])["message"]
+        method, params = message["method"], message.get("params", {})
+        if method == "Network.requestWillBeSent":
+            requests[params["requestId"]] = (
+                params["request"]["url"],
+                params.get("type", "Other"),
+            )
+        elif method == "Network.loadingFinished":
+            url, _ = requests.get(params["requestId"], ("", ""))
+            size = int(params.get("encodedDataLength", 0))
+            stats.requests += 1
+            stats.bytes += size
+            sizes.learn(url, size)
+        elif (
+            method == "Network.loadingFailed"
+            and params.get("blockedReason") == BLOCKED_BY_POLICY
+        ):
+            url, resource_type = requests.get(
+                params["requestId"], ("", params.get("type", "Other"))
+            )
+            resource_type = resource_type.lower()
+            stats.blocked += 1
+            stats.blocked_by_type[resource_type] = (
+                stats.blocked_by_type.get(resource_type, 0) + 1
+            )
+            size = sizes.get(url)
+            if size is None:
+                stats.unknown_size += 1
+            else:
+                stats.bytes_saved += size
+    return stats
+
+
+resource_sizes = ResourceSizes(
+    Path(config.RESOURCE_SIZES_FILE) if config.RESOURCE_SIZES_FILE else None
+)
+network_stats = TrafficStats()
@@ -0,0 +1,342 @@
+import logging
+import statistics
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable
+
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.remote.command import Command
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from framework.ui.drivers.driver_pool import BLANK_PAGE, CLEAR_STORAGE_SCRIPT
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class TabStats:
+    """
+    Counters collected by a TabBrowser.
+
+    Attributes:
+        opened: Tabs handed out to tests
+        isolated: Tabs opened in a browser context of their own
+        switches: Window switches issued before commands of another tab
+        open_times: Seconds spent opening each tab
+        close_times: Seconds spent closing each tab
+    """
+
+    opened: int = 0
+    isolated: int = 0
+    switches: int = 0
+    open_times: list[float] = field(default_factory=list)
+    close_times: list[float] = field(default_factory=list)
+
+    def merge(self, other: "TabStats") -> None:
+        """
+        Add the counters of another browser, e.g. from an xdist worker.
+
+        Args:
+            other: Statistics to add
+        """
+        self.opened += other.opened
+        self.isolated += other.isolated
+        self.switches += other.switches
+        self.open_times.extend(other.open_times)
+        self.close_times.extend(other.close_times)
+
+    def summary(self) -> str:
+        """
+        Render the counters as a human readable report.
+
+        Returns:
+            str: Multi-line summary
+        """
+        lines = [
+            f"Tabs: {self.opened}, in their own browser context: {self.isolated}",
+            f"Window switches: {self.switches}",
+        ]
+        if self.open_times:
+            lines.append(
+                f"Open time: mean {statistics.mean(self.open_times) * 1000:.1f}ms, "
+                f"max {max(self.open_times) * 1000:.1f}ms"
+            )
+        if self.close_times:
+            lines.append(
+                f"Close time: mean {statistics.mean(self.close_times) * 1000:.1f}ms, "
+                f"max {max(self.close_times) * 1000:.1f}ms"
+            )
+        return "\n".join(lines)
+
+
+class TabExecutor:
+    """
+    Command executor that lets several threads drive their own windows of one
+    browser.
+
+    Every thread is bound to a window handle. Before a command of a thread
+    whose window is not the focused one, the executor switches to it; the
+    switch and the command are sent under one lock, so commands of other
+    threads cannot land in between.
+    """
+
+    def __init__(self, executor, stats: TabStats) -> None:
+        """
+        Initialize the wrapper.
+
+        Args:
+            executor: Command executor of the driver
+            stats: Statistics the implicit switches are counted in
+        """
+        self._executor = executor
+        self._stats = stats
+        self._local = threading.local()
+        self.lock = threading.RLock()
+        self.focused: str | None = None
+
+    @property
+    def bound(self) -> str | None:
+        """Window handle of the calling thread."""
+        return getattr(self._local, "handle", None)
+
+    def bind(self, handle: str | None) -> None:
+        """
+        Send the following commands of the calling thread to a window.
+
+        Args:
+            handle: Window handle, or None to use whatever window is focused
+        """
+        self._local.handle = handle
+
+    def execute(self, command: str, params: dict | None) -> Any:
+        handle = self.bound
+        with self.lock:
+            if command == Command.SWITCH_TO_WINDOW:
+                response = self._executor.execute(command, params)
+                # The thread follows windows it switches to itself
+                self._local.handle = self.focused = params["handle"]
+                return response
+            if handle is not None and handle != self.focused:
+                self._executor.execute(
+                    Command.SWITCH_TO_WINDOW,
+                    {"handle": handle, "sessionId": (params or {}).get("sessionId")},
+                )
+                self.focused = handle
+                self._stats.switches += 1
+            response = self._executor.execute(command, params)
+            if command == Command.CLOSE:
+                self.focused = None
+            return response
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._executor, name)
+
+
+def bound_window(driver: WebDriver) -> str | None:
+    """
+    Get the window the calling thread drives in a shared browser.
+
+    Args:
+        driver: WebDriver instance
+
+    Returns:
+        str | None: Window handle, or None if the browser is not shared
+    """
+    executor = driver.command_executor
+    return executor.bound if isinstance(executor, TabExecutor) else None
+
+
+def focus(driver: WebDriver, handle: str) -> None:
+    """
+    Send the following commands of the calling thread to a window of a shared
+    browser; the switch itself is only issued if another window has the focus.
+
+    Args:
+        driver: WebDriver instance
+        handle: Window handle
+    """
+    executor = driver.command_executor
+    if isinstance(executor, TabExecutor):
+        executor.bind(handle)
+
+
+@dataclass(frozen=True)
+class BrowserTab:
+    """
+    Window of a shared browser handed out to one test.
+
+    Attributes:
+        handle: WebDriver window handle
+        context_id: DevTools browser context of the window, None for a plain
+            tab that shares cookies and storage with the other tabs
+    """
+
+    handle: str
+    context_id: str | None = None
+
+
+class TabBrowser:
+    """
+    One browser that hands out a tab per test instead of a browser per test.
+
+    Tabs are opened in a browser context of their own, so cookies, storage
+    and cache are not shared between tests, and disposed together with their
+    context. If the browser cannot create contexts, plain tabs are used and
+    cleared on close: their storage and the cookies of the site they show.
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[], WebDriver],
+        setup_tab: Callable[[WebDriver], None] | None = None,
+    ) -> None:
+        """
+        Initialize the browser; it is launched by the first open_tab().
+
+        Args:
+            factory: Callable that launches a new browser
+            setup_tab: Called with the driver once a new tab has the focus,
+                e.g. configure_window(), since DevTools settings the factory
+                made in the first window do not apply to other tabs
+        """
+        self.factory = factory
+        self.setup_tab = setup_tab
+        self.stats = TabStats()
+        self.driver: WebDriver | None = None
+        self.launch_time: float | None = None
+        self.contexts_supported = True
+        self._executor: TabExecutor | None = None
+        self._home: str | None = None
+        self._lock = threading.Lock()
+
+    def _launch(self) -> TabExecutor:
+        with self._lock:
+            if self._executor is None:
+                start = time.perf_counter()
+                driver = self.factory()
+                self.launch_time = time.perf_counter() - start
+                # The first window stays open, so the browser keeps running
+                # and commands of unbound threads have a window to go to
+                self._home = driver.current_window_handle
+                self._executor = TabExecutor(driver.command_executor, self.stats)
+                self._executor.focused = self._home
+                driver.command_executor = self._executor
+                self.driver = driver
+            return self._executor
+
+    def open_tab(self) -> BrowserTab:
+        """
+        Open a tab and bind the calling thread to it.
+
+        Returns:
+            BrowserTab: Tab ready for a test
+        """
+        executor = self._launch()
+        start = time.perf_counter()
+        with executor.lock:
+            executor.bind(self._home)
+            tab = self._open_context_tab() if self.contexts_supported else None
+            if tab is None:
+                response = self.driver.execute(Command.NEW_WINDOW, {"type": "tab"})
+                tab = BrowserTab(response["value"]["handle"])
+            executor.bind(tab.handle)
+            if self.setup_tab is not None:
+                self.setup_tab(self.driver)
+            self.stats.opened += 1
+            self.stats.isolated += tab.context_id is not None
+            self.stats.open_times.append(time.perf_counter() - start)
+        return tab
+
+    def _open_context_tab(self) -> BrowserTab | None:
+        """Open a tab in a new browser context, or None if the browser refuses."""
+        try:
+            context_id = self.driver.execute_cdp_cmd(
+                "Target.createBrowserContext", {"disposeOnDetach": False}
+            )["browserContextId"]
+        except WebDriverException as e:
+            logger.warning(
+                f"Browser contexts unavailable, tabs share cookies and storage: "
+                f"{e.__class__.__name__}"
+            )
+            self.contexts_supported = False
+            return None
+        handles = set(self.driver.window_handles)
+        target_id = self.driver.execute_cdp_cmd(
+            "Target.createTarget", {"url": BLANK_PAGE, "browserContextId": context_id}
+        )["targetId"]
+        new = set(self.driver.window_handles) - handles
+        if target_id in new or len(new) == 1:
+            return BrowserTab(target_id if target_id in new else new.pop(), context_id)
+        logger.warning("Tabs of browser contexts are not visible to WebDriver")
+        self.driver.execute_cdp_cmd(
+            "Target.disposeBrowserContext", {"browserContextId": context_id}
+        )
+        self.contexts_supported = False
+        return None
+
+    def close_tab(self, tab: BrowserTab) -> float | None:
+        """
+        Close a tab and everything the test left in it.
+
+        Args:
+            tab: Tab returned by open_tab()
+
+        Returns:
+            float | None: Seconds spent on closing, or None if the browser no
+            longer responds
+        """
+        executor = self._executor
+        start = time.perf_counter()
+        try:
+            with executor.lock:
+                executor.bind(tab.handle)
+                if tab.context_id is None:
+                    self.driver.execute_script(CLEAR_STORAGE_SCRIPT)
+                    self._delete_cookies(self.driver.current_url)
+                    self.driver.close()
+                else:
+                    executor.bind(self._home)
+                    self.driver.execute_cdp_cmd(
+                        "Target.disposeBrowserContext",
+                        {"browserContextId": tab.context_id},
+                    )
+        except WebDriverException as e:
+            logger.error(f"Failed to close browser tab: {e.__class__.__name__}")
+            return None
+        finally:
+            executor.bind(None)
+        elapsed = time.perf_counter() - start
+        self.stats.close_times.append(elapsed)
+        return elapsed
+
+    def _delete_cookies(self, url: str) -> None:
+        """
+        Delete the cookies sent to a URL, leaving those of other sites alone.
+
+        Tabs without a browser context share the cookie jar, so clearing all
+        cookies would log out the tests running in the other tabs.
+
+        Args:
+            url: URL of the tab being closed
+        """
+        cookies = self.driver.execute_cdp_cmd("Network.getCookies", {"urls": [url]})
+        for cookie in cookies["cookies"]:
+            self.driver.execute_cdp_cmd(
+                "Network.deleteCookies",
+                {
+                    "name": cookie["name"],
+                    "domain": cookie["domain"],
+                    "path": cookie["path"],
+                },
+            )
+
+    def close(self) -> None:
+        """Quit the browser."""
+        if self.driver is None:
+            return
+        try:
+            self.driver.quit()
+        except WebDriverException as e:
+            logger.error(f"Failed to quit browser: {str(e)}")
+        self.driver = self._executor = None
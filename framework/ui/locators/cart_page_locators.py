@@ -1,12 +1,14 @@
 from selenium.webdriver.common.by import By
 
+from framework.ui.locators.registry import cached_locator, nth_css
+
 
 class CartPageLocators:
     """Locators for the shopping cart page elements."""
 
-    CHECKOUT_BUTTON = (By.XPATH, '//*[@id="checkout"]')
+    CHECKOUT_BUTTON = (By.ID, "checkout")
 
-    @staticmethod
+    @cached_locator
     def remove_button(index: int = 1) -> tuple[str, str]:
         """Get locator for the remove button of an item by index.
 
@@ -14,14 +16,11 @@ class CartPageLocators:
             index: The index of the item (starting from 1)
 
         Returns:
-            Tuple containing By method and XPath locator
+            Tuple containing By method and CSS selector
         """
-        return (
-            By.XPATH,
-            f'(//button[@class="btn btn_secondary btn_small cart_button"])[{index}]',
-        )
+        return (By.CSS_SELECTOR, nth_css(".cart_item", index, "button.cart_button"))
 
-    @staticmethod
+    @cached_locator
     def item_price_text(index: int = 1) -> tuple[str, str]:
         """Get locator for the price text of an item in cart by index.
 
@@ -29,6 +28,6 @@ class CartPageLocators:
             index: The index of the item (starting from 1)
 
         Returns:
-            Tuple containing By method and XPath locator
+            Tuple containing By method and CSS selector
         """
-        return (By.XPATH, f'(//div[@class="inventory_item_price"])[{index}]')
+        return (By.CSS_SELECTOR, nth_css(".cart_item", index, ".inventory_item_price"))
@@ -1,14 +1,16 @@
 from selenium.webdriver.common.by import By
 
+from framework.ui.locators.registry import cached_locator, nth_css
+
 
 class InventoryPageLocator:
     """Locators for the inventory page elements."""
 
-    LOGO_TITLE = (By.XPATH, '//*[@class="app_logo"]')
+    LOGO_TITLE = (By.CSS_SELECTOR, ".app_logo")
 
-    CART_BUTTON = (By.XPATH, '//*[@id="shopping_cart_container"]')
+    CART_BUTTON = (By.ID, "shopping_cart_container")
 
-    @staticmethod
+    @cached_locator
     def item_price_text(index: int = 1) -> tuple[str, str]:
         """Get locator for the price text of an item by index.
 
@@ -16,11 +18,14 @@ class InventoryPageLocator:
             index: The index of the item (starting from 1)
 
         Returns:
-            Tuple containing By method and XPath locator
+            Tuple containing By method and CSS selector
         """
-        return (By.XPATH, f'(//div[@class="inventory_item"])[{index}]')
+        return (
+            By.CSS_SELECTOR,
+            nth_css(".inventory_item", index, ".inventory_item_price"),
+        )
 
-    @staticmethod
+    @cached_locator
     def item_name_text(index: int = 1) -> tuple[str, str]:
         """Get locator for the name text of an item by index.
 
@@ -28,11 +33,14 @@ class InventoryPageLocator:
             index: The index of the item (starting from 1)
 
         Returns:
-            Tuple containing By method and XPath locator
+            Tuple containing By method and CSS selector
         """
-        return (By.XPATH, f'(//div[@class="inventory_item_name"])[{index}]')
+        return (
+            By.CSS_SELECTOR,
+            nth_css(".inventory_item", index, ".inventory_item_name"),
+        )
 
-    @staticmethod
+    @cached_locator
     def item_description_text(index: int = 1) -> tuple[str, str]:
         """Get locator for the description text of an item by index.
 
@@ -40,11 +48,14 @@ class InventoryPageLocator:
             index: The index of the item (starting from 1)
 
         Returns:
-            Tuple containing By method and XPath locator
+            Tuple containing By method and CSS selector
         """
-        return (By.XPATH, f'(//div[@class="inventory_item_desc"])[{index}]')
+        return (
+            By.CSS_SELECTOR,
+            nth_css(".inventory_item", index, ".inventory_item_desc"),
+        )
 
-    @staticmethod
+    @cached_locator
     def add_to_card_button(index: int = 1) -> tuple[str, str]:
         """Get locator for the 'Add to Cart' button of an item by index.
 
@@ -52,9 +63,9 @@ class InventoryPageLocator:
             index: The index of the item (starting from 1)
 
         Returns:
-            Tuple containing By method and XPath locator
+            Tuple containing By method and CSS selector
         """
         return (
-            By.XPATH,
-            f'(//button[@class="btn btn_primary btn_small btn_inventory "])[{index}]',
+            By.CSS_SELECTOR,
+            nth_css(".inventory_item", index, "button.btn_primary.btn_inventory"),
         )
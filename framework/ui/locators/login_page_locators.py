@@ -4,12 +4,12 @@ from selenium.webdriver.common.by import By
 class LoginPageLocators:
     """Locators for the login page elements."""
 
-    LOGO_TITLE = (By.XPATH, '//div[@class="login_logo"]')
+    LOGO_TITLE = (By.CSS_SELECTOR, "div.login_logo")
 
-    USERNAME_INPUT = (By.XPATH, '//*[@id="user-name"]')
-    PASSWORD_INPUT = (By.XPATH, '//*[@id="password"]')
+    USERNAME_INPUT = (By.ID, "user-name")
+    PASSWORD_INPUT = (By.ID, "password")
 
-    LOGIN_BUTTON = (By.XPATH, '//*[@id="login-button"]')
+    LOGIN_BUTTON = (By.ID, "login-button")
 
-    USERNAMES_TEXT = (By.XPATH, '//*[@id="login_credentials"]')
-    PASSWORD_TEXT = (By.XPATH, '//*[@class="login_password"]')
+    USERNAMES_TEXT = (By.ID, "login_credentials")
+    PASSWORD_TEXT = (By.CSS_SELECTOR, ".login_password")
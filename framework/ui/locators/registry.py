@@ -0,0 +1,61 @@
+import functools
+from typing import Callable
+
+Locator = tuple[str, str]
+
+# Every parameterised locator by qualified name, e.g. "CartPageLocators.remove_button"
+locator_factories: dict[str, Callable[..., Locator]] = {}
+
+
+def cached_locator(factory: Callable[..., Locator]) -> staticmethod:
+    """
+    Register a parameterised locator and cache the locators it builds.
+
+    Used in place of @staticmethod on locator classes: the locator for each
+    set of arguments is built once, and later calls return the same tuple.
+
+    Args:
+        factory: Function building a locator from its arguments
+
+    Returns:
+        staticmethod: Cached factory to assign to the locator class
+    """
+    cached = functools.lru_cache(maxsize=None)(factory)
+    locator_factories[factory.__qualname__] = cached
+    return staticmethod(cached)
+
+
+def nth_css(item: str, index: int, descendant: str = "") -> str:
+    """
+    Build a CSS selector for the index-th element matching a selector among
+    its siblings, optionally narrowed to one of its descendants.
+
+    Uses :nth-child(An+B of S), which counts only the siblings matching S,
+    instead of an XPath over the whole document.
+
+    Args:
+        item: Selector of the repeated element, e.g. ".cart_item"
+        index: The index of the element (starting from 1)
+        descendant: Selector of a descendant of the element
+
+    Returns:
+        str: CSS selector
+    """
+    return f"{item}:nth-child({index} of {item}) {descendant}".rstrip()
+
+
+def static_locators(locators: type) -> dict[str, Locator]:
+    """
+    Get the constant locators of a locator class.
+
+    Args:
+        locators: Locator class, e.g. LoginPageLocators
+
+    Returns:
+        dict[str, Locator]: Locators by attribute name
+    """
+    return {
+        name: value
+        for name, value in vars(locators).items()
+        if not name.startswith("_") and isinstance(value, tuple) and len(value) == 2
+    }
@@ -0,0 +1,390 @@
+import json
+import logging
+import re
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from framework import config
+from framework.samples import SampleStore, percentile, slowed_down
+
+logger = logging.getLogger(__name__)
+
+# Metrics of a document, reported once after its load event
+NAVIGATION_METRICS = (
+    "ttfb",
+    "dom_content_loaded",
+    "load",
+    "first_paint",
+    "first_contentful_paint",
+    "largest_contentful_paint",
+    "transfer_bytes",
+)
+# Metrics of the time between two page object actions
+ACTION_METRICS = ("resources", "resource_bytes", "long_tasks", "long_task_time")
+
+METRIC_UNITS = {
+    "transfer_bytes": "B",
+    "resources": "",
+    "resource_bytes": "B",
+    "long_tasks": "",
+}
+UNIT_FACTORS = {"ms": 1.0, "s": 1000.0, "B": 1.0, "KB": 1024.0, "": 1.0}
+# Units a budget may be written in, by the unit of its metric; without a unit
+# the value is in the unit of the metric
+BUDGET_UNITS = {"ms": ("ms", "s", ""), "B": ("B", "KB", ""), "": ("",)}
+
+BUDGET_RULE = re.compile(
+    r"^(?P<page>\w+)\s+(?P<metric>\w+)\s+p(?P<percentile>\d+(?:\.\d+)?)\s*"
+    r"(?P<operator><=|<)\s*(?P<value>\d+(?:\.\d+)?)\s*(?P<unit>ms|s|KB|B)?$"
+)
+
+MAX_SAMPLES = 500
+# Runs kept in the trend file
+MAX_TREND_RUNS = 50
+
+# Installed before any page script runs; long tasks and the largest contentful
+# paint are only reported to observers
+OBSERVER_SCRIPT = """
+window.__pageTiming = {longTasks: [], lcp: null, cursor: 0, reported: false};
+try {
+    new PerformanceObserver((list) => {
+        for (const entry of list.getEntries()) {
+            window.__pageTiming.longTasks.push([entry.startTime, entry.duration]);
+        }
+    }).observe({type: "longtask", buffered: true});
+    new PerformanceObserver((list) => {
+        const entries = list.getEntries();
+        window.__pageTiming.lcp = entries[entries.length - 1].startTime;
+    }).observe({type: "largest-contentful-paint", buffered: true});
+} catch (e) {}
+"""
+
+# Returns the navigation and paint timing of the document once it has loaded,
+# and the resources and long tasks since the previous call
+COLLECT_TIMING_SCRIPT = """
+const state = window.__pageTiming
+    || (window.__pageTiming = {longTasks: null, lcp: null, cursor: 0, reported: false});
+const cursor = state.cursor;
+state.cursor = performance.now();
+const result = {url: location.href, navigation: null, action: {}};
+
+const [nav] = performance.getEntriesByType("navigation");
+if (!state.reported && nav && nav.loadEventEnd > 0) {
+    const paint = {};
+    for (const entry of performance.getEntriesByType("paint")) {
+        paint[entry.name] = entry.startTime;
+    }
+    result.navigation = {
+        ttfb: nav.responseStart,
+        dom_content_loaded: nav.domContentLoadedEventEnd,
+        load: nav.loadEventEnd,
+        first_paint: paint["first-paint"] ?? null,
+        first_contentful_paint: paint["first-contentful-paint"] ?? null,
+        largest_contentful_paint: state.lcp,
+        transfer_bytes: nav.transferSize,
+    };
+    state.reported = true;
+}
+
+const resources = performance.getEntriesByType("resource")
+    .filter((entry) => entry.startTime >= cursor);
+result.action.resources = resources.length;
+result.action.resource_bytes = resources.reduce((sum, e) => sum + e.transferSize, 0);
+if (state.longTasks) {
+    const tasks = state.longTasks.filter(([start]) => start >= cursor);
+    result.action.long_tasks = tasks.length;
+    result.action.long_task_time = tasks.reduce((sum, [, duration]) => sum + duration, 0);
+}
+return result;
+"""
+
+
+def format_value(metric: str, value: float) -> str:
+    """Render a metric value with its unit."""
+    unit = METRIC_UNITS.get(metric, "ms")
+    if unit == "B":
+        return f"{value / 1024:.1f}KB"
+    return f"{value:.0f}" if unit == "" else f"{value:.1f}ms"
+
+
+def install_observers(driver: WebDriver) -> None:
+    """
+    Observe long tasks and paints in every document the browser opens.
+
+    Without the observers the collected timing lacks long tasks and the
+    largest contentful paint.
+
+    Args:
+        driver: Chrome WebDriver instance
+    """
+    if not hasattr(driver, "execute_cdp_cmd"):
+        return
+    driver.execute_cdp_cmd(
+        "Page.addScriptToEvaluateOnNewDocument", {"source": OBSERVER_SCRIPT}
+    )
+
+
+@dataclass(frozen=True)
+class BudgetRule:
+    """
+    Performance budget of a page class, e.g. "InventoryPage load p95 < 1500ms".
+
+    Attributes:
+        page: Page object class name
+        metric: Name from NAVIGATION_METRICS or ACTION_METRICS
+        percentile: Percentile the budget applies to
+        limit: Limit in the unit of the metric (ms, bytes or a count)
+        inclusive: Whether the limit itself is allowed ("<=")
+    """
+
+    page: str
+    metric: str
+    percentile: float
+    limit: float
+    inclusive: bool = False
+
+    @classmethod
+    def parse(cls, line: str) -> "BudgetRule":
+        """
+        Parse a rule written as "<PageClass> <metric> p<N> < <value>[ms|s|KB|B]".
+
+        Args:
+            line: Rule text
+
+        Returns:
+            BudgetRule: Parsed rule
+
+        Raises:
+            ValueError: If the text is not a valid rule
+        """
+        match = BUDGET_RULE.match(line.strip())
+        if match is None:
+            raise ValueError(
+                f"Invalid page budget {line!r}, expected e.g. 'InventoryPage load p95 < 1500ms'"
+            )
+        metric = match["metric"]
+        if metric not in NAVIGATION_METRICS + ACTION_METRICS:
+            raise ValueError(f"Unknown page timing metric {metric!r} in {line!r}")
+        unit = match["unit"] or ""
+        if unit not in BUDGET_UNITS[METRIC_UNITS.get(metric, "ms")]:
+            raise ValueError(
+                f"Unit {unit!r} does not fit metric {metric!r} in {line!r}"
+            )
+        return cls(
+            page=match["page"],
+            metric=metric,
+            percentile=float(match["percentile"]),
+            limit=float(match["value"]) * UNIT_FACTORS[unit],
+            inclusive=match["operator"] == "<=",
+        )
+
+    def __str__(self) -> str:
+        operator = "<=" if self.inclusive else "<"
+        return (
+            f"{self.page} {self.metric} p{self.percentile:g} {operator} "
+            f"{format_value(self.metric, self.limit)}"
+        )
+
+
+class PageTimingTracker:
+    """
+    Browser-side timing of page object navigations and actions, per page class.
+
+    Samples of the run are summarised into a trend file, so a metric getting
+    slower than in the previous run is flagged.
+    """
+
+    def __init__(self, path: Path | None = None) -> None:
+        """
+        Initialize the tracker.
+
+        Args:
+            path: JSON file with summaries of previous runs (not written if None)
+        """
+        self.path = path
+        self.trend: list[dict] = []
+        self._pages: dict[str, SampleStore[str]] = {}
+        self._lock = threading.Lock()
+        if path is not None:
+            self.load()
+
+    @property
+    def samples(self) -> dict[str, dict[str, list[float]]]:
+        """Values by page class and metric name."""
+        return {page: store.samples for page, store in self._pages.items()}
+
+    def _store(self, page: str) -> SampleStore[str]:
+        with self._lock:
+            return self._pages.setdefault(page, SampleStore(MAX_SAMPLES))
+
+    def collect(self, driver: WebDriver, page: str) -> None:
+        """
+        Read the timing of the current document and record it for a page class.
+
+        Args:
+            driver: WebDriver instance
+            page: Page object class name
+        """
+        try:
+            result = driver.execute_script(COLLECT_TIMING_SCRIPT)
+        except WebDriverException as e:
+            logger.debug(f"Page timing unavailable: {e.__class__.__name__}")
+            return
+        if result["navigation"]:
+            logger.debug(f"{page} loaded {result['url']}: {result['navigation']}")
+        self.record(page, {**(result["navigation"] or {}), **result["action"]})
+
+    def record(self, page: str, metrics: dict[str, float | None]) -> None:
+        """
+        Record metric values of a page class.
+
+        Args:
+            page: Page object class name
+            metrics: Values by metric name, None for values the browser did not report
+        """
+        store = self._store(page)
+        for metric, value in metrics.items():
+            if value is not None:
+                store.add(metric, float(value))
+
+    def merge(self, samples: dict[str, dict[str, list[float]]]) -> None:
+        """
+        Add samples recorded elsewhere, e.g. by an xdist worker.
+
+        Args:
+            samples: Values by page class and metric name
+        """
+        for page, metrics in samples.items():
+            self._store(page).merge(metrics)
+
+    def percentile(self, page: str, metric: str, percent: float) -> float | None:
+        """
+        Get a percentile of a metric of a page class.
+
+        Args:
+            page: Page object class name
+            metric: Metric name
+            percent: Percentile between 0 and 100
+
+        Returns:
+            float | None: Value, or None without samples
+        """
+        store = self._pages.get(page)
+        return store.percentile(metric, percent) if store is not None else None
+
+    def check(self, rules: list[BudgetRule]) -> list[str]:
+        """
+        Check performance budgets.
+
+        Rules for page classes or metrics without samples are skipped.
+
+        Args:
+            rules: Budgets to check
+
+        Returns:
+            list[str]: Descriptions of the violated budgets
+        """
+        violations = []
+        for rule in rules:
+            actual = self.percentile(rule.page, rule.metric, rule.percentile)
+            if actual is None:
+                continue
+            ok = actual <= rule.limit if rule.inclusive else actual < rule.limit
+            if not ok:
+                violations.append(
+                    f"{rule} (actual {format_value(rule.metric, actual)})"
+                )
+        return violations
+
+    def run_summary(self) -> dict[str, dict[str, dict[str, float]]]:
+        """
+        Summarise the samples of the run for the trend file.
+
+        Returns:
+            dict: p50, p95 and sample count by page class and metric
+        """
+        return {
+            page: {
+                metric: {
+                    "p50": percentile(samples, 50),
+                    "p95": percentile(samples, 95),
+                    "count": len(samples),
+                }
+                for metric, samples in metrics.items()
+            }
+            for page, metrics in self.samples.items()
+        }
+
+    def regressions(self) -> dict[str, tuple[float, float]]:
+        """
+        Find metrics whose p95 grew compared to the previous run in the trend file.
+
+        Returns:
+            dict[str, tuple[float, float]]: "<page> <metric>" to (previous p95, current p95)
+        """
+        if not self.trend:
+            return {}
+        previous = self.trend[-1]["pages"]
+        result = {}
+        for page, metrics in self.samples.items():
+            for metric in metrics:
+                before = previous.get(page, {}).get(metric, {}).get("p95")
+                current = self.percentile(page, metric, 95)
+                if slowed_down(before, current):
+                    result[f"{page} {metric}"] = (before, current)
+        return result
+
+    def summary(self) -> str:
+        """
+        Render p50 and p95 of every metric per page class as text.
+
+        Returns:
+            str: Multi-line summary
+        """
+        lines = [f"{'page':<22} {'metric':<26} {'p50':>10} {'p95':>10} {'n':>5}"]
+        for page in sorted(self.samples):
+            for metric in NAVIGATION_METRICS + ACTION_METRICS:
+                samples = self.samples[page].get(metric)
+                if not samples:
+                    continue
+                lines.append(
+                    f"{page:<22} {metric:<26} "
+                    f"{format_value(metric, percentile(samples, 50)):>10} "
+                    f"{format_value(metric, self.percentile(page, metric, 95)):>10} "
+                    f"{len(samples):>5}"
+                )
+        for key, (before, current) in self.regressions().items():
+            metric = key.split()[-1]
+            lines.append(
+                f"REGRESSED {key}: p95 {format_value(metric, before)} -> "
+                f"{format_value(metric, current)}"
+            )
+        return "\n".join(lines)
+
+    def load(self) -> None:
+        """Load the summaries of previous runs."""
+        try:
+            self.trend = json.loads(self.path.read_text())
+        except (OSError, ValueError):
+            return
+
+    def save(self) -> None:
+        """Append the summary of this run to the trend file."""
+        if self.path is None or not self.samples:
+            return
+        run = {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "pages": self.run_summary(),
+        }
+        trend = (self.trend + [run])[-MAX_TREND_RUNS:]
+        self.path.write_text(json.dumps(trend, indent=2, sort_keys=True))
+
+
+page_timing = PageTimingTracker(
+    Path(config.PAGE_TIMING_TREND_FILE) if config.PAGE_TIMING_TREND_FILE else None
+)
@@ -1,4 +1,4 @@
-from typing import Any, Callable
+from typing import Any, Callable, NamedTuple
 import logging
 import time
 
@@ -11,10 +11,127 @@ from selenium.common.exceptions import (
     TimeoutException,
     StaleElementReferenceException,
     ElementClickInterceptedException,
+    WebDriverException,
+)
+
+from framework import config
+from framework.ui.drivers.tabs import bound_window, focus
+from framework.ui.page_timing import PageTimingTracker, page_timing
+from framework.ui.scripts import FIND_ELEMENT_JS, NEXT_FRAME_JS
+from framework.ui.tracing import traced, tracer
+from framework.ui.waits import (
+    CLICKABLE,
+    INVISIBLE,
+    MAX_SCRIPT_WAIT,
+    MUTATION,
+    PRESENT,
+    VISIBLE,
+    WAIT_STRATEGIES,
+    BackoffWait,
+    LatencyTracker,
+    MutationWait,
+    MutationWaitUnsupported,
+    latency_tracker,
 )
 
 logger = logging.getLogger(__name__)
 
+READ_ELEMENTS_SCRIPT = FIND_ELEMENT_JS + """
+const reads = arguments[0];
+const values = {};
+const missing = [];
+for (const [name, using, value, kind, attribute] of reads) {
+    const el = find(using, value);
+    if (kind === "visible") {
+        values[name] = isVisible(el);
+    } else if (kind === "present") {
+        values[name] = el !== null;
+    } else if (el === null) {
+        missing.push(name);
+    } else if (kind === "attribute") {
+        const property = el[attribute];
+        values[name] = property !== undefined && property !== null
+            ? String(property)
+            : el.getAttribute(attribute);
+    } else {
+        values[name] = el.innerText.trim();
+    }
+}
+return {values: values, missing: missing};
+"""
+
+# Scrolls to the element and resolves once the scroll position and the element
+# position stayed the same for two animation frames and no animation of the
+# element is running
+SCROLL_AND_SETTLE_SCRIPT = NEXT_FRAME_JS + """
+const [el, timeoutMs, done] = arguments;
+el.scrollIntoView(true);
+const deadline = performance.now() + timeoutMs;
+const animating = () => el.getAnimations
+    ? el.getAnimations().some((a) => a.playState === "running")
+    : false;
+let last = null;
+let stableFrames = 0;
+const step = () => {
+    const rect = el.getBoundingClientRect();
+    const position = [window.scrollX, window.scrollY, rect.top, rect.left].join();
+    stableFrames = position === last && !animating() ? stableFrames + 1 : 0;
+    last = position;
+    if (stableFrames >= 2 || performance.now() > deadline) {
+        done(stableFrames >= 2);
+        return;
+    }
+    nextFrame(step);
+};
+nextFrame(step);
+"""
+
+# Resolves once no other element covers the centre point of the element
+WAIT_UNTIL_UNCOVERED_SCRIPT = NEXT_FRAME_JS + """
+const [el, timeoutMs, done] = arguments;
+const deadline = performance.now() + timeoutMs;
+const uncovered = () => {
+    const rect = el.getBoundingClientRect();
+    const top = document.elementFromPoint(
+        rect.left + rect.width / 2, rect.top + rect.height / 2
+    );
+    return top !== null && (top === el || el.contains(top));
+};
+const step = () => {
+    if (!el.isConnected) {
+        done(false);
+    } else if (uncovered()) {
+        done(true);
+    } else if (performance.now() > deadline) {
+        done(false);
+    } else {
+        nextFrame(step);
+    }
+};
+step();
+"""
+
+POLLING_CONDITIONS = {
+    PRESENT: EC.presence_of_element_located,
+    VISIBLE: EC.visibility_of_element_located,
+    CLICKABLE: EC.element_to_be_clickable,
+}
+
+
+class ElementRead(NamedTuple):
+    """
+    Description of a single value to fetch with BasePage.read_elements().
+
+    Attributes:
+        locator: Tuple with By method and locator string
+        kind: "text", "attribute", "visible" or "present"
+        attribute: Attribute name, required when kind is "attribute"
+    """
+
+    locator: tuple[str, str]
+    kind: str = "text"
+    attribute: str | None = None
+
 
 class BasePage:
     """Base class for all page objects in the framework."""
@@ -26,6 +143,11 @@ class BasePage:
         timeout: int = 10,
         polling_interval: float = 0.5,
         max_retry_attempts: int = 3,
+        wait_strategy: str | None = None,
+        adaptive_waits: bool | None = None,
+        tracker: LatencyTracker | None = None,
+        timing: PageTimingTracker | None = None,
+        window_handle: str | None = None,
     ) -> None:
         """
         Initialize the base page.
@@ -36,13 +158,43 @@ class BasePage:
             timeout: Default timeout in seconds for waits
             polling_interval: Interval between polling attempts in seconds
             max_retry_attempts: Maximum number of retry attempts for operations
-        """
-        self.driver = driver
+            wait_strategy: "polling" or "mutation" (uses WAIT_STRATEGY setting if None)
+            adaptive_waits: Poll with exponential back-off tuned by the wait
+                statistics of each locator (uses ADAPTIVE_WAITS setting if None)
+            tracker: Wait statistics (uses the session-wide tracker if None)
+            timing: Browser timing statistics (uses the session-wide tracker if None)
+            window_handle: Window of a shared browser the page lives in (uses
+                the tab of the current test if None)
+        """
+        self._driver = driver
+        self.window_handle = window_handle or bound_window(driver)
         self.url = url
         self.timeout = timeout
         self.polling_interval = polling_interval
         self.max_retry_attempts = max_retry_attempts
+        self.wait_strategy = wait_strategy or config.WAIT_STRATEGY
+        if self.wait_strategy not in WAIT_STRATEGIES:
+            raise ValueError(f"Unknown wait strategy: {self.wait_strategy}")
+        self.adaptive_waits = (
+            adaptive_waits if adaptive_waits is not None else config.ADAPTIVE_WAITS
+        )
+        self.tracker = tracker or latency_tracker
+        self.timing = timing or page_timing
+
+    @property
+    def driver(self) -> WebDriver:
+        """
+        WebDriver instance.
+
+        In a browser shared by several tests, the commands sent through it go
+        to the window of this page; the browser switches windows only when
+        another page or test acted in between.
+        """
+        if self.window_handle is not None:
+            focus(self._driver, self.window_handle)
+        return self._driver
 
+    @traced()
     def open(self) -> None:
         """
         Open the page URL.
@@ -55,6 +207,23 @@ class BasePage:
 
         logger.info(f"Navigating to: {self.url}")
         self.driver.get(self.url)
+        self.collect_timing()
+
+    def collect_timing(self) -> None:
+        """
+        Record the browser timing of the current document for this page class.
+
+        Navigation and paint timing is recorded once per document, resources
+        and long tasks since the previous call. Called on navigation and at
+        the start of every action, so a document is attributed to the first
+        page object acting on it.
+        """
+        if not config.PAGE_TIMING:
+            return
+        # Traced only when collecting, so a disabled collector leaves no
+        # empty nodes in the action breakdown
+        with tracer.span("collect_timing"):
+            self.timing.collect(self.driver, type(self).__name__)
 
     def get_title(self) -> str:
         """Get the page title."""
@@ -64,6 +233,7 @@ class BasePage:
         """Get the current URL."""
         return self.driver.current_url
 
+    @traced()
     def find_element(
         self, locator: tuple[str, str], timeout: int | None = None
     ) -> WebElement:
@@ -83,14 +253,13 @@ class BasePage:
         timeout = timeout if timeout is not None else self.timeout
         try:
             logger.debug(f"Finding element: {locator}")
-            return WebDriverWait(self.driver, timeout, self.polling_interval).until(
-                EC.presence_of_element_located(locator)
-            )
+            return self._wait_until(locator, PRESENT, timeout)
         except TimeoutException:
             logger.error(f"Element not found: {locator}")
             self._take_screenshot(f"element_not_found_{locator[1]}")
             raise
 
+    @traced()
     def find_elements(
         self, locator: tuple[str, str], timeout: int | None = None
     ) -> list[WebElement]:
@@ -107,14 +276,18 @@ class BasePage:
         timeout = timeout if timeout is not None else self.timeout
         try:
             logger.debug(f"Finding elements: {locator}")
-            WebDriverWait(self.driver, timeout, self.polling_interval).until(
-                lambda driver: len(driver.find_elements(*locator)) > 0
+            if self.wait_strategy == MUTATION:
+                self._wait_until(locator, PRESENT, timeout)
+                return self.driver.find_elements(*locator)
+            # The non-empty list ends the wait, no need to look it up again
+            return WebDriverWait(self.driver, timeout, self.polling_interval).until(
+                lambda driver: driver.find_elements(*locator)
             )
-            return self.driver.find_elements(*locator)
         except TimeoutException:
             logger.warning(f"No elements found: {locator}")
             return []
 
+    @traced()
     def is_element_visible(
         self, locator: tuple[str, str], timeout: int | None = None
     ) -> bool:
@@ -130,13 +303,12 @@ class BasePage:
         """
         timeout = timeout if timeout is not None else self.timeout
         try:
-            WebDriverWait(self.driver, timeout, self.polling_interval).until(
-                EC.visibility_of_element_located(locator)
-            )
+            self._wait_until(locator, VISIBLE, timeout)
             return True
         except TimeoutException:
             return False
 
+    @traced()
     def is_element_present(
         self, locator: tuple[str, str], timeout: int | None = None
     ) -> bool:
@@ -152,13 +324,12 @@ class BasePage:
         """
         timeout = timeout if timeout is not None else self.timeout
         try:
-            WebDriverWait(self.driver, timeout, self.polling_interval).until(
-                EC.presence_of_element_located(locator)
-            )
+            self._wait_until(locator, PRESENT, timeout)
             return True
         except TimeoutException:
             return False
 
+    @traced()
     def wait_for_element_clickable(
         self, locator: tuple[str, str], timeout: int | None = None
     ) -> WebElement:
@@ -178,14 +349,13 @@ class BasePage:
         timeout = timeout if timeout is not None else self.timeout
         try:
             logger.debug(f"Waiting for element to be clickable: {locator}")
-            return WebDriverWait(self.driver, timeout, self.polling_interval).until(
-                EC.element_to_be_clickable(locator)
-            )
+            return self._wait_until(locator, CLICKABLE, timeout)
         except TimeoutException:
             logger.error(f"Element not clickable: {locator}")
             self._take_screenshot(f"element_not_clickable_{locator[1]}")
             raise
 
+    @traced()
     def click_element(
         self,
         locator: tuple[str, str],
@@ -205,6 +375,7 @@ class BasePage:
         """
         timeout = timeout if timeout is not None else self.timeout
         retry_count = 0
+        self.collect_timing()
 
         while retry_count < self.max_retry_attempts:
             try:
@@ -225,8 +396,34 @@ class BasePage:
 
                 logger.warning(f"Retrying click due to {e.__class__.__name__}")
                 retry_count += 1
-                time.sleep(self.polling_interval)
+                # A stale element is simply looked up again; an intercepted
+                # click waits until the covering element is gone
+                if isinstance(e, ElementClickInterceptedException):
+                    self._wait_until_uncovered(element, timeout)
+
+    @traced(wait=True)
+    def _wait_until_uncovered(self, element: WebElement, timeout: float) -> bool:
+        """
+        Wait until no other element covers the centre point of an element.
+
+        Args:
+            element: Element that is about to be clicked
+            timeout: Timeout in seconds
 
+        Returns:
+            bool: True if the element is uncovered, False on timeout or if the
+            element went stale
+        """
+        try:
+            return self.driver.execute_async_script(
+                WAIT_UNTIL_UNCOVERED_SCRIPT,
+                element,
+                int(min(timeout, MAX_SCRIPT_WAIT) * 1000),
+            )
+        except WebDriverException:
+            return False
+
+    @traced()
     def input_text(
         self,
         locator: tuple[str, str],
@@ -244,6 +441,7 @@ class BasePage:
             timeout: Timeout in seconds (uses instance default if None)
         """
         timeout = timeout if timeout is not None else self.timeout
+        self.collect_timing()
         element = self.find_element(locator, timeout)
 
         if clear_first:
@@ -252,6 +450,7 @@ class BasePage:
         logger.debug(f"Inputting text into element: {locator}")
         element.send_keys(text)
 
+    @traced()
     def get_text(self, locator: tuple[str, str], timeout: int | None = None) -> str:
         """
         Get text from element.
@@ -264,9 +463,11 @@ class BasePage:
             str: Element text
         """
         timeout = timeout if timeout is not None else self.timeout
+        self.collect_timing()
         element = self.find_element(locator, timeout)
         return element.text
 
+    @traced()
     def get_attribute(
         self, locator: tuple[str, str], attribute: str, timeout: int | None = None
     ) -> str | None:
@@ -282,9 +483,54 @@ class BasePage:
             str | None: Attribute value or None if not present
         """
         timeout = timeout if timeout is not None else self.timeout
+        self.collect_timing()
         element = self.find_element(locator, timeout)
         return element.get_attribute(attribute)
 
+    @traced()
+    def read_elements(
+        self, reads: dict[str, ElementRead], timeout: int | None = None
+    ) -> dict[str, Any]:
+        """
+        Read text, attributes and visibility of many elements at once.
+
+        All values are resolved by a single JavaScript call per polling attempt
+        instead of one wait and several WebDriver commands per element. Text and
+        attribute reads wait until their elements are present; visibility and
+        presence are reported as they are at that moment.
+
+        Args:
+            reads: Mapping of result name to the value to read
+            timeout: Timeout in seconds (uses instance default if None)
+
+        Returns:
+            dict[str, Any]: Mapping of result name to text, attribute value or bool
+
+        Raises:
+            TimeoutException: If a text or attribute element is not found within timeout
+        """
+        timeout = timeout if timeout is not None else self.timeout
+        self.collect_timing()
+        payload = [
+            [name, read.locator[0], read.locator[1], read.kind, read.attribute]
+            for name, read in reads.items()
+        ]
+        missing: list[str] = []
+
+        def all_resolved(driver: WebDriver) -> dict[str, Any] | bool:
+            result = driver.execute_script(READ_ELEMENTS_SCRIPT, payload)
+            missing[:] = result["missing"]
+            return result["values"] if not missing else False
+
+        try:
+            logger.debug(f"Reading elements: {list(reads)}")
+            return self.wait_for_condition(all_resolved, timeout)
+        except TimeoutException:
+            logger.error(f"Elements not found: {missing}")
+            self._take_screenshot(f"elements_not_found_{'_'.join(missing)}")
+            raise
+
+    @traced(wait=True)
     def wait_for_condition(
         self,
         condition: Callable[[WebDriver], Any],
@@ -310,11 +556,12 @@ class BasePage:
             condition, message
         )
 
+    @traced()
     def scroll_to_element(
         self, locator: tuple[str, str], timeout: int | None = None
     ) -> None:
         """
-        Scroll to element.
+        Scroll to element and wait until the scroll position settles.
 
         Args:
             locator: Tuple with By method and locator string
@@ -322,10 +569,13 @@ class BasePage:
         """
         timeout = timeout if timeout is not None else self.timeout
         element = self.find_element(locator, timeout)
-        self.driver.execute_script("arguments[0].scrollIntoView(true);", element)
-        # Small pause to allow the page to settle after scrolling
-        time.sleep(0.5)
+        settled = self.driver.execute_async_script(
+            SCROLL_AND_SETTLE_SCRIPT, element, int(min(timeout, MAX_SCRIPT_WAIT) * 1000)
+        )
+        if not settled:
+            logger.warning(f"Page did not settle after scrolling to: {locator}")
 
+    @traced()
     def hover_over_element(
         self, locator: tuple[str, str], timeout: int | None = None
     ) -> None:
@@ -411,6 +661,7 @@ class BasePage:
             self._take_screenshot("alert_not_present")
             raise
 
+    @traced()
     def _take_screenshot(self, name: str) -> None:
         """
         Take a screenshot and attach it to Allure report.
@@ -423,15 +674,17 @@ class BasePage:
 
             import allure
 
-            allure.attach(
-                screenshot_data,
-                name=f"Screenshot: {name}",
-                attachment_type=allure.attachment_type.PNG,
-            )
+            with tracer.span("allure.attach"):
+                allure.attach(
+                    screenshot_data,
+                    name=f"Screenshot: {name}",
+                    attachment_type=allure.attachment_type.PNG,
+                )
             logger.info(f"Screenshot attached to Allure report: {name}")
         except Exception as e:
             logger.error(f"Failed to take screenshot: {str(e)}")
 
+    @traced(wait=True)
     def wait_for_page_load(self, timeout: int | None = None) -> None:
         """
         Wait for page to load completely.
@@ -445,7 +698,9 @@ class BasePage:
             timeout,
             "Page did not load completely",
         )
+        self.collect_timing()
 
+    @traced(wait=True)
     def wait_for_element_to_disappear(
         self, locator: tuple[str, str], timeout: int | None = None
     ) -> None:
@@ -458,6 +713,58 @@ class BasePage:
         """
         timeout = timeout if timeout is not None else self.timeout
         logger.debug(f"Waiting for element to disappear: {locator}")
-        WebDriverWait(self.driver, timeout, self.polling_interval).until_not(
-            EC.visibility_of_element_located(locator)
-        )
+        self._wait_until(locator, INVISIBLE, timeout)
+
+    @traced(wait=True)
+    def _wait_until(
+        self, locator: tuple[str, str], condition: str, timeout: float
+    ) -> WebElement | bool:
+        """
+        Wait for an element condition using the configured wait strategy.
+
+        The mutation strategy falls back to polling if the browser cannot run
+        the MutationObserver script.
+
+        Args:
+            locator: Tuple with By method and locator string
+            condition: One of "present", "visible", "clickable" or "invisible"
+            timeout: Timeout in seconds
+
+        Returns:
+            WebElement | bool: The element, or True for the "invisible" condition
+
+        Raises:
+            TimeoutException: If the condition is not met within timeout
+        """
+        key = LatencyTracker.key(locator, condition)
+        start = time.perf_counter()
+        try:
+            result = self._run_wait(key, locator, condition, timeout)
+        except TimeoutException:
+            # Counted apart, so expected timeouts do not skew the wait times
+            self.tracker.record(key, time.perf_counter() - start, timed_out=True)
+            raise
+        self.tracker.record(key, time.perf_counter() - start)
+        return result
+
+    def _run_wait(
+        self, key: str, locator: tuple[str, str], condition: str, timeout: float
+    ) -> WebElement | bool:
+        if self.wait_strategy == MUTATION:
+            try:
+                return MutationWait(self.driver, timeout).until(locator, condition)
+            except MutationWaitUnsupported as e:
+                logger.warning(f"Mutation wait unavailable, polling instead: {e}")
+
+        if self.adaptive_waits:
+            wait = BackoffWait(
+                self.driver,
+                timeout,
+                initial_interval=self.tracker.initial_interval(key),
+                max_interval=self.polling_interval,
+            )
+        else:
+            wait = WebDriverWait(self.driver, timeout, self.polling_interval)
+        if condition == INVISIBLE:
+            return wait.until_not(EC.visibility_of_element_located(locator))
+        return wait.until(POLLING_CONDITIONS[condition](locator))
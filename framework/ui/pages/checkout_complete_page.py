@@ -1,7 +1,7 @@
 from framework.ui.locators.checkout_complete_page_locators import (
     CheckoutCompletePageLocators,
 )
-from framework.ui.pages.base_page import BasePage
+from framework.ui.pages.base_page import BasePage, ElementRead
 
 
 class CheckoutCompletePage(BasePage):
@@ -30,3 +30,19 @@ class CheckoutCompletePage(BasePage):
             str: The completion text with shipping information
         """
         return self.get_text(locator=CheckoutCompletePageLocators.COMPLETE_TEXT)
+
+    def get_confirmation_texts(self) -> dict[str, str]:
+        """Get the title, header and completion texts with a single browser round-trip.
+
+        Returns:
+            dict[str, str]: Texts under the keys "title", "header" and "text"
+        """
+        return self.read_elements(
+            {
+                "title": ElementRead(CheckoutCompletePageLocators.TITLE_TEXT),
+                "header": ElementRead(
+                    CheckoutCompletePageLocators.COMPLETE_HEADER_TEXT
+                ),
+                "text": ElementRead(CheckoutCompletePageLocators.COMPLETE_TEXT),
+            }
+        )
@@ -1,7 +1,7 @@
 from framework.ui.locators.cheackout_step_two_page_locators import (
     CheckoutStepTwoPageLocator,
 )
-from framework.ui.pages.base_page import BasePage
+from framework.ui.pages.base_page import BasePage, ElementRead
 
 
 class CheckoutStepTwoPage(BasePage):
@@ -31,6 +31,20 @@ class CheckoutStepTwoPage(BasePage):
         """
         return self.get_text(locator=CheckoutStepTwoPageLocator.TOTAL_TEXT)
 
+    def get_summary_texts(self) -> dict[str, str]:
+        """Get the subtotal, tax and total texts with a single browser round-trip.
+
+        Returns:
+            dict[str, str]: Texts under the keys "item_total", "tax" and "total"
+        """
+        return self.read_elements(
+            {
+                "item_total": ElementRead(CheckoutStepTwoPageLocator.ITEM_TOTAL_TEXT),
+                "tax": ElementRead(CheckoutStepTwoPageLocator.TAX_TEXT),
+                "total": ElementRead(CheckoutStepTwoPageLocator.TOTAL_TEXT),
+            }
+        )
+
     def click_finish_button(self):
         """Click the finish button to complete the order."""
         self.click_element(locator=CheckoutStepTwoPageLocator.FINISH_BUTTON)
@@ -1,5 +1,5 @@
 from framework.ui.locators.login_page_locators import LoginPageLocators
-from framework.ui.pages.base_page import BasePage
+from framework.ui.pages.base_page import BasePage, ElementRead
 
 
 class LoginPage(BasePage):
@@ -47,9 +47,13 @@ class LoginPage(BasePage):
         Returns:
             tuple: A tuple containing (username, password)
         """
-        usernames = self.get_text(locator=LoginPageLocators.USERNAMES_TEXT)
-        passwords = self.get_text(locator=LoginPageLocators.PASSWORD_TEXT)
+        texts = self.read_elements(
+            {
+                "usernames": ElementRead(LoginPageLocators.USERNAMES_TEXT),
+                "passwords": ElementRead(LoginPageLocators.PASSWORD_TEXT),
+            }
+        )
 
-        username = usernames.split("\n")[1]
-        password = passwords.split("\n")[-1]
+        username = texts["usernames"].split("\n")[1]
+        password = texts["passwords"].split("\n")[-1]
         return username, password
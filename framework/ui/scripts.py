@@ -0,0 +1,44 @@
+# Defines find(using, value), resolving a Selenium locator to the first matching
+# element or null, and isVisible(element).
+FIND_ELEMENT_JS = """
+const find = (using, value) => {
+    switch (using) {
+        case "xpath":
+            return document.evaluate(
+                value, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null
+            ).singleNodeValue;
+        case "css selector":
+            return document.querySelector(value);
+        case "id":
+            return document.getElementById(value);
+        case "name":
+            return document.querySelector(`[name="${CSS.escape(value)}"]`);
+        case "class name":
+            return document.getElementsByClassName(value)[0] || null;
+        case "tag name":
+            return document.getElementsByTagName(value)[0] || null;
+        case "link text":
+            return Array.from(document.links).find(
+                (a) => a.innerText.trim() === value
+            ) || null;
+        case "partial link text":
+            return Array.from(document.links).find(
+                (a) => a.innerText.includes(value)
+            ) || null;
+    }
+    return null;
+};
+const isVisible = (el) => {
+    if (!el || el.getClientRects().length === 0) return false;
+    const style = window.getComputedStyle(el);
+    return style.visibility !== "hidden" && style.display !== "none";
+};
+"""
+
+# Defines nextFrame(callback), running the callback on the next animation frame,
+# or after ~16ms in hidden tabs where animation frames are paused.
+NEXT_FRAME_JS = """
+const nextFrame = (callback) => document.hidden
+    ? setTimeout(callback, 16)
+    : requestAnimationFrame(callback);
+"""
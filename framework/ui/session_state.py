@@ -0,0 +1,109 @@
+import time
+from dataclasses import dataclass, field
+
+from selenium.webdriver.remote.webdriver import WebDriver
+
+CAPTURE_STORAGE_SCRIPT = """
+const dump = (storage) => {
+    const items = {};
+    for (let i = 0; i < storage.length; i++) {
+        const key = storage.key(i);
+        items[key] = storage.getItem(key);
+    }
+    return items;
+};
+return [dump(window.localStorage), dump(window.sessionStorage)];
+"""
+
+RESTORE_STORAGE_SCRIPT = """
+const [localItems, sessionItems] = arguments;
+for (const [key, value] of Object.entries(localItems)) {
+    window.localStorage.setItem(key, value);
+}
+for (const [key, value] of Object.entries(sessionItems)) {
+    window.sessionStorage.setItem(key, value);
+}
+"""
+
+
+@dataclass
+class SessionState:
+    """
+    Snapshot of the browser state that keeps a user logged in.
+
+    Attributes:
+        cookies: Cookies of the current domain as returned by WebDriver
+        local_storage: localStorage items of the current origin
+        session_storage: sessionStorage items of the current origin
+    """
+
+    cookies: list[dict] = field(default_factory=list)
+    local_storage: dict[str, str] = field(default_factory=dict)
+    session_storage: dict[str, str] = field(default_factory=dict)
+
+    @classmethod
+    def capture(cls, driver: WebDriver) -> "SessionState":
+        """
+        Capture the state of the page currently open in the browser.
+
+        Args:
+            driver: WebDriver instance
+
+        Returns:
+            SessionState: Captured state
+        """
+        local_storage, session_storage = driver.execute_script(CAPTURE_STORAGE_SCRIPT)
+        return cls(
+            cookies=driver.get_cookies(),
+            local_storage=local_storage,
+            session_storage=session_storage,
+        )
+
+    def is_expired(self) -> bool:
+        """Check whether any captured cookie has already expired."""
+        now = time.time()
+        return any(cookie.get("expiry", now + 1) <= now for cookie in self.cookies)
+
+    def inject(self, driver: WebDriver, url: str) -> None:
+        """
+        Restore the state into a browser and open a page with it.
+
+        Cookies are set through the Chrome DevTools Protocol when available,
+        which avoids loading a page of the target domain first.
+
+        Args:
+            driver: WebDriver instance
+            url: Page to open once the state is restored
+        """
+        if hasattr(driver, "execute_cdp_cmd"):
+            driver.execute_cdp_cmd(
+                "Network.setCookies",
+                {"cookies": [self._to_cdp_cookie(cookie) for cookie in self.cookies]},
+            )
+            driver.get(url)
+        else:
+            driver.get(url)
+            for cookie in self.cookies:
+                driver.add_cookie(cookie)
+            driver.get(url)
+
+        if self.local_storage or self.session_storage:
+            driver.execute_script(
+                RESTORE_STORAGE_SCRIPT, self.local_storage, self.session_storage
+            )
+
+    @staticmethod
+    def _to_cdp_cookie(cookie: dict) -> dict:
+        cdp_cookie = {
+            "name": cookie["name"],
+            "value": cookie["value"],
+            "domain": cookie.get("domain"),
+            "path": cookie.get("path", "/"),
+            "secure": cookie.get("secure", False),
+            "httpOnly": cookie.get("httpOnly", False),
+        }
+        if "expiry" in cookie:
+            cdp_cookie["expires"] = cookie["expiry"]
+        if "sameSite" in cookie:
+            cdp_cookie["sameSite"] = cookie["sameSite"]
+        return cdp_cookie
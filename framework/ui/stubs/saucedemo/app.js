@@ -0,0 +1,259 @@
+// Behaviour of the saucedemo replica: login, inventory, cart and checkout.
+// State lives where the real site keeps it: the logged in user in the
+// "session-username" cookie and the cart in localStorage["cart-contents"].
+(() => {
+    const PRODUCTS = [
+        {
+            id: 4,
+            slug: "sauce-labs-backpack",
+            name: "Sauce Labs Backpack",
+            description: "carry.allTheThings() with the sleek, streamlined Sly Pack that melds uncompromising style with unequaled laptop and tablet protection.",
+            cents: 2999,
+        },
+        {
+            id: 0,
+            slug: "sauce-labs-bike-light",
+            name: "Sauce Labs Bike Light",
+            description: "A red light isn't the desired state in testing but it sure helps when riding your bike at night. Water-resistant with 3 lighting modes, 1 AAA battery included.",
+            cents: 999,
+        },
+        {
+            id: 1,
+            slug: "sauce-labs-bolt-t-shirt",
+            name: "Sauce Labs Bolt T-Shirt",
+            description: "Get your testing superhero on with the Sauce Labs bolt T-shirt. From American Apparel, 100% ringspun combed cotton, heather gray with red bolt.",
+            cents: 1599,
+        },
+        {
+            id: 5,
+            slug: "sauce-labs-fleece-jacket",
+            name: "Sauce Labs Fleece Jacket",
+            description: "It's not every day that you come across a midweight quarter-zip fleece jacket capable of handling everything from a relaxing day outdoors to a busy day at the office.",
+            cents: 4999,
+        },
+        {
+            id: 2,
+            slug: "sauce-labs-onesie",
+            name: "Sauce Labs Onesie",
+            description: "Rib snap infant onesie for the junior automation engineer in development. Reinforced 3-snap bottom closure, two-needle hemmed sleeved and bottom won't unravel.",
+            cents: 799,
+        },
+        {
+            id: 3,
+            slug: "test.allthethings()-t-shirt-(red)",
+            name: "Test.allTheThings() T-Shirt (Red)",
+            description: "This classic Sauce Labs t-shirt is perfect to wear when cozying up to your keyboard to automate a few tests. Super-soft and comfy ringspun combed cotton.",
+            cents: 1599,
+        },
+    ];
+    const USERS = [
+        "standard_user",
+        "locked_out_user",
+        "problem_user",
+        "performance_glitch_user",
+        "error_user",
+        "visual_user",
+    ];
+    const PASSWORD = "secret_sauce";
+    const SESSION_COOKIE = "session-username";
+    const SESSION_SECONDS = 600;
+    const CART_KEY = "cart-contents";
+    const TAX_RATE = 0.08;
+
+    const $ = (selector, root = document) => root.querySelector(selector);
+    const product = (id) => PRODUCTS.find((item) => item.id === id);
+    const money = (cents) => `$${(cents / 100).toFixed(2)}`;
+    const go = (page) => window.location.assign(page);
+
+    const sessionUser = () => {
+        const cookie = document.cookie
+            .split("; ")
+            .find((entry) => entry.startsWith(`${SESSION_COOKIE}=`));
+        return cookie ? cookie.slice(SESSION_COOKIE.length + 1) : null;
+    };
+
+    const cart = () => {
+        try {
+            return JSON.parse(window.localStorage.getItem(CART_KEY)) || [];
+        } catch (e) {
+            return [];
+        }
+    };
+
+    const saveCart = (ids) => {
+        if (ids.length) {
+            window.localStorage.setItem(CART_KEY, JSON.stringify(ids));
+        } else {
+            window.localStorage.removeItem(CART_KEY);
+        }
+        updateBadge();
+    };
+
+    const updateBadge = () => {
+        const link = $(".shopping_cart_link");
+        if (!link) return;
+        const count = cart().length;
+        let badge = $(".shopping_cart_badge", link);
+        if (!count) {
+            if (badge) badge.remove();
+            return;
+        }
+        if (!badge) {
+            badge = document.createElement("span");
+            badge.className = "shopping_cart_badge";
+            badge.dataset.test = "shopping-cart-badge";
+            link.appendChild(badge);
+        }
+        badge.textContent = String(count);
+    };
+
+    const showError = (form, message) => {
+        const container = $(".error-message-container", form);
+        container.className = "error-message-container error";
+        container.innerHTML = '<h3 data-test="error"></h3>';
+        $("h3", container).textContent = message;
+    };
+
+    const cartItem = (item, removable) => `
+        <div class="cart_item" data-test="inventory-item">
+          <div class="cart_quantity" data-test="item-quantity">1</div>
+          <div class="cart_item_label">
+            <a href="#" id="item_${item.id}_title_link" data-test="item-${item.id}-title-link"><div class="inventory_item_name" data-test="inventory-item-name">${item.name}</div></a>
+            <div class="inventory_item_desc" data-test="inventory-item-desc">${item.description}</div>
+            <div class="item_pricebar">
+              <div class="inventory_item_price" data-test="inventory-item-price">${money(item.cents)}</div>
+              ${removable ? `<button class="btn btn_secondary btn_small cart_button" data-test="remove-${item.slug}" id="remove-${item.slug}" name="remove-${item.slug}" data-id="${item.id}">Remove</button>` : ""}
+            </div>
+          </div>
+        </div>`;
+
+    const inventoryButton = (item, inCart) => inCart
+        ? `<button class="btn btn_secondary btn_small btn_inventory " data-test="remove-${item.slug}" id="remove-${item.slug}" name="remove-${item.slug}" data-id="${item.id}">Remove</button>`
+        : `<button class="btn btn_primary btn_small btn_inventory " data-test="add-to-cart-${item.slug}" id="add-to-cart-${item.slug}" name="add-to-cart-${item.slug}" data-id="${item.id}">Add to cart</button>`;
+
+    const inventoryItem = (item, inCart) => `
+        <div class="inventory_item" data-test="inventory-item">
+          <div class="inventory_item_img"><div class="inventory_item_img" role="img" aria-label="${item.name}"></div></div>
+          <div class="inventory_item_description" data-test="inventory-item-description">
+            <div class="inventory_item_label">
+              <a href="#" id="item_${item.id}_title_link" data-test="item-${item.id}-title-link"><div class="inventory_item_name " data-test="inventory-item-name">${item.name}</div></a>
+              <div class="inventory_item_desc" data-test="inventory-item-desc">${item.description}</div>
+            </div>
+            <div class="pricebar">
+              <div class="inventory_item_price" data-test="inventory-item-price">${money(item.cents)}</div>
+              ${inventoryButton(item, inCart)}
+            </div>
+          </div>
+        </div>`;
+
+    const pages = {
+        login: () => {
+            const form = $("#login_button_container form");
+            form.addEventListener("submit", (event) => {
+                event.preventDefault();
+                const username = $("#user-name").value;
+                const password = $("#password").value;
+                let error = null;
+                if (!username) {
+                    error = "Username is required";
+                } else if (!password) {
+                    error = "Password is required";
+                } else if (!USERS.includes(username) || password !== PASSWORD) {
+                    error = "Username and password do not match any user in this service";
+                } else if (username === "locked_out_user") {
+                    error = "Sorry, this user has been locked out.";
+                }
+                if (error) {
+                    showError(form, `Epic sadface: ${error}`);
+                    return;
+                }
+                document.cookie =
+                    `${SESSION_COOKIE}=${username}; path=/; max-age=${SESSION_SECONDS}`;
+                go("inventory.html");
+            });
+        },
+
+        inventory: () => {
+            const list = $(".inventory_list");
+            const ids = cart();
+            list.innerHTML = PRODUCTS
+                .map((item) => inventoryItem(item, ids.includes(item.id)))
+                .join("");
+            list.addEventListener("click", (event) => {
+                const button = event.target.closest("button.btn_inventory");
+                if (!button) return;
+                const item = product(Number(button.dataset.id));
+                const current = cart();
+                const inCart = current.includes(item.id);
+                saveCart(inCart
+                    ? current.filter((id) => id !== item.id)
+                    : [...current, item.id]);
+                button.outerHTML = inventoryButton(item, !inCart);
+            });
+        },
+
+        cart: () => {
+            $(".removed_cart_item").insertAdjacentHTML(
+                "beforebegin",
+                cart().map((id) => cartItem(product(id), true)).join(""),
+            );
+            $(".cart_list").addEventListener("click", (event) => {
+                const button = event.target.closest("button.cart_button");
+                if (!button) return;
+                const id = Number(button.dataset.id);
+                saveCart(cart().filter((item) => item !== id));
+                button.closest(".cart_item").remove();
+            });
+            $("#continue-shopping").addEventListener("click", () => go("inventory.html"));
+            $("#checkout").addEventListener("click", () => go("checkout-step-one.html"));
+        },
+
+        "checkout-step-one": () => {
+            const form = $(".checkout_info_wrapper form");
+            form.addEventListener("submit", (event) => {
+                event.preventDefault();
+                const missing = [
+                    ["#first-name", "First Name"],
+                    ["#last-name", "Last Name"],
+                    ["#postal-code", "Postal Code"],
+                ].find(([selector]) => !$(selector).value);
+                if (missing) {
+                    showError(form, `Error: ${missing[1]} is required`);
+                    return;
+                }
+                go("checkout-step-two.html");
+            });
+            $("#cancel").addEventListener("click", () => go("cart.html"));
+        },
+
+        "checkout-step-two": () => {
+            const items = cart().map(product);
+            $(".cart_list").insertAdjacentHTML(
+                "beforeend",
+                items.map((item) => cartItem(item, false)).join(""),
+            );
+            const subtotal = items.reduce((sum, item) => sum + item.cents, 0);
+            const tax = Math.round(subtotal * TAX_RATE);
+            $(".summary_subtotal_label").textContent = `Item total: ${money(subtotal)}`;
+            $(".summary_tax_label").textContent = `Tax: ${money(tax)}`;
+            $(".summary_total_label").textContent = `Total: ${money(subtotal + tax)}`;
+            $("#cancel").addEventListener("click", () => go("inventory.html"));
+            $("#finish").addEventListener("click", () => {
+                saveCart([]);
+                go("checkout-complete.html");
+            });
+        },
+
+        "checkout-complete": () => {
+            $("#back-to-products").addEventListener("click", () => go("inventory.html"));
+        },
+    };
+
+    const page = document.body.dataset.page;
+    if (page !== "login" && !sessionUser()) {
+        window.location.replace("./");
+        return;
+    }
+    updateBadge();
+    pages[page]();
+})();
@@ -0,0 +1,106 @@
+import argparse
+import logging
+import threading
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+# Static replica of the saucedemo login, inventory, cart and checkout pages
+SITE_DIR = Path(__file__).parent / "saucedemo"
+
+
+class SiteHandler(SimpleHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Headers and body go out in separate writes; without TCP_NODELAY delayed
+    # ACKs add ~40ms to every response
+    disable_nagle_algorithm = True
+
+    def end_headers(self) -> None:
+        # Let the browser reuse the script and stylesheet between page loads
+        if self.path.endswith((".js", ".css")):
+            self.send_header("Cache-Control", "max-age=3600")
+        super().end_headers()
+
+    def log_message(self, format: str, *args) -> None:
+        logger.debug(format % args)
+
+
+class SiteServer:
+    """
+    Serves the bundled saucedemo replica on a local port, so UI tests run
+    offline and without the latency of the real site.
+    """
+
+    def __init__(
+        self, directory: Path = SITE_DIR, host: str = "127.0.0.1", port: int = 0
+    ) -> None:
+        """
+        Initialize the server.
+
+        Args:
+            directory: Directory with the pages to serve
+            host: Interface to listen on
+            port: Port to listen on (a free port is picked if 0)
+        """
+        self.directory = directory
+        self.httpd = ThreadingHTTPServer(
+            (host, port), partial(SiteHandler, directory=str(directory))
+        )
+        self.httpd.daemon_threads = True
+        self._thread: threading.Thread | None = None
+
+    @property
+    def url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}/"
+
+    def start(self) -> "SiteServer":
+        """
+        Start serving in a background thread.
+
+        Returns:
+            SiteServer: The started server
+        """
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self._thread.start()
+        logger.info(f"Site server listening on {self.url}")
+        return self
+
+    def stop(self) -> None:
+        """
+        Stop serving and release the port.
+        """
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self) -> "SiteServer":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Serve the saucedemo replica over HTTP"
+    )
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    args = parser.parse_args()
+
+    server = SiteServer(host=args.host, port=args.port)
+    print(f"Serving the saucedemo replica on {server.url}")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.httpd.server_close()
+
+
+if __name__ == "__main__":
+    main()
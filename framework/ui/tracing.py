@@ -0,0 +1,389 @@
+import functools
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Callable, Iterator, TypeVar
+
+from allure_commons.types import AttachmentType
+
+from framework import config
+from framework.allure_results import write_session_result
+from framework.ui.drivers.commands import command_log
+
+logger = logging.getLogger(__name__)
+
+F = TypeVar("F", bound=Callable)
+
+SCREENSHOT = "_take_screenshot"
+
+
+@dataclass
+class TraceNode:
+    """
+    Calls of one action at one position of the call tree, merged like the
+    frames of a flame graph.
+
+    Attributes:
+        name: Action name, with the locator if it has one
+        calls: Number of calls
+        total: Seconds spent, children included
+        commands: WebDriver commands issued, children included
+        command_time: Seconds spent in WebDriver round trips, children included
+        wait: Seconds spent in waits (only set on the outermost wait)
+        sleep: Seconds of the waits not spent in round trips, i.e. sleeping
+        children: Actions called by this one, by name
+    """
+
+    name: str
+    calls: int = 0
+    total: float = 0.0
+    commands: int = 0
+    command_time: float = 0.0
+    wait: float = 0.0
+    sleep: float = 0.0
+    children: dict[str, "TraceNode"] = field(default_factory=dict)
+
+    @property
+    def self_time(self) -> float:
+        return max(0.0, self.total - sum(c.total for c in self.children.values()))
+
+    def walk(self) -> Iterator["TraceNode"]:
+        """Yield this node and all nodes below it."""
+        yield self
+        for child in self.children.values():
+            yield from child.walk()
+
+    def render(self, depth: int = 0) -> list[str]:
+        """
+        Render the tree as indented lines, slowest actions first.
+
+        Returns:
+            list[str]: One line per node
+        """
+        lines = [
+            f"{self.total * 1000:9.1f}ms {self.calls:4d}x {self.commands:4d} cmd "
+            f"{self.command_time * 1000:8.1f}ms rt  {'  ' * depth}{self.name}"
+        ]
+        for child in sorted(self.children.values(), key=lambda c: -c.total):
+            lines.extend(child.render(depth + 1))
+        return lines
+
+    def folded(self, prefix: str = "") -> list[str]:
+        """
+        Render the tree in the folded stack format of flamegraph.pl and speedscope.
+
+        Returns:
+            list[str]: "frame;frame;frame <self time in µs>" lines
+        """
+        stack = f"{prefix};{self.name}" if prefix else self.name
+        lines = [f"{stack} {round(self.self_time * 1e6)}"] if self.self_time else []
+        for child in self.children.values():
+            lines.extend(child.folded(stack))
+        return lines
+
+
+@dataclass
+class LocatorTiming:
+    """
+    Time spent on the actions of one locator across the session.
+
+    Attributes:
+        calls: Actions performed on the locator
+        total: Seconds spent in them
+        slowest: Seconds of the slowest action
+        commands: WebDriver commands they issued
+    """
+
+    calls: int = 0
+    total: float = 0.0
+    slowest: float = 0.0
+    commands: int = 0
+
+    def add(self, seconds: float, commands: int) -> None:
+        self.calls += 1
+        self.total += seconds
+        self.slowest = max(self.slowest, seconds)
+        self.commands += commands
+
+
+@dataclass
+class _Frame:
+    node: TraceNode
+    locator: str | None
+    outermost_wait: bool
+    start: float
+    commands: int
+    command_time: float
+
+
+class _TraceState(threading.local):
+    """Call tree, open calls and command counters, per thread."""
+
+    def __init__(self) -> None:
+        self.root = TraceNode("test")
+        self.stack: list[_Frame] = []
+        self.commands = 0
+        self.command_time = 0.0
+        self.test_start = (0.0, 0, 0.0)
+
+
+class Tracer:
+    """
+    Low-overhead tracing of page object actions.
+
+    Every traced call adds its wall time, WebDriver commands and wait time to
+    the call tree of the current test. Call trees and command counters are
+    kept per thread, so tests running in threads each get their own tree.
+    Locator timings are kept for the whole session.
+    """
+
+    def __init__(self, enabled: bool = True) -> None:
+        """
+        Initialize the tracer.
+
+        Args:
+            enabled: Whether traced calls are recorded
+        """
+        self.enabled = enabled
+        self.locators: dict[str, LocatorTiming] = {}
+        self._state = _TraceState()
+        self._lock = threading.Lock()
+
+    @property
+    def root(self) -> TraceNode:
+        """Call tree of the test the calling thread runs."""
+        return self._state.root
+
+    def record_command(self, command: str, seconds: float) -> None:
+        """
+        Count a WebDriver command, called by the command log.
+
+        Args:
+            command: WebDriver command name
+            seconds: Round-trip time
+        """
+        state = self._state
+        state.commands += 1
+        state.command_time += seconds
+
+    def enter(
+        self, name: str, locator: tuple[str, str] | None = None, wait: bool = False
+    ) -> None:
+        """
+        Start a traced call.
+
+        Args:
+            name: Action name
+            locator: Locator the action works on
+            wait: Whether the action is a wait
+        """
+        state = self._state
+        stack = state.stack
+        parent = stack[-1].node if stack else state.root
+        key = locator[1] if locator else None
+        label = f"{name}({key})" if key else name
+        node = parent.children.get(label)
+        if node is None:
+            node = parent.children[label] = TraceNode(label)
+        outermost_wait = wait and not any(f.outermost_wait for f in stack)
+        stack.append(
+            _Frame(
+                node,
+                key,
+                outermost_wait,
+                time.perf_counter(),
+                state.commands,
+                state.command_time,
+            )
+        )
+
+    def exit(self) -> None:
+        """Finish the innermost traced call."""
+        state = self._state
+        frame = state.stack.pop()
+        elapsed = time.perf_counter() - frame.start
+        commands = state.commands - frame.commands
+        command_time = state.command_time - frame.command_time
+        node = frame.node
+        node.calls += 1
+        node.total += elapsed
+        node.commands += commands
+        node.command_time += command_time
+        if frame.outermost_wait:
+            node.wait += elapsed
+            node.sleep += max(0.0, elapsed - command_time)
+        # Nested calls on the same locator belong to the outer action
+        if frame.locator and not (
+            state.stack and state.stack[-1].locator == frame.locator
+        ):
+            with self._lock:
+                timing = self.locators.setdefault(frame.locator, LocatorTiming())
+                timing.add(elapsed, commands)
+
+    @contextmanager
+    def span(self, name: str, wait: bool = False) -> Iterator[None]:
+        """
+        Trace a block of code.
+
+        Args:
+            name: Span name
+            wait: Whether the block is a wait
+        """
+        if not self.enabled:
+            yield
+            return
+        self.enter(name, wait=wait)
+        try:
+            yield
+        finally:
+            self.exit()
+
+    def start_test(self) -> None:
+        """Start a new call tree for the test of the calling thread."""
+        state = self._state
+        state.root = TraceNode("test")
+        state.stack.clear()
+        state.test_start = (time.perf_counter(), state.commands, state.command_time)
+
+    def finish_test(self) -> TraceNode:
+        """
+        Finish the call tree of the test of the calling thread.
+
+        Returns:
+            TraceNode: Root of the tree, with the commands of the whole test
+        """
+        state = self._state
+        start, commands, command_time = state.test_start
+        root = state.root
+        root.calls = 1
+        root.total = time.perf_counter() - start
+        root.commands = state.commands - commands
+        root.command_time = state.command_time - command_time
+        return root
+
+    @staticmethod
+    def breakdown(root: TraceNode) -> str:
+        """
+        Summarise where the time of a test went.
+
+        Args:
+            root: Call tree returned by finish_test()
+
+        Returns:
+            str: Multi-line breakdown followed by the call tree
+        """
+        actions = sum(child.total for child in root.children.values())
+        nodes = list(root.walk())
+        wait = sum(node.wait for node in nodes)
+        sleep = sum(node.sleep for node in nodes)
+        screenshots = sum(node.total for node in nodes if node.name == SCREENSHOT)
+        lines = [
+            f"Test: {root.total * 1000:.1f}ms, page object actions "
+            f"{actions * 1000:.1f}ms",
+            f"WebDriver round trips: {root.command_time * 1000:.1f}ms "
+            f"({root.commands} commands)",
+            f"Waits: {wait * 1000:.1f}ms, of which sleeping {sleep * 1000:.1f}ms",
+            f"Screenshots: {screenshots * 1000:.1f}ms",
+            "",
+            *root.render(),
+        ]
+        return "\n".join(lines)
+
+    def locator_timings(self) -> dict[str, dict]:
+        """
+        Get the locator timings, e.g. to send them between processes.
+
+        Returns:
+            dict[str, dict]: Timing fields by locator
+        """
+        return {key: asdict(timing) for key, timing in self.locators.items()}
+
+    def merge(self, timings: dict[str, dict]) -> None:
+        """
+        Add locator timings collected elsewhere, e.g. by an xdist worker.
+
+        Args:
+            timings: Timing fields by locator, as returned by locator_timings()
+        """
+        with self._lock:
+            for key, values in timings.items():
+                timing = self.locators.setdefault(key, LocatorTiming())
+                timing.calls += values["calls"]
+                timing.total += values["total"]
+                timing.slowest = max(timing.slowest, values["slowest"])
+                timing.commands += values["commands"]
+
+    def slow_locators(self, limit: int = 10) -> str:
+        """
+        Render the locators with the most time spent on them.
+
+        Args:
+            limit: Maximum number of locators listed
+
+        Returns:
+            str: Multi-line report
+        """
+        rows = sorted(self.locators.items(), key=lambda item: -item[1].total)[:limit]
+        return "\n".join(
+            f"{timing.total * 1000:9.1f}ms total {timing.total / timing.calls * 1000:8.1f}ms "
+            f"mean {timing.slowest * 1000:8.1f}ms max {timing.calls:5d}x "
+            f"{timing.commands / timing.calls:5.1f} cmd/call  {key}"
+            for key, timing in rows
+        )
+
+    def write_allure_result(self, report_dir: str | Path) -> None:
+        """
+        Add a "Slow locators" result with the session-wide report to an
+        Allure results directory.
+
+        Args:
+            report_dir: Allure results directory
+        """
+        write_session_result(
+            report_dir,
+            name="Slow locators",
+            description="Locators with the most time spent on page object actions",
+            attachments=[
+                ("Top slow locators", self.slow_locators(limit=50), AttachmentType.TEXT)
+            ],
+            violations=[],
+            parent_suite="UI Tests",
+            feature="Action tracing",
+        )
+
+
+def traced(wait: bool = False) -> Callable[[F], F]:
+    """
+    Trace a page object method with the session-wide tracer.
+
+    The locator is taken from the first argument or the "locator" keyword.
+
+    Args:
+        wait: Whether the method is a wait
+    """
+
+    def decorator(method: F) -> F:
+        name = method.__name__
+
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            if not tracer.enabled:
+                return method(self, *args, **kwargs)
+            locator = args[0] if args else kwargs.get("locator")
+            tracer.enter(name, locator if isinstance(locator, tuple) else None, wait)
+            try:
+                return method(self, *args, **kwargs)
+            finally:
+                tracer.exit()
+
+        return wrapper
+
+    return decorator
+
+
+tracer = Tracer(enabled=config.TRACE_ACTIONS)
+if tracer.enabled:
+    command_log.listeners.append(tracer.record_command)
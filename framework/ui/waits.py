@@ -0,0 +1,415 @@
+import json
+import logging
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Iterable, Iterator, Literal, TypeVar
+
+from selenium.common.exceptions import (
+    JavascriptException,
+    TimeoutException,
+    WebDriverException,
+)
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.remote.webelement import WebElement
+from selenium.webdriver.support.ui import WebDriverWait
+
+from framework import config
+from framework.samples import SampleStore, percentile, slowed_down
+from framework.ui.scripts import FIND_ELEMENT_JS
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+POLLING = "polling"
+MUTATION = "mutation"
+WAIT_STRATEGIES = (POLLING, MUTATION)
+
+PRESENT = "present"
+VISIBLE = "visible"
+CLICKABLE = "clickable"
+INVISIBLE = "invisible"
+
+# Longest time a single async script may block, kept well below the default
+# WebDriver script timeout of 30 seconds
+MAX_SCRIPT_WAIT = 5.0
+
+# First polling interval of an adaptive wait for a locator without history
+MIN_POLL_INTERVAL = 0.005
+BACKOFF_FACTOR = 2.0
+
+# A locator is flagged when its p95 wait time grows by this factor
+MIN_SAMPLES = 5
+MAX_SAMPLES = 200
+
+# Safety net for changes that do not produce DOM mutations (e.g. layout only)
+FALLBACK_CHECK_INTERVAL_MS = 250
+
+MUTATION_WAIT_SCRIPT = FIND_ELEMENT_JS + """
+const [using, value, condition, timeoutMs, intervalMs, done] = arguments;
+const check = () => {
+    const el = find(using, value);
+    switch (condition) {
+        case "present":
+            return el ? {element: el} : null;
+        case "visible":
+            return isVisible(el) ? {element: el} : null;
+        case "clickable":
+            return isVisible(el) && !el.disabled ? {element: el} : null;
+        case "invisible":
+            return isVisible(el) ? null : {element: null};
+    }
+    return null;
+};
+const initial = check();
+if (initial) {
+    done({found: true, element: initial.element});
+    return;
+}
+let finished = false;
+const finish = (result) => {
+    if (finished) return;
+    finished = true;
+    observer.disconnect();
+    clearTimeout(timer);
+    clearInterval(fallback);
+    done(result);
+};
+const onChange = () => {
+    const result = check();
+    if (result) finish({found: true, element: result.element});
+};
+const observer = new MutationObserver(onChange);
+observer.observe(document, {
+    childList: true, subtree: true, attributes: true, characterData: true
+});
+const fallback = setInterval(onChange, intervalMs);
+const timer = setTimeout(() => finish({found: false}), timeoutMs);
+"""
+
+
+class MutationWaitUnsupported(Exception):
+    """Raised when the browser cannot run MutationObserver based waits."""
+
+
+class MutationWait:
+    """
+    Wait that returns as soon as a DOM condition holds, without polling.
+
+    A MutationObserver is installed through an async script and resolves the
+    script as soon as a mutation makes the condition true. Long waits are split
+    into chunks so a single script never hits the WebDriver script timeout, and
+    a navigation in the middle of a wait simply starts a new chunk on the new
+    document.
+    """
+
+    def __init__(self, driver: WebDriver, timeout: float) -> None:
+        """
+        Initialize the wait.
+
+        Args:
+            driver: WebDriver instance
+            timeout: Timeout in seconds
+        """
+        self.driver = driver
+        self.timeout = timeout
+
+    def until(
+        self, locator: tuple[str, str], condition: str, message: str = ""
+    ) -> WebElement | bool:
+        """
+        Wait until the element matches the condition.
+
+        Args:
+            locator: Tuple with By method and locator string
+            condition: One of "present", "visible", "clickable" or "invisible"
+            message: Error message for TimeoutException
+
+        Returns:
+            WebElement | bool: The element, or True for the "invisible" condition
+
+        Raises:
+            TimeoutException: If the condition is not met within timeout
+            MutationWaitUnsupported: If the browser cannot run the wait script
+        """
+        deadline = time.monotonic() + self.timeout
+        while True:
+            remaining = deadline - time.monotonic()
+            chunk = max(0.0, min(remaining, MAX_SCRIPT_WAIT))
+            try:
+                result = self.driver.execute_async_script(
+                    MUTATION_WAIT_SCRIPT,
+                    locator[0],
+                    locator[1],
+                    condition,
+                    int(chunk * 1000),
+                    FALLBACK_CHECK_INTERVAL_MS,
+                )
+            except JavascriptException as e:
+                if "unloaded" not in (e.msg or ""):
+                    raise MutationWaitUnsupported(str(e)) from e
+                # The document was replaced while waiting; retry on the new one
+                logger.debug("Mutation wait interrupted by navigation")
+                result = {"found": False}
+            except TimeoutException:
+                result = {"found": False}
+            except WebDriverException as e:
+                raise MutationWaitUnsupported(str(e)) from e
+
+            if result is None:
+                raise MutationWaitUnsupported("Async script returned no result")
+            if result["found"]:
+                return result["element"] if condition != INVISIBLE else True
+            if time.monotonic() >= deadline:
+                raise TimeoutException(message)
+
+
+class BackoffWait(WebDriverWait):
+    """
+    WebDriverWait whose polling interval grows exponentially.
+
+    The first checks happen a few milliseconds apart, so fast elements are
+    picked up almost immediately, and the interval doubles up to
+    ``max_interval`` so slow elements do not cost extra WebDriver commands.
+    """
+
+    def __init__(
+        self,
+        driver: WebDriver,
+        timeout: float,
+        initial_interval: float = MIN_POLL_INTERVAL,
+        max_interval: float = 0.5,
+        ignored_exceptions: Iterable[type[Exception]] | None = None,
+    ) -> None:
+        """
+        Initialize the wait.
+
+        Args:
+            driver: WebDriver instance
+            timeout: Timeout in seconds
+            initial_interval: First polling interval in seconds
+            max_interval: Upper bound of the polling interval in seconds
+            ignored_exceptions: Exceptions ignored while polling
+        """
+        super().__init__(driver, timeout, max_interval, ignored_exceptions)
+        self.initial_interval = min(initial_interval, max_interval)
+        self.max_interval = max_interval
+
+    def intervals(self) -> Iterator[float]:
+        """Yield the polling intervals of one wait."""
+        interval = self.initial_interval
+        while True:
+            yield interval
+            interval = min(interval * BACKOFF_FACTOR, self.max_interval)
+
+    def until(
+        self, method: Callable[[WebDriver], Literal[False] | T], message: str = ""
+    ) -> T:
+        return self._poll_until(method, message, expected=True)
+
+    def until_not(
+        self, method: Callable[[WebDriver], T], message: str = ""
+    ) -> T | Literal[True]:
+        return self._poll_until(method, message, expected=False)
+
+    def _poll_until(self, method, message: str, expected: bool):
+        screen = None
+        stacktrace = None
+        end_time = time.monotonic() + self._timeout
+        for interval in self.intervals():
+            try:
+                value = method(self._driver)
+                if bool(value) == expected:
+                    return value
+            except self._ignored_exceptions as exc:
+                if not expected:
+                    return True
+                screen = getattr(exc, "screen", None)
+                stacktrace = getattr(exc, "stacktrace", None)
+            remaining = end_time - time.monotonic()
+            if remaining <= 0:
+                break
+            time.sleep(min(interval, remaining))
+        raise TimeoutException(message, screen, stacktrace)
+
+
+class LatencyTracker:
+    """
+    Per-locator wait time statistics, optionally persisted between runs.
+
+    Samples of the current run are compared against the samples loaded from
+    previous runs (the baseline) to flag locators that are getting slower.
+    Waits that time out are only counted: an expected timeout, e.g. of
+    is_element_present with a short timeout, says nothing about how fast the
+    element appears and would drag the percentiles up to the timeout.
+    """
+
+    def __init__(self, path: Path | None = None) -> None:
+        """
+        Initialize the tracker.
+
+        Args:
+            path: JSON file with statistics of previous runs (not persisted if None)
+        """
+        self.path = path
+        self._store: SampleStore[str] = SampleStore(MAX_SAMPLES)
+        self.samples = self._store.samples
+        self.timeouts: dict[str, int] = {}
+        self._lock = threading.Lock()
+        self.baseline: dict[str, list[float]] = {}
+        if path is not None:
+            self.load()
+
+    @staticmethod
+    def key(locator: tuple[str, str], condition: str) -> str:
+        """Build the statistics key of a locator and wait condition."""
+        return f"{condition} {locator[0]}={locator[1]}"
+
+    def record(self, key: str, seconds: float, timed_out: bool = False) -> None:
+        """
+        Record the time a wait took to succeed, or count a timeout.
+
+        Args:
+            key: Statistics key
+            seconds: Wait time in seconds
+            timed_out: Whether the wait timed out; its time is not sampled
+        """
+        if timed_out:
+            with self._lock:
+                self.timeouts[key] = self.timeouts.get(key, 0) + 1
+            return
+        self._store.add(key, seconds)
+
+    def merge(
+        self,
+        samples: dict[str, list[float]],
+        timeouts: dict[str, int] | None = None,
+    ) -> None:
+        """
+        Add samples recorded elsewhere, e.g. by an xdist worker.
+
+        Args:
+            samples: Mapping of statistics key to wait times in seconds
+            timeouts: Mapping of statistics key to number of timed-out waits
+        """
+        self._store.merge(samples)
+        with self._lock:
+            for key, count in (timeouts or {}).items():
+                self.timeouts[key] = self.timeouts.get(key, 0) + count
+
+    def percentile(
+        self, key: str, percent: float, baseline: bool = False
+    ) -> float | None:
+        """
+        Get a percentile of the recorded wait times.
+
+        Args:
+            key: Statistics key
+            percent: Percentile between 0 and 100
+            baseline: Use samples of previous runs instead of the current run
+
+        Returns:
+            float | None: Wait time in seconds, or None without samples
+        """
+        if baseline:
+            return percentile(self.baseline.get(key, ()), percent)
+        return self._store.percentile(key, percent)
+
+    def initial_interval(self, key: str) -> float:
+        """
+        Choose the first polling interval for a locator.
+
+        Elements that usually take a while start with a longer interval, so
+        the back-off does not waste commands before they can possibly appear.
+
+        Args:
+            key: Statistics key
+
+        Returns:
+            float: Initial polling interval in seconds
+        """
+        p50 = self.percentile(key, 50) or self.percentile(key, 50, baseline=True)
+        if p50 is None:
+            return MIN_POLL_INTERVAL
+        return max(MIN_POLL_INTERVAL, p50 / 4)
+
+    def degraded(self) -> dict[str, tuple[float, float]]:
+        """
+        Find locators whose p95 wait time grew compared to previous runs.
+
+        Returns:
+            dict[str, tuple[float, float]]: Mapping of key to (baseline p95, current p95)
+        """
+        result = {}
+        for key, samples in self.samples.items():
+            if (
+                len(samples) < MIN_SAMPLES
+                or len(self.baseline.get(key, [])) < MIN_SAMPLES
+            ):
+                continue
+            baseline_p95 = self.percentile(key, 95, baseline=True)
+            current_p95 = self.percentile(key, 95)
+            if slowed_down(baseline_p95, current_p95):
+                result[key] = (baseline_p95, current_p95)
+        return result
+
+    def summary(self, limit: int = 10) -> str:
+        """
+        Render the slowest locators, the degraded ones and the timeouts as text.
+
+        Args:
+            limit: Maximum number of locators listed
+
+        Returns:
+            str: Multi-line summary
+        """
+        rows = sorted(
+            self.samples,
+            key=lambda key: self.percentile(key, 95) or 0.0,
+            reverse=True,
+        )[:limit]
+        lines = [
+            f"{self.percentile(key, 50) * 1000:8.1f}ms p50 "
+            f"{self.percentile(key, 95) * 1000:8.1f}ms p95 "
+            f"{len(self.samples[key]):5d}x  {key}"
+            for key in rows
+        ]
+        for key, (baseline_p95, current_p95) in self.degraded().items():
+            lines.append(
+                f"DEGRADED {key}: p95 {baseline_p95 * 1000:.1f}ms -> "
+                f"{current_p95 * 1000:.1f}ms"
+            )
+        for key, count in sorted(self.timeouts.items(), key=lambda item: -item[1]):
+            lines.append(f"TIMED OUT {count:5d}x  {key}")
+        return "\n".join(lines)
+
+    def load(self) -> None:
+        """Load the samples of previous runs as the baseline."""
+        try:
+            data = json.loads(self.path.read_text())
+        except (OSError, ValueError):
+            return
+        self.baseline = {key: entry["samples"] for key, entry in data.items()}
+
+    def save(self) -> None:
+        """Merge the samples of this run into the statistics file."""
+        if self.path is None or not self.samples:
+            return
+        merged = dict(self.baseline)
+        for key, samples in self.samples.items():
+            merged[key] = (merged.get(key, []) + samples)[-MAX_SAMPLES:]
+        data = {
+            key: {
+                "samples": samples,
+                "p50": percentile(samples, 50),
+                "p95": percentile(samples, 95),
+            }
+            for key, samples in merged.items()
+        }
+        self.path.write_text(json.dumps(data, indent=2, sort_keys=True))
+
+
+latency_tracker = LatencyTracker(
+    Path(config.WAIT_STATS_FILE) if config.WAIT_STATS_FILE else None
+)
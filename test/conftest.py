@@ -0,0 +1,269 @@
+from dataclasses import asdict
+from pathlib import Path
+
+import pytest
+
+from framework import config as settings
+from framework.api.clients.connection import connection_metrics
+from framework.api.clients.resilience import retry_stats
+from framework.api.metrics import SlaRule, api_metrics
+from framework.parallel import (
+    DurationRecorder,
+    get_worker_id,
+    is_xdist_worker,
+    load_durations,
+    merge_worker_results,
+    order_by_weight,
+    save_durations,
+    worker_results_dir,
+)
+from framework.ui.drivers.commands import command_log
+from framework.ui.drivers.driver_pool import PoolStats
+from framework.ui.drivers.network import TrafficStats, network_stats, resource_sizes
+from framework.ui.drivers.tabs import TabStats
+from framework.ui.page_timing import BudgetRule, page_timing
+from framework.ui.tracing import tracer
+from framework.ui.waits import latency_tracker
+from test.test_ui.fixtures.driver_fixtures import driver_pool_key, tab_browser_key
+
+duration_recorder_key = pytest.StashKey[DurationRecorder]()
+sla_rules_key = pytest.StashKey[list[SlaRule]]()
+sla_violations_key = pytest.StashKey[list[str]]()
+page_budgets_key = pytest.StashKey[list[BudgetRule]]()
+budget_violations_key = pytest.StashKey[list[str]]()
+worker_pool_stats_key = pytest.StashKey[PoolStats]()
+worker_tab_stats_key = pytest.StashKey[TabStats]()
+
+
+def pytest_addoption(parser):
+    parser.addini(
+        "api_sla",
+        type="linelist",
+        help='API latency SLA rules, one per line, e.g. "GET /posts/{id} p95 < 200ms"',
+    )
+    parser.addini(
+        "page_budget",
+        type="linelist",
+        help='Browser timing budgets per page class, e.g. "InventoryPage load p95 < 1500ms"',
+    )
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_configure(config):
+    """
+    Read the API latency SLA and the page budgets, and give every xdist worker
+    its own Allure results directory.
+    """
+    try:
+        config.stash[sla_rules_key] = [
+            SlaRule.parse(line) for line in config.getini("api_sla")
+        ]
+        config.stash[page_budgets_key] = [
+            BudgetRule.parse(line) for line in config.getini("page_budget")
+        ]
+    except ValueError as e:
+        raise pytest.UsageError(str(e))
+
+    alluredir = getattr(config.option, "allure_report_dir", None)
+    if is_xdist_worker(config):
+        if alluredir:
+            config.option.allure_report_dir = str(
+                worker_results_dir(alluredir, get_worker_id())
+            )
+        return
+
+    recorder = DurationRecorder()
+    config.pluginmanager.register(recorder, "duration_recorder")
+    config.stash[duration_recorder_key] = recorder
+
+
+def pytest_collection_modifyitems(session, config, items):
+    """Send the heaviest tests to xdist workers first."""
+    if is_xdist_worker(config):
+        items[:] = order_by_weight(items, load_durations())
+
+
+def pytest_sessionfinish(session, exitstatus):
+    """
+    Hand the statistics of an xdist worker to the controller. On the
+    controller (or without workers) merge worker results, check the SLA and
+    budgets, and persist test durations and wait statistics.
+    """
+    config = session.config
+    if is_xdist_worker(config):
+        pool = config.stash.get(driver_pool_key, None)
+        if pool is not None:
+            config.workeroutput["driver_pool_stats"] = asdict(pool.stats)
+        browser = config.stash.get(tab_browser_key, None)
+        if browser is not None:
+            config.workeroutput["browser_tab_stats"] = asdict(browser.stats)
+        config.workeroutput["wait_latency_samples"] = latency_tracker.samples
+        config.workeroutput["wait_timeouts"] = latency_tracker.timeouts
+        config.workeroutput["network_stats"] = asdict(network_stats)
+        config.workeroutput["resource_sizes"] = resource_sizes.learned
+        config.workeroutput["api_connection_metrics"] = connection_metrics.counts()
+        config.workeroutput["api_metrics"] = api_metrics.to_dict()
+        config.workeroutput["api_retry_stats"] = retry_stats.counts()
+        config.workeroutput["page_timing"] = page_timing.samples
+        config.workeroutput["locator_timings"] = tracer.locator_timings()
+        config.workeroutput["command_log"] = command_log.export()
+        return
+    latency_tracker.save()
+    resource_sizes.save()
+    if config.option.collectonly:
+        return
+
+    alluredir = getattr(config.option, "allure_report_dir", None)
+    if alluredir:
+        merge_worker_results(alluredir)
+    check_api_sla(session)
+    check_page_budgets(session)
+    if alluredir and tracer.locators:
+        tracer.write_allure_result(alluredir)
+    if settings.COMMAND_LOG_FILE and command_log.session.total:
+        command_log.save(Path(settings.COMMAND_LOG_FILE))
+
+    recorder = config.stash.get(duration_recorder_key, None)
+    if recorder is not None and recorder.durations:
+        save_durations(recorder.durations)
+
+
+def check_api_sla(session):
+    """Check the API latency SLA, export the histograms and report them to Allure."""
+    config = session.config
+    if not api_metrics.histograms:
+        return
+    rules = config.stash.get(sla_rules_key, [])
+    violations = api_metrics.check(rules)
+    config.stash[sla_violations_key] = violations
+    if violations and session.exitstatus == pytest.ExitCode.OK:
+        session.exitstatus = pytest.ExitCode.TESTS_FAILED
+
+    if settings.API_METRICS_JSON:
+        Path(settings.API_METRICS_JSON).write_text(api_metrics.export_json())
+    if settings.API_METRICS_PROMETHEUS:
+        Path(settings.API_METRICS_PROMETHEUS).write_text(
+            api_metrics.export_prometheus()
+        )
+    alluredir = getattr(config.option, "allure_report_dir", None)
+    if alluredir:
+        api_metrics.write_allure_result(alluredir, rules, violations)
+
+
+def check_page_budgets(session):
+    """Check the browser timing budgets and append the run to the trend file."""
+    config = session.config
+    if not page_timing.samples:
+        return
+    violations = page_timing.check(config.stash.get(page_budgets_key, []))
+    config.stash[budget_violations_key] = violations
+    if violations and session.exitstatus == pytest.ExitCode.OK:
+        session.exitstatus = pytest.ExitCode.TESTS_FAILED
+    page_timing.save()
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    """Merge the API and UI statistics collected by an xdist worker."""
+    workeroutput = getattr(node, "workeroutput", {})
+    config = node.config
+    counts = workeroutput.get("api_connection_metrics")
+    if counts:
+        connection_metrics.merge(counts)
+    retries = workeroutput.get("api_retry_stats")
+    if retries:
+        retry_stats.merge(retries)
+    latencies = workeroutput.get("api_metrics")
+    if latencies:
+        api_metrics.merge(latencies)
+    page_timing.merge(workeroutput.get("page_timing", {}))
+    tracer.merge(workeroutput.get("locator_timings", {}))
+    if "command_log" in workeroutput:
+        command_log.merge(workeroutput["command_log"])
+    latency_tracker.merge(
+        workeroutput.get("wait_latency_samples", {}), workeroutput.get("wait_timeouts")
+    )
+    resource_sizes.merge(workeroutput.get("resource_sizes", {}))
+    if "network_stats" in workeroutput:
+        network_stats.merge(TrafficStats(**workeroutput["network_stats"]))
+    if "driver_pool_stats" in workeroutput:
+        if worker_pool_stats_key not in config.stash:
+            config.stash[worker_pool_stats_key] = PoolStats()
+        config.stash[worker_pool_stats_key].merge(
+            PoolStats(**workeroutput["driver_pool_stats"])
+        )
+    if "browser_tab_stats" in workeroutput:
+        if worker_tab_stats_key not in config.stash:
+            config.stash[worker_tab_stats_key] = TabStats()
+        config.stash[worker_tab_stats_key].merge(
+            TabStats(**workeroutput["browser_tab_stats"])
+        )
+
+
+def report_failed_check(terminalreporter, check: str, violations: list[str]) -> None:
+    """
+    Report a session-level check that failed although every test may have
+    passed, as a FAILED section and in the counts of the final line.
+
+    Args:
+        terminalreporter: Terminal reporter of the session
+        check: Name of the check, e.g. "API SLA"
+        violations: Violated rules, nothing is reported if empty
+    """
+    if not violations:
+        return
+    terminalreporter.write_sep("=", f"FAILED: {check}", red=True, bold=True)
+    for violation in violations:
+        terminalreporter.write_line(f"FAILED {check}: {violation}", red=True)
+    # Unknown keys are counted in the final line, e.g. "1 failed API SLA"
+    terminalreporter.stats.setdefault(f"failed {check}", []).extend(violations)
+
+
+def pytest_terminal_summary(terminalreporter, exitstatus, config):
+    """
+    Show the API connections, retries and latencies, and the WebDriver pool,
+    browser tabs, network, waits, page timing, WebDriver commands and slow
+    locators of the UI tests.
+    """
+    if connection_metrics.requests:
+        terminalreporter.write_sep("-", "API connections")
+        terminalreporter.write_line(connection_metrics.summary())
+    if retry_stats.retried or retry_stats.rejected:
+        terminalreporter.write_sep("-", "API retries")
+        terminalreporter.write_line(retry_stats.summary())
+    if api_metrics.histograms:
+        terminalreporter.write_sep("-", "API latency (ms)")
+        terminalreporter.write_line(api_metrics.summary())
+    report_failed_check(
+        terminalreporter, "API SLA", config.stash.get(sla_violations_key, [])
+    )
+    pool = config.stash.get(driver_pool_key, None)
+    pool_stats = pool.stats if pool is not None else None
+    pool_stats = pool_stats or config.stash.get(worker_pool_stats_key, None)
+    if pool_stats is not None:
+        terminalreporter.write_sep("-", "WebDriver pool")
+        terminalreporter.write_line(pool_stats.summary())
+    browser = config.stash.get(tab_browser_key, None)
+    tab_stats = browser.stats if browser is not None else None
+    tab_stats = tab_stats or config.stash.get(worker_tab_stats_key, None)
+    if tab_stats is not None:
+        terminalreporter.write_sep("-", "Browser tabs")
+        terminalreporter.write_line(tab_stats.summary())
+    if network_stats.requests or network_stats.blocked:
+        terminalreporter.write_sep("-", "Network")
+        terminalreporter.write_line(network_stats.summary())
+    if latency_tracker.samples or latency_tracker.timeouts:
+        terminalreporter.write_sep("-", "Slowest waits")
+        terminalreporter.write_line(latency_tracker.summary())
+    if page_timing.samples:
+        terminalreporter.write_sep("-", "Page timing")
+        terminalreporter.write_line(page_timing.summary())
+    report_failed_check(
+        terminalreporter, "page budget", config.stash.get(budget_violations_key, [])
+    )
+    if command_log.session.total:
+        terminalreporter.write_sep("-", "WebDriver commands")
+        terminalreporter.write_line(command_log.session.summary())
+    if tracer.locators:
+        terminalreporter.write_sep("-", "Slowest locators")
+        terminalreporter.write_line(tracer.slow_locators())
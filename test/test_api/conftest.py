@@ -1 +1,65 @@
-from test.test_api.fixtures.api_client_fixtures import json_placeholder_client
+import allure
+import pytest
+
+from framework.api.attachments import attachment_recorder
+from framework.api.clients.resilience import RetryStats, retry_stats
+from framework.api.clients.response_cache import CacheStats
+from test.test_api.fixtures.api_client_fixtures import (
+    async_json_placeholder_client,
+    http_cache,
+    http_cache_key,
+    json_placeholder_client,
+    json_placeholder_session_client,
+    json_placeholder_stub,
+    json_placeholder_url,
+)
+
+failed_key = pytest.StashKey[bool]()
+cache_stats_key = pytest.StashKey[CacheStats]()
+retry_stats_key = pytest.StashKey[RetryStats]()
+
+
+def pytest_runtest_setup(item):
+    """Start every test with an empty attachment buffer."""
+    attachment_recorder.clear()
+    item.stash[retry_stats_key] = RetryStats(**retry_stats.counts())
+    cache = item.config.stash.get(http_cache_key, None)
+    if cache is not None:
+        item.stash[cache_stats_key] = CacheStats(**vars(cache.stats))
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    """Attach the buffered HTTP exchanges once the test outcome is known."""
+    report = (yield).get_result()
+    if report.failed:
+        item.stash[failed_key] = True
+    if report.when == "teardown":
+        attachment_recorder.flush(failed=item.stash.get(failed_key, False))
+        attach_cache_stats(item)
+        attach_retry_stats(item)
+
+
+def attach_cache_stats(item):
+    """Attach the response cache statistics of the test to the Allure report."""
+    cache = item.config.stash.get(http_cache_key, None)
+    if cache is None:
+        return
+    stats = cache.stats - item.stash.get(cache_stats_key, CacheStats())
+    if stats.lookups:
+        allure.attach(
+            stats.summary(),
+            name="HTTP cache",
+            attachment_type=allure.attachment_type.TEXT,
+        )
+
+
+def attach_retry_stats(item):
+    """Attach the retries made during the test to the Allure report."""
+    stats = retry_stats - item.stash.get(retry_stats_key, RetryStats())
+    if stats.retried or stats.rejected:
+        allure.attach(
+            stats.summary(),
+            name="HTTP retries",
+            attachment_type=allure.attachment_type.TEXT,
+        )
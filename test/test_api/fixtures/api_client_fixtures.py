@@ -1,15 +1,122 @@
 import pytest
+import pytest_asyncio
 
+from framework import config
+from framework.api.clients.async_json_placeholder_client import (
+    AsyncJsonPlaceholderClient,
+)
 from framework.api.clients.json_placeholder_client import JsonPlaceholderClient
+from framework.api.clients.response_cache import ResponseCache
+from framework.api.stubs.json_placeholder_stub import JsonPlaceholderStub
+from framework.api.stubs.server import StubServer
+
+
+@pytest.fixture(scope="session")
+def json_placeholder_stub():
+    """
+    Fixture that provides the in-process JSONPlaceholder stand-in.
+
+    API_STUB_FAULT_RATE makes it answer a share of the requests with a 5xx.
+
+    Returns:
+        JsonPlaceholderStub: Stub serving deterministic fake data
+    """
+    return JsonPlaceholderStub(fault_rate=config.API_STUB_FAULT_RATE)
+
+
+@pytest.fixture(scope="session")
+def json_placeholder_url(request):
+    """
+    Fixture that provides the URL of a JSONPlaceholder service reachable over
+    the network, for tests that need a real server such as load tests.
+
+    The bundled stand-in is served on a local port unless API_TARGET is "live".
+
+    Returns:
+        str: Base URL of the service
+    """
+    if config.API_TARGET != "stub":
+        yield config.JSON_PLACEHOLDER_URL
+        return
+    with StubServer(request.getfixturevalue("json_placeholder_stub")) as server:
+        yield server.url
+
+
+http_cache_key = pytest.StashKey[ResponseCache]()
+
+
+@pytest.fixture(scope="session")
+def http_cache(request):
+    """
+    Fixture that provides the response cache shared by the API clients.
+
+    Tests can use it to invalidate entries, e.g. http_cache.invalidate("/posts").
+
+    Returns:
+        ResponseCache | None: Session cache, or None if API_CACHE is disabled
+    """
+    if not config.API_CACHE:
+        return None
+    cache = ResponseCache(
+        max_entries=config.API_CACHE_SIZE, directory=config.API_CACHE_DIR or None
+    )
+    request.config.stash[http_cache_key] = cache
+    return cache
+
+
+@pytest.fixture(scope="session")
+def json_placeholder_session_client(request):
+    """
+    Fixture that provides a JsonPlaceholderClient shared by the whole session,
+    so its open connections are reused across tests.
+
+    The client talks to the bundled stand-in unless API_TARGET is "live".
+
+    Returns:
+        JsonPlaceholderClient: Initialized API client for JSONPlaceholder service
+    """
+    kwargs = {}
+    if config.API_TARGET == "stub":
+        kwargs["transport"] = request.getfixturevalue(
+            "json_placeholder_stub"
+        ).transport()
+
+    with JsonPlaceholderClient(**kwargs) as client:
+        yield client
 
 
 @pytest.fixture
-def json_placeholder_client():
+def json_placeholder_client(request, json_placeholder_session_client, http_cache):
     """
-    Fixture that provides a JsonPlaceholderClient instance.
+    Fixture that provides the session JsonPlaceholderClient to a test.
+
+    The client uses the response cache unless the test is marked with
+    no_http_cache.
 
     Returns:
         JsonPlaceholderClient: Initialized API client for JSONPlaceholder service
     """
-    with JsonPlaceholderClient() as client:
+    bypass_cache = request.node.get_closest_marker("no_http_cache") is not None
+    json_placeholder_session_client.cache = None if bypass_cache else http_cache
+    yield json_placeholder_session_client
+    json_placeholder_session_client.cache = None
+
+
+@pytest_asyncio.fixture
+async def async_json_placeholder_client(request):
+    """
+    Fixture that provides an AsyncJsonPlaceholderClient instance.
+
+    The client talks to the bundled stand-in unless API_TARGET is "live".
+
+    Returns:
+        AsyncJsonPlaceholderClient: Initialized async API client for JSONPlaceholder service
+    """
+    kwargs = {}
+    if config.API_TARGET == "stub":
+        kwargs["transport"] = request.getfixturevalue(
+            "json_placeholder_stub"
+        ).transport()
+
+    async with AsyncJsonPlaceholderClient(**kwargs) as client:
         yield client
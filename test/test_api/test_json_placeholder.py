@@ -2,11 +2,29 @@ import random
 from http import HTTPStatus
 
 import allure
+import httpx
 import pytest
 import pytest_check as check
 from pydantic import ValidationError
 
+from framework.api.attachments import AttachmentRecorder
+from framework.api.clients.json_placeholder_client import JsonPlaceholderClient
+from framework.api.clients.response_cache import (
+    CACHE_EXTENSION,
+    HIT,
+    MISS,
+    REVALIDATED,
+    ResponseCache,
+)
+from framework.api.clients.resilience import (
+    CircuitBreaker,
+    CircuitOpenError,
+    RetryPolicy,
+    RetryStats,
+    retry_stats,
+)
 from framework.api.models.post import Post
+from framework.api.stubs.json_placeholder_stub import JsonPlaceholderStub
 
 
 @pytest.mark.api
@@ -22,47 +40,32 @@ class TestJsonPlaceholder:
         This test verifies that the API correctly returns a post when requested by ID:
         1. Sends a GET request to retrieve a post by ID
         2. Verifies the status code is 200 OK
-        3. Validates that the response contains the 'title' field as a string
-        4. Validates the complete response schema using Pydantic model
+        3. Validates the response body against the Pydantic model straight from the raw JSON
         """
     )
     def test_get_post_json_placeholder_api(self, json_placeholder_client):
         post_id = random.randint(1, 50)
 
-        with allure.step(f"Get post with ID {post_id}"):
-            response = json_placeholder_client.get_post(post_id)
-
-        with allure.step("Verify the response status code is 200"):
-            check.equal(response.status_code, HTTPStatus.OK)
-
-        with allure.step("Get response body"):
-            try:
-                data = response.json()
-            except Exception as e:
-                allure.attach(
-                    f"Failed to parse response as JSON: {str(e)}\nResponse text: {response.text}",
-                    name="JSON Parsing Error",
-                    attachment_type=allure.attachment_type.TEXT,
-                )
-                pytest.fail(f"Failed to parse response as JSON: {e}")
-
-        with allure.step("Validate response schema using Pydantic model"):
+        with allure.step(f"Get post with ID {post_id} and validate its schema"):
             try:
-                post = Post.model_validate(data)
-
-                allure.attach(
-                    post.model_dump_json(indent=2),
-                    name="Validated Post Object",
-                    attachment_type=allure.attachment_type.JSON,
-                )
+                post = json_placeholder_client.get_post_model(post_id)
+            except httpx.HTTPStatusError as e:
+                pytest.fail(f"Expected status code 200, got {e.response.status_code}")
             except ValidationError as e:
                 allure.attach(
-                    f"Validation Error: {str(e)}\n\nData: {data}",
+                    f"Validation Error: {str(e)}",
                     name="Schema Validation Error",
                     attachment_type=allure.attachment_type.TEXT,
                 )
                 pytest.fail(f"Response data failed schema validation: {e}")
 
+        allure.attach(
+            post.model_dump_json(indent=2),
+            name="Validated Post Object",
+            attachment_type=allure.attachment_type.JSON,
+        )
+        check.equal(post.id, post_id)
+
     @allure.story("Error handling")
     @allure.title("Verify 404 response when requesting a non-existent post")
     @allure.description(
@@ -94,3 +97,283 @@ class TestJsonPlaceholder:
                 pytest.fail(f"Failed to parse response as JSON: {e}")
 
         check.equal(data, {}, f"Expected empty JSON object, got {data}")
+
+    @allure.story("Bulk post retrieval")
+    @allure.title("Verify concurrent retrieval of many posts")
+    @allure.description(
+        """
+        This test verifies that many posts can be retrieved concurrently:
+        1. Sends GET requests for a range of post IDs with a bounded number in flight
+        2. Verifies every status code is 200 OK
+        3. Validates every response body using Pydantic model
+        4. Verifies each post has the requested ID
+        """
+    )
+    @pytest.mark.asyncio
+    async def test_get_posts_concurrently_json_placeholder_api(
+        self, async_json_placeholder_client
+    ):
+        post_ids = range(1, 51)
+
+        with allure.step(f"Get posts {post_ids.start}..{post_ids.stop - 1}"):
+            responses = await async_json_placeholder_client.get_posts(
+                post_ids, max_concurrency=10
+            )
+
+        with allure.step("Verify responses"):
+            for post_id, response in zip(post_ids, responses):
+                check.equal(response.status_code, HTTPStatus.OK)
+                try:
+                    post = Post.model_validate(response.json())
+                except ValidationError as e:
+                    check.fail(f"Post {post_id} failed schema validation: {e}")
+                    continue
+                check.equal(post.id, post_id)
+
+    @allure.story("Collection retrieval")
+    @allure.title("Verify retrieval of the posts of a user")
+    @allure.description(
+        """
+        This test verifies that the API returns all posts of a user:
+        1. Streams the posts filtered by user ID
+        2. Validates every post using Pydantic model as it arrives
+        3. Verifies every post belongs to the requested user
+        """
+    )
+    def test_list_posts_by_user_json_placeholder_api(self, json_placeholder_client):
+        user_id = random.randint(1, 10)
+
+        with allure.step(f"List posts of user {user_id}"):
+            result = json_placeholder_client.list_posts_by_user(user_id)
+
+        with allure.step("Verify every post is valid and belongs to the user"):
+            for error in result.errors:
+                check.fail(f"Post #{error.index} failed schema validation: {error.error}")
+            check.is_true(result.items, "Expected at least one post")
+            for post in result.items:
+                check.equal(post.user_id, user_id)
+
+    @allure.story("Collection retrieval")
+    @allure.title("Verify retrieval of comments, users and todos")
+    @allure.description(
+        """
+        This test verifies that every collection endpoint returns valid items:
+        1. Streams the comments, users and todos collections
+        2. Validates every item using the matching Pydantic model
+        3. Verifies no item failed validation
+        """
+    )
+    @pytest.mark.parametrize("method", ["list_comments", "list_users", "list_todos"])
+    def test_list_collection_json_placeholder_api(self, json_placeholder_client, method):
+        with allure.step(f"Call {method}"):
+            result = getattr(json_placeholder_client, method)()
+
+        with allure.step("Verify every item is valid"):
+            check.is_true(result.items, "Expected at least one item")
+            check.equal(
+                result.errors, [], f"{len(result.errors)} items failed schema validation"
+            )
+
+    @allure.story("Caching")
+    @allure.title("Verify conditional retrieval of an unchanged post")
+    @allure.description(
+        """
+        This test verifies that the API supports revalidation of cached posts:
+        1. Sends a GET request to retrieve a post by ID
+        2. Verifies the response carries an ETag validator
+        3. Sends the request again with the ETag in If-None-Match
+        4. Verifies the status code is 304 Not Modified
+        """
+    )
+    @pytest.mark.no_http_cache
+    def test_get_post_not_modified_json_placeholder_api(self, json_placeholder_client):
+        post_id = random.randint(1, 50)
+
+        with allure.step(f"Get post with ID {post_id}"):
+            response = json_placeholder_client.get_post(post_id)
+            check.equal(response.status_code, HTTPStatus.OK)
+
+        etag = response.headers.get("ETag")
+        if not etag:
+            pytest.fail("Expected an ETag header in the response")
+
+        with allure.step(f"Get post with ID {post_id} again with If-None-Match: {etag}"):
+            response = json_placeholder_client.get(
+                f"/posts/{post_id}", headers={"If-None-Match": etag}
+            )
+
+        with allure.step("Verify the response status code is 304"):
+            check.equal(response.status_code, HTTPStatus.NOT_MODIFIED)
+
+    @allure.story("Caching")
+    @allure.title("Verify the response cache serves, revalidates and misses")
+    @allure.description(
+        """
+        This test verifies the response cache of the client against a local stand-in:
+        1. Gets a post twice and verifies the second response is a cache hit
+        2. Lets the entry go stale and verifies the next response is revalidated with 304
+        3. Gets the post with another Accept header and verifies it is a miss
+        4. Verifies the cache statistics count one hit, one revalidation and two misses
+        """
+    )
+    def test_response_cache_json_placeholder_api(self):
+        stub = JsonPlaceholderStub()
+        cache = ResponseCache()
+        post_id = random.randint(1, 50)
+
+        with JsonPlaceholderClient(transport=stub.transport(), cache=cache) as client:
+            with allure.step(f"Get post with ID {post_id} twice"):
+                first = client.get_post(post_id)
+                second = client.get_post(post_id)
+                check.equal(first.extensions[CACHE_EXTENSION], MISS)
+                check.equal(second.extensions[CACHE_EXTENSION], HIT)
+                check.equal(second.json(), first.json())
+
+            with allure.step("Get the post again once the entry is stale"):
+                for entry in cache.entries.values():
+                    entry.max_age = 0
+                response = client.get_post(post_id)
+                check.equal(response.status_code, HTTPStatus.OK)
+                check.equal(response.extensions[CACHE_EXTENSION], REVALIDATED)
+
+            with allure.step("Get the post with another Accept header"):
+                response = client.get(
+                    f"/posts/{post_id}", headers={"Accept": "application/json"}
+                )
+                check.equal(response.extensions[CACHE_EXTENSION], MISS)
+
+        with allure.step("Verify the cache statistics"):
+            check.equal(cache.stats.hits, 1)
+            check.equal(cache.stats.revalidated, 1)
+            check.equal(cache.stats.misses, 2)
+            check.equal(len(cache.entries), 2)
+
+    @allure.story("Resilience")
+    @allure.title("Verify transient errors are retried")
+    @allure.description(
+        """
+        This test verifies that the client recovers from transient failures:
+        1. Makes a local stand-in answer with 503 and then time out
+        2. Sends a GET request to retrieve a post by ID
+        3. Verifies the post is returned after two retries
+        """
+    )
+    def test_get_post_retries_transient_errors_json_placeholder_api(self):
+        stub = JsonPlaceholderStub()
+        post_id = random.randint(1, 50)
+        policy = RetryPolicy(max_retries=2, backoff=0.01)
+        before = RetryStats(**retry_stats.counts())
+
+        with JsonPlaceholderClient(
+            transport=stub.transport(), retry_policy=policy
+        ) as client:
+            stub.inject_faults(
+                HTTPStatus.SERVICE_UNAVAILABLE, httpx.ReadTimeout
+            )
+            with allure.step(f"Get post with ID {post_id} through injected faults"):
+                post = client.get_post_model(post_id)
+
+        with allure.step("Verify the post was returned after two retries"):
+            stats = retry_stats - before
+            check.equal(post.id, post_id)
+            check.equal(stats.retries, 2)
+            check.equal(stats.recovered, 1)
+
+    @allure.story("Resilience")
+    @allure.title("Verify requests fail fast once the service is down")
+    @allure.description(
+        """
+        This test verifies that the circuit breaker stops calling a failing service:
+        1. Makes a local stand-in answer with 503 until the circuit opens
+        2. Verifies the failing request returns 503 after its retry
+        3. Verifies the next request fails fast without reaching the stand-in
+        """
+    )
+    def test_circuit_breaker_fails_fast_json_placeholder_api(self):
+        stub = JsonPlaceholderStub()
+        policy = RetryPolicy(max_retries=1, backoff=0.01)
+        breaker = CircuitBreaker(failure_threshold=2, reset_timeout=60)
+
+        with JsonPlaceholderClient(
+            transport=stub.transport(),
+            retry_policy=policy,
+            circuit_breaker=breaker,
+        ) as client:
+            stub.inject_faults(
+                HTTPStatus.SERVICE_UNAVAILABLE, HTTPStatus.SERVICE_UNAVAILABLE
+            )
+            with allure.step("Get a post while the stand-in is failing"):
+                response = client.get_post(1)
+                check.equal(response.status_code, HTTPStatus.SERVICE_UNAVAILABLE)
+
+            with allure.step("Verify the next request is rejected by the open circuit"):
+                with pytest.raises(CircuitOpenError):
+                    client.get_post(2)
+
+    @allure.story("Resilience")
+    @allure.title("Verify an interrupted trial request does not keep the circuit open")
+    @allure.description(
+        """
+        This test verifies that a half-open circuit recovers after its trial request
+        failed with an error that says nothing about the service:
+        1. Makes a local stand-in answer with 503 until the circuit opens
+        2. Lets the trial request fail with a non-transport error
+        3. Verifies the next request is let through and closes the circuit
+        """
+    )
+    def test_circuit_breaker_abandoned_trial_json_placeholder_api(self):
+        stub = JsonPlaceholderStub()
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0)
+
+        with JsonPlaceholderClient(
+            transport=stub.transport(), retry_policy=None, circuit_breaker=breaker
+        ) as client:
+            stub.inject_faults(HTTPStatus.SERVICE_UNAVAILABLE, httpx.TooManyRedirects)
+            with allure.step("Open the circuit and fail its trial request"):
+                client.get_post(1)
+                with pytest.raises(httpx.TooManyRedirects):
+                    client.get_post(1)
+
+            with allure.step("Verify the next request is the trial and closes the circuit"):
+                response = client.get_post(2)
+                check.equal(response.status_code, HTTPStatus.OK)
+                check.is_false(breaker.is_open(response.request.url.netloc.decode()))
+
+    @allure.story("Attachments")
+    @allure.title("Verify response bodies are attached with a matching type: {method}")
+    @allure.description(
+        """
+        This test verifies the body attachment built for a response:
+        1. Calls the stand-in, once with a read body and once with a streamed one
+        2. Builds the body attachment of the response
+        3. Verifies a read JSON body goes out as JSON and the placeholder of a
+           streamed body as text
+        """
+    )
+    @pytest.mark.parametrize(
+        "method, args, expected_name, expected_type",
+        [
+            ("get_post", (1,), "Response Body (JSON)", allure.attachment_type.JSON),
+            ("list_posts", (), "Response Body (Text)", allure.attachment_type.TEXT),
+        ],
+    )
+    def test_body_attachment_json_placeholder_api(
+        self, method, args, expected_name, expected_type
+    ):
+        stub = JsonPlaceholderStub()
+        responses = []
+
+        with JsonPlaceholderClient(
+            transport=stub.transport(), event_hooks={"response": [responses.append]}
+        ) as client:
+            with allure.step(f"Call {method} on the stand-in"):
+                getattr(client, method)(*args)
+
+        with allure.step("Verify the name and type of the body attachment"):
+            body, name, attachment_type = AttachmentRecorder().body_attachment(
+                responses[-1]
+            )
+            check.equal(name, expected_name)
+            check.equal(attachment_type, expected_type)
+            if attachment_type == allure.attachment_type.TEXT:
+                check.equal(body, "<streamed body, not kept>")
@@ -0,0 +1,50 @@
+import allure
+import pytest
+import pytest_check as check
+
+from framework import config
+from framework.api.load import run_load
+
+
+@pytest.mark.load
+@allure.parent_suite("API Tests")
+@allure.suite("JSONPlaceholder API")
+@allure.feature("Load")
+class TestJsonPlaceholderLoad:
+
+    @allure.story("Post retrieval under load")
+    @allure.title("Verify posts are served correctly under sustained load")
+    @allure.description(
+        """
+        This test verifies that the API keeps serving valid posts under load:
+        1. Retrieves random posts with concurrent users for LOAD_DURATION seconds
+        2. Validates every response using Pydantic model as it arrives
+        3. Verifies no request failed and no response failed validation
+        """
+    )
+    @pytest.mark.asyncio
+    async def test_get_post_under_load_json_placeholder_api(self, json_placeholder_url):
+        with allure.step(
+            f"Generate load for {config.LOAD_DURATION}s "
+            f"with {config.LOAD_CONCURRENCY} concurrent users"
+        ):
+            report = await run_load(
+                json_placeholder_url,
+                duration=config.LOAD_DURATION,
+                concurrency=config.LOAD_CONCURRENCY,
+                rate=config.LOAD_RATE,
+            )
+            allure.attach(
+                report.summary(),
+                name="Load Report",
+                attachment_type=allure.attachment_type.TEXT,
+            )
+
+        with allure.step("Verify no errors and no validation failures"):
+            check.greater(report.requests, 0, "Expected at least one request")
+            check.equal(report.errors, 0, f"{report.errors} requests failed")
+            check.equal(
+                report.validation_failures,
+                0,
+                f"{report.validation_failures} responses failed schema validation",
+            )
@@ -0,0 +1,44 @@
+import allure
+import pytest
+
+from framework.api.metrics import SlaRule
+
+
+@pytest.mark.api
+@allure.parent_suite("API Tests")
+@allure.suite("Latency SLA")
+@allure.feature("SLA rules")
+class TestSlaRule:
+
+    @allure.story("Rule parsing")
+    @allure.title("Verify a valid SLA rule is parsed: {line}")
+    @pytest.mark.parametrize(
+        "line, expected",
+        [
+            ("GET /posts/{id} p95 < 200ms", SlaRule("GET /posts/{id}", 95, 0.2)),
+            ("GET /comments p99 <= 1s", SlaRule("GET /comments", 99, 1.0, True)),
+            ("  POST /posts p50<12.5ms  ", SlaRule("POST /posts", 50, 0.0125)),
+            ("GET /users p99.9 < 2s", SlaRule("GET /users", 99.9, 2.0)),
+        ],
+    )
+    def test_parse_valid_sla_rule(self, line, expected):
+        assert SlaRule.parse(line) == expected
+
+    @allure.story("Rule parsing")
+    @allure.title("Verify an invalid SLA rule is rejected: {line}")
+    @pytest.mark.parametrize(
+        "line",
+        [
+            "",
+            "/posts p95 < 200ms",
+            "get /posts p95 < 200ms",
+            "GET /posts 95 < 200ms",
+            "GET /posts p95 > 200ms",
+            "GET /posts p95 < 200",
+            "GET /posts p95 < 200min",
+            "GET /posts p95 < -1ms",
+        ],
+    )
+    def test_parse_invalid_sla_rule(self, line):
+        with pytest.raises(ValueError, match="Invalid SLA rule"):
+            SlaRule.parse(line)
@@ -1,4 +1,9 @@
-from test.test_ui.fixtures.driver_fixtures import driver
+import pytest
+
+from framework import config
+from framework.ui.drivers.commands import command_log
+from test.test_ui.fixtures.driver_fixtures import driver, driver_pool, tab_browser
+from test.test_ui.fixtures.site_fixtures import saucedemo_url
 from test.test_ui.fixtures.login_fixtures import logged_in_user
 from test.test_ui.fixtures.shopping_fixtures import product_in_cart
 from test.test_ui.fixtures.faker_fixtures import fake_data
@@ -11,3 +16,21 @@ from test.test_ui.fixtures.page_fixtures import (
     checkout_step_two_page,
     checkout_complete_page,
 )
+
+
+@pytest.hookimpl(wrapper=True)
+def pytest_runtest_call(item):
+    """
+    Fail a test that sent more WebDriver commands than its command_budget
+    marker or the COMMAND_BUDGET setting allow, as a failure of the test
+    itself rather than an error in its teardown.
+    """
+    result = yield
+    commands = command_log.current
+    marker = item.get_closest_marker("command_budget")
+    budget = marker.args[0] if marker else config.COMMAND_BUDGET
+    if commands is not None and budget and commands.total > budget:
+        pytest.fail(
+            f"Test sent {commands.total} WebDriver commands, budget is {budget}"
+        )
+    return result
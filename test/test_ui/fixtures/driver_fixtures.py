@@ -1,40 +1,144 @@
 import pytest
 import allure
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
+
+from framework import config
+from framework.ui.drivers.chrome import (
+    configure_window,
+    create_chrome_driver,
+    profile_template,
+)
+from framework.ui.drivers.commands import command_log
+from framework.ui.drivers.driver_pool import DriverPool
+from framework.ui.drivers.network import network_stats, read_traffic
+from framework.ui.drivers.tabs import TabBrowser
+from framework.ui.tracing import tracer
+
+driver_pool_key = pytest.StashKey[DriverPool]()
+tab_browser_key = pytest.StashKey[TabBrowser]()
+
+
+@pytest.fixture(scope="session")
+def driver_pool(request):
+    """
+    Fixture that provides a pool of warm Chrome browsers for the session.
+
+    Returns:
+        DriverPool: Pool shared by all tests of the session (or xdist worker)
+    """
+    pool = DriverPool(
+        factory=create_chrome_driver,
+        max_idle=config.DRIVER_POOL_SIZE,
+        reuse=config.DRIVER_POOL_ENABLED,
+    )
+    request.config.stash[driver_pool_key] = pool
+
+    yield pool
+
+    pool.close()
+    profile_template.cleanup()
+
+
+@pytest.fixture(scope="session")
+def tab_browser(request):
+    """
+    Fixture that provides one Chrome browser whose tabs are handed to tests.
+
+    Returns:
+        TabBrowser: Browser shared by all tests of the session (or xdist worker)
+    """
+    browser = TabBrowser(factory=create_chrome_driver, setup_tab=configure_window)
+    request.config.stash[tab_browser_key] = browser
+
+    yield browser
+
+    browser.close()
+    profile_template.cleanup()
 
 
 @pytest.fixture
-def driver():
+def driver(request):
     """
     Fixture that provides a Chrome WebDriver instance.
 
+    With BROWSER_TABS the test gets a tab of the shared browser instead of a
+    browser from the pool, and the pool is never created.
+
+    Counts the WebDriver commands of the test for the command budget.
+
     Returns:
         WebDriver: Chrome browser instance
     """
-    with allure.step("Configure Chrome WebDriver"):
-        chrome_options = Options()
-        chrome_options.add_argument("--start-maximized")
-        chrome_options.add_argument("--headless")
-        chrome_options.add_experimental_option(
-            "prefs",
-            {
-                "profile.password_manager_leak_detection": False,
-                "profile.password_manager_enabled": False,
-            },
-        )
-        chrome_options.add_argument("--no-sandbox")
-        chrome_options.add_argument("--disable-dev-shm-usage")
-
-    with allure.step("Initialize Chrome WebDriver"):
-        driver = webdriver.Chrome(options=chrome_options)
+    with allure.step("Acquire Chrome WebDriver"):
+        tabs = tab = pool = None
+        if config.BROWSER_TABS:
+            tabs = request.getfixturevalue("tab_browser")
+            tab = tabs.open_tab()
+            driver = tabs.driver
+            message = (
+                "Tab opened in its own browser context of the shared Chrome"
+                if tab.context_id
+                else "Tab opened in the shared Chrome"
+            )
+        else:
+            pool = request.getfixturevalue("driver_pool")
+            misses_before = pool.stats.misses
+            driver = pool.acquire()
+            message = (
+                "Chrome WebDriver launched"
+                if pool.stats.misses > misses_before
+                else "Chrome WebDriver reused from pool"
+            )
         allure.attach(
-            "Chrome WebDriver initialized",
+            message,
             name="Browser",
             attachment_type=allure.attachment_type.TEXT,
         )
+        if config.NETWORK_STATS:
+            # Drop the traffic of earlier tests and resets
+            read_traffic(driver)
+
+    if tracer.enabled:
+        tracer.start_test()
+    command_log.start_test(request.node.nodeid)
 
     yield driver
 
-    with allure.step("Close browser"):
-        driver.quit()
+    commands = command_log.finish_test()
+    allure.attach(
+        commands.summary(),
+        name="WebDriver commands",
+        attachment_type=allure.attachment_type.TEXT,
+    )
+
+    if tracer.enabled:
+        allure.attach(
+            tracer.breakdown(tracer.finish_test()),
+            name="Action timing",
+            attachment_type=allure.attachment_type.TEXT,
+        )
+        allure.attach(
+            "\n".join(tracer.root.folded()),
+            name="Action timing (folded stacks)",
+            attachment_type=allure.attachment_type.TEXT,
+        )
+
+    if config.NETWORK_STATS:
+        traffic = read_traffic(driver)
+        network_stats.merge(traffic)
+        allure.attach(
+            traffic.summary(),
+            name="Network",
+            attachment_type=allure.attachment_type.TEXT,
+        )
+
+    with allure.step("Release browser"):
+        if tab is not None:
+            reset_time = tabs.close_tab(tab)
+        else:
+            reset_time = pool.release(driver)
+        if reset_time is not None:
+            allure.attach(
+                f"Reset time: {reset_time * 1000:.1f}ms",
+                name="Browser Reset",
+                attachment_type=allure.attachment_type.TEXT,
+            )
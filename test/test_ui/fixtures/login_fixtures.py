@@ -1,44 +1,102 @@
 import pytest
 import allure
 from typing import Tuple
+from urllib.parse import urljoin
 
+from framework import config
 from framework.ui.pages.login_page import LoginPage
 from framework.ui.pages.inventory_page import InventoryPage
+from framework.ui.session_state import SessionState
+
+login_session_key = pytest.StashKey[Tuple[SessionState, str]]()
+
+
+def _restore_login_session(driver, request, inventory_url: str) -> str | None:
+    """
+    Log in by injecting the session captured by an earlier form login.
+
+    Returns:
+        str | None: Username of the restored session, or None if there is no
+        usable session or the site rejected it
+    """
+    session = request.config.stash.get(login_session_key, None)
+    if session is None:
+        return None
+    state, username = session
+    if state.is_expired():
+        return None
+
+    with allure.step("Restore captured login session"):
+        state.inject(driver, inventory_url)
+        current_url = driver.current_url
+        if current_url != inventory_url:
+            allure.attach(
+                f"Session rejected, redirected to {current_url}",
+                name="Fast Login",
+                attachment_type=allure.attachment_type.TEXT,
+            )
+            del request.config.stash[login_session_key]
+            return None
+    return username
 
 
 @pytest.fixture
-def logged_in_user(driver) -> Tuple[InventoryPage, str]:
+def logged_in_user(driver, request, saucedemo_url) -> Tuple[InventoryPage, str]:
     """
     Fixture for user login process
 
+    With FAST_LOGIN enabled the login form is used once per session; later
+    tests reuse the captured session cookies and storage and fall back to the
+    form if the site rejects them.
+
+    Args:
+        driver: WebDriver instance from driver fixture
+        request: Pytest request, its config stash keeps the captured session
+        saucedemo_url: Base URL from saucedemo_url fixture
+
     Returns:
         Tuple[InventoryPage, str]: Inventory page instance and username
     """
-    with allure.step("Initialize login page"):
-        login_page = LoginPage(driver=driver, url="https://www.saucedemo.com/")
-        login_page.open()
-
-    with allure.step("Get credentials"):
-        username, password = login_page.get_credentials()
-        allure.attach(
-            username, name="Username", attachment_type=allure.attachment_type.TEXT
-        )
-
-    with allure.step("Login with credentials"):
-        login_page.input_username(username=username)
-        login_page.input_password(password=password)
-        login_page.click_login_button()
-
-    with allure.step("Verify successful login"):
-        current_url = login_page.get_current_url()
-        allure.attach(
-            current_url,
-            name="Redirect URL",
-            attachment_type=allure.attachment_type.TEXT,
-        )
-        assert (
-            current_url == "https://www.saucedemo.com/inventory.html"
-        ), f"Login failed. URL: {current_url}"
+    base_url = saucedemo_url
+    inventory_url = urljoin(base_url, "inventory.html")
+
+    username = (
+        _restore_login_session(driver, request, inventory_url)
+        if config.FAST_LOGIN
+        else None
+    )
+
+    if username is None:
+        with allure.step("Initialize login page"):
+            login_page = LoginPage(driver=driver, url=base_url)
+            login_page.open()
+
+        with allure.step("Get credentials"):
+            username, password = login_page.get_credentials()
+            allure.attach(
+                username, name="Username", attachment_type=allure.attachment_type.TEXT
+            )
+
+        with allure.step("Login with credentials"):
+            login_page.input_username(username=username)
+            login_page.input_password(password=password)
+            login_page.click_login_button()
+
+        with allure.step("Verify successful login"):
+            current_url = login_page.get_current_url()
+            allure.attach(
+                current_url,
+                name="Redirect URL",
+                attachment_type=allure.attachment_type.TEXT,
+            )
+            assert current_url == inventory_url, f"Login failed. URL: {current_url}"
+
+        if config.FAST_LOGIN:
+            with allure.step("Capture login session"):
+                request.config.stash[login_session_key] = (
+                    SessionState.capture(driver),
+                    username,
+                )
 
     with allure.step("Initialize inventory page"):
         inventory_page = InventoryPage(driver=driver)
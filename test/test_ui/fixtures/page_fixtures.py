@@ -10,18 +10,19 @@ from framework.ui.pages.login_page import LoginPage
 
 
 @pytest.fixture
-def login_page(driver) -> LoginPage:
+def login_page(driver, saucedemo_url) -> LoginPage:
     """
     Fixture that provides a LoginPage instance.
 
     Args:
         driver: WebDriver instance from driver fixture
+        saucedemo_url: Base URL from saucedemo_url fixture
 
     Returns:
         LoginPage: Initialized login page with opened URL
     """
     with allure.step("Initialize login page"):
-        page = LoginPage(driver=driver, url="https://www.saucedemo.com/")
+        page = LoginPage(driver=driver, url=saucedemo_url)
         page.open()
     return page
 
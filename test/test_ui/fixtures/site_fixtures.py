@@ -0,0 +1,29 @@
+import pytest
+import allure
+
+from framework import config
+from framework.ui.stubs.server import SiteServer
+
+
+@pytest.fixture(scope="session")
+def saucedemo_url():
+    """
+    Fixture that provides the base URL of the site under test.
+
+    Uses SAUCEDEMO_URL when it is set, otherwise serves the bundled saucedemo
+    replica locally for the session.
+
+    Returns:
+        str: Base URL ending with a slash
+    """
+    if config.SAUCEDEMO_URL:
+        yield config.SAUCEDEMO_URL.rstrip("/") + "/"
+        return
+
+    with allure.step("Start local saucedemo replica"):
+        server = SiteServer().start()
+
+    try:
+        yield server.url
+    finally:
+        server.stop()
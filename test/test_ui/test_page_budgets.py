@@ -0,0 +1,62 @@
+import allure
+import pytest
+
+from framework.ui.page_timing import BudgetRule
+
+
+@pytest.mark.ui
+@allure.parent_suite("UI Tests")
+@allure.suite("Page Timing")
+@allure.feature("Page budgets")
+class TestBudgetRule:
+
+    @allure.story("Rule parsing")
+    @allure.title("Verify a valid page budget is parsed: {line}")
+    @pytest.mark.parametrize(
+        "line, expected",
+        [
+            (
+                "InventoryPage load p95 < 1500ms",
+                BudgetRule("InventoryPage", "load", 95, 1500),
+            ),
+            ("CartPage ttfb p99 <= 2s", BudgetRule("CartPage", "ttfb", 99, 2000, True)),
+            (
+                "InventoryPage resource_bytes p95 < 200KB",
+                BudgetRule("InventoryPage", "resource_bytes", 95, 200 * 1024),
+            ),
+            (
+                "LoginPage transfer_bytes p50 < 512B",
+                BudgetRule("LoginPage", "transfer_bytes", 50, 512),
+            ),
+            (
+                "  LoginPage long_tasks p90<3  ",
+                BudgetRule("LoginPage", "long_tasks", 90, 3),
+            ),
+        ],
+    )
+    def test_parse_valid_page_budget(self, line, expected):
+        assert BudgetRule.parse(line) == expected
+
+    @allure.story("Rule parsing")
+    @allure.title("Verify an invalid page budget is rejected: {line}")
+    @pytest.mark.parametrize(
+        "line, message",
+        [
+            ("", "Invalid page budget"),
+            ("InventoryPage p95 < 1500ms", "Invalid page budget"),
+            ("InventoryPage load 95 < 1500ms", "Invalid page budget"),
+            ("InventoryPage load p95 >= 1500ms", "Invalid page budget"),
+            ("InventoryPage load p95 < 1500MB", "Invalid page budget"),
+            ("Inventory Page load p95 < 1500ms", "Invalid page budget"),
+            ("InventoryPage paint p95 < 1500ms", "Unknown page timing metric"),
+            ("InventoryPage load p95 < 2KB", "does not fit metric"),
+            ("InventoryPage ttfb p95 < 512B", "does not fit metric"),
+            ("InventoryPage transfer_bytes p95 < 2s", "does not fit metric"),
+            ("InventoryPage resource_bytes p95 < 100ms", "does not fit metric"),
+            ("LoginPage long_tasks p90 < 3s", "does not fit metric"),
+            ("LoginPage resources p90 < 30KB", "does not fit metric"),
+        ],
+    )
+    def test_parse_invalid_page_budget(self, line, message):
+        with pytest.raises(ValueError, match=message):
+            BudgetRule.parse(line)
@@ -50,9 +50,10 @@ class TestPurchaseFlow:
             checkout_step_one_page.click_continue_button()
 
         with allure.step("Verify price details on summary page"):
-            item_total_text = checkout_step_two_page.get_item_total_text()
-            tax_text = checkout_step_two_page.get_tax_text()
-            total_text = checkout_step_two_page.get_total_text()
+            summary = checkout_step_two_page.get_summary_texts()
+            item_total_text = summary["item_total"]
+            tax_text = summary["tax"]
+            total_text = summary["total"]
 
             item_total_decimal = extract_price_as_decimal(item_total_text)
             tax_decimal = extract_price_as_decimal(tax_text)
@@ -91,9 +92,10 @@ class TestPurchaseFlow:
             checkout_step_two_page.click_finish_button()
 
         with allure.step("Verify order completion"):
-            complete_title = checkout_complete_page.get_title_text()
-            complete_header = checkout_complete_page.get_complete_header_text()
-            complete_text = checkout_complete_page.get_complete_text()
+            confirmation = checkout_complete_page.get_confirmation_texts()
+            complete_title = confirmation["title"]
+            complete_header = confirmation["header"]
+            complete_text = confirmation["text"]
 
             allure.attach(
                 complete_title,